@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 from app.api.v1.endpoints import (
     tournaments, teams, players, matches, standings, auth, 
-    uploads, goals, cards, competitions, substitutions, news, audit_logs, users, notifications
+    uploads, goals, cards, competitions, substitutions, news, audit_logs, users, notifications,
+    diagnostics
 )
 
 api_router = APIRouter()
@@ -20,4 +21,4 @@ api_router.include_router(news.router, prefix="/news", tags=["news"])
 api_router.include_router(audit_logs.router, prefix="/audit-logs", tags=["audit-logs"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
-
+api_router.include_router(diagnostics.router, prefix="/diagnostics", tags=["diagnostics"])
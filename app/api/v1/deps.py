@@ -3,7 +3,8 @@ from typing import List, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel import Session, select
-from app.core.database import get_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_session, get_read_async_session
 from app.models.user import User, UserRole
 from app.core.security import decode_access_token
 
@@ -11,32 +12,37 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/auth/login")
 optional_bearer = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    session: Session = Depends(get_session)
-) -> User:
-    """Get current authenticated user by verifying our custom JWT."""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _user_id_from_token(token: str) -> int:
+    """Verify our custom JWT and return the user id it was issued for."""
     payload = decode_access_token(token)
     if not payload:
-        raise credentials_exception
+        raise _credentials_exception()
 
     user_id_str: str | None = payload.get("sub")
     if not user_id_str:
-        raise credentials_exception
+        raise _credentials_exception()
     try:
-        user_id = int(user_id_str)
+        return int(user_id_str)
     except Exception:
-        raise credentials_exception
+        raise _credentials_exception()
+
 
-    user = session.get(User, user_id)
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: Session = Depends(get_session)
+) -> User:
+    """Get current authenticated user by verifying our custom JWT."""
+    user = session.get(User, _user_id_from_token(token))
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
 
@@ -50,6 +56,27 @@ def get_current_active_user(
     return current_user
 
 
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_read_async_session)
+) -> User:
+    """`get_current_user` for async endpoints (no threadpool hop)."""
+    user = await session.get(User, _user_id_from_token(token))
+    if user is None:
+        raise _credentials_exception()
+
+    return user
+
+
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async)
+) -> User:
+    """Ensure the current user is active (async endpoints)."""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
 def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer),
     session: Session = Depends(get_session)
@@ -1,10 +1,11 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import Session, select, func
 from app.core.database import get_session
 from app.models.audit_log import AuditLog, AuditLogRead
 from app.api.v1.deps import get_current_superuser
 from app.models.user import User
+from app.core.pagination import paginate, set_next_cursor
 
 router = APIRouter()
 
@@ -15,12 +16,18 @@ def read_audit_logs(
     current_user: User = Depends(get_current_superuser),
     offset: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from the previous page; replaces offset"),
     action: Optional[str] = None,
     entity_type: Optional[str] = None,
     entity_id: Optional[str] = None,
     response: Response,
 ):
-    """Retrieve recent audit log entries (single query with window count)."""
+    """
+    Retrieve recent audit log entries.
+
+    Offset pages carry the total in X-Total-Count (single query with window
+    count). Cursor pages skip the count so deep pages stay index-only.
+    """
     conditions = []
     if action:
         conditions.append(AuditLog.action == action)
@@ -29,19 +36,30 @@ def read_audit_logs(
     if entity_id:
         conditions.append(AuditLog.entity_id == entity_id)
 
-    count_over = func.count().over()
-    query = (
-        select(AuditLog, count_over.label("_total"))
-        .order_by(AuditLog.timestamp.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-    for cond in conditions:
-        query = query.where(cond)
-
-    rows = session.exec(query).all()
-    total = rows[0][1] if rows else 0
-    logs = [row[0] for row in rows]
+    if cursor:
+        query = paginate(
+            select(AuditLog).where(*conditions),
+            AuditLog.timestamp,
+            AuditLog.id,
+            cursor=cursor,
+            offset=offset,
+            limit=limit,
+        )
+        logs = session.exec(query).all()
+    else:
+        count_over = func.count().over()
+        query = paginate(
+            select(AuditLog, count_over.label("_total")).where(*conditions),
+            AuditLog.timestamp,
+            AuditLog.id,
+            cursor=None,
+            offset=offset,
+            limit=limit,
+        )
+        rows = session.exec(query).all()
+        total = rows[0][1] if rows else 0
+        logs = [row[0] for row in rows]
+        response.headers["X-Total-Count"] = str(total)
 
-    response.headers["X-Total-Count"] = str(total)
+    set_next_cursor(response, logs, "timestamp", limit)
     return logs
@@ -5,11 +5,15 @@ from sqlmodel import Session, select
 from app.core.database import get_session
 from app.models.card import Card, CardCreate, CardRead, CardReadWithPlayer
 from app.models.match import Match
+from app.models.match_event import MatchEventAction, MatchEventKind
 from app.models.player import Player
 from app.models.team import Team
 from app.api.v1.deps import get_current_active_user, get_current_referee, get_current_superuser
 from app.models.user import User, UserRole
 from app.core.audit import record_audit_log
+from app.core.leaderboard import invalidate_leaders
+from app.core.live_match import live_engine
+from app.core.match_events import append_match_events, event_entry
 
 router = APIRouter()
 
@@ -20,6 +24,11 @@ def create_card(
     card: CardCreate,
     current_user: User = Depends(get_current_referee)
 ):
+    # Live matches are handled in memory and persisted write-behind
+    live_card = live_engine.add_card(session, card, current_user)
+    if live_card is not None:
+        return live_card
+
     # Verify match exists
     match = session.get(Match, card.match_id)
     if not match:
@@ -54,6 +63,9 @@ def create_card(
     else:
         player.red_cards += 1
     session.add(player)
+    append_match_events(session, match.id, [
+        event_entry(MatchEventKind.card, MatchEventAction.created, db_card.id, CardRead.model_validate(db_card))
+    ])
     
     # Audit Log
     record_audit_log(
@@ -65,11 +77,15 @@ def create_card(
     )
 
     session.commit()
+    invalidate_leaders(match.tournament_id)
     session.refresh(db_card)
     return db_card
 
 @router.get("/match/{match_id}", response_model=List[CardReadWithPlayer])
 def read_match_cards(*, session: Session = Depends(get_session), match_id: uuid.UUID):
+    live = live_engine.snapshot(match_id)
+    if live is not None:
+        return live.cards
     cards = session.exec(select(Card).where(Card.match_id == match_id).order_by(Card.minute)).all()
     return cards
 
@@ -80,6 +96,9 @@ def delete_card(
     card_id: uuid.UUID,
     current_user: User = Depends(get_current_referee)
 ):
+    if live_engine.delete_card(session, card_id, current_user):
+        return {"ok": True}
+
     db_card = session.get(Card, card_id)
     if not db_card:
         raise HTTPException(status_code=404, detail="Card not found")
@@ -107,5 +126,10 @@ def delete_card(
     )
 
     session.delete(db_card)
+    append_match_events(session, db_card.match_id, [
+        event_entry(MatchEventKind.card, MatchEventAction.deleted, card_id)
+    ])
     session.commit()
+    if match:
+        invalidate_leaders(match.tournament_id)
     return {"ok": True}
@@ -5,6 +5,7 @@ from sqlmodel import Session, select
 from app.core.database import get_session
 from app.models.competition import Competition, CompetitionCreate, CompetitionRead, CompetitionUpdate
 from app.core.supabase_client import get_signed_url, get_signed_urls_batch
+from app.core.query_stats import query_budget
 from app.api.v1.deps import get_current_management_admin, get_current_active_user
 from app.models.user import User, UserRole
 from app.models.team import Team
@@ -29,7 +30,7 @@ def create_competition(
     res["image_url"] = get_signed_url(db_competition.image_url)
     return res
 
-@router.get("/", response_model=List[CompetitionRead])
+@router.get("/", response_model=List[CompetitionRead], dependencies=[Depends(query_budget(5))])
 def read_competitions(
     *, 
     session: Session = Depends(get_session),
@@ -0,0 +1,38 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from app.api.v1.deps import get_current_superuser
+from app.core.config import settings
+from app.core.pool_metrics import pool_snapshot
+from app.core.slow_query import SlowQueryRead, clear_slow_queries, get_slow_queries
+from app.models.user import User
+
+router = APIRouter()
+
+@router.get("/slow-queries", response_model=List[SlowQueryRead])
+def read_slow_queries(
+    *,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_superuser)
+):
+    """Recent statements over SLOW_QUERY_MS on this process, newest first."""
+    return get_slow_queries(limit)
+
+@router.delete("/slow-queries")
+def delete_slow_queries(
+    *,
+    current_user: User = Depends(get_current_superuser)
+):
+    clear_slow_queries()
+    return {"ok": True}
+
+@router.get("/pool")
+def read_pool_metrics(
+    *,
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Connection pool state per engine: size, checked-out and overflow counts,
+    checkout wait histogram, pool timeouts and invalidated connections
+    (failed pre-pings and disconnects). Counters are per process since start.
+    """
+    return {"profile": settings.DB_POOL_PROFILE, "pools": pool_snapshot()}
@@ -1,15 +1,20 @@
 import uuid
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import case, func
+from sqlmodel import Session, delete, insert, select, update
 from app.core.database import get_session
 from app.models.goal import Goal, GoalCreate, GoalRead, GoalReadWithPlayer
 from app.models.match import Match
+from app.models.match_event import MatchEventAction, MatchEventKind
 from app.models.player import Player
 from app.models.team import Team
 from app.api.v1.deps import get_current_active_user, get_current_referee, get_current_superuser
 from app.models.user import User, UserRole
 from app.core.audit import record_audit_log
+from app.core.leaderboard import invalidate_leaders
+from app.core.live_match import live_engine
+from app.core.match_events import append_match_events, event_entry
 
 router = APIRouter()
 
@@ -20,6 +25,11 @@ def create_goal(
     goal: GoalCreate,
     current_user: User = Depends(get_current_referee)
 ):
+    # Live matches are scored in memory and persisted write-behind
+    live_goal = live_engine.add_goal(session, goal, current_user)
+    if live_goal is not None:
+        return live_goal
+
     # Verify match and teams exist
     match = session.get(Match, goal.match_id)
     if not match:
@@ -50,24 +60,29 @@ def create_goal(
              # Scorer is the player. If own goal, scorer team != team_id.
              pass
 
-    db_goal = Goal.model_validate(goal)
-    session.add(db_goal)
-    
-    # Update match score
-    if not goal.is_own_goal:
-        if goal.team_id == match.team_a_id:
-            match.score_a += 1
-        else:
-            match.score_b += 1
-    else:
-        # Own goal: Scorer's team gives goal to opponent
-        if goal.team_id == match.team_a_id:
-             # Team A is the one getting the goal
-             match.score_a += 1
-        else:
-             match.score_b += 1
-    
-    session.add(match)
+    # Verify assistant exists and played for the credited team
+    if goal.assistant_id:
+        assistant = session.get(Player, goal.assistant_id)
+        if not assistant:
+            raise HTTPException(status_code=404, detail="Player not found")
+        if assistant.team_id != goal.team_id:
+            raise HTTPException(status_code=400, detail="Assistant does not belong to the scoring team")
+
+    # Insert the goal and increment the credited side in one statement; the increment
+    # happens in the database, so concurrent goals cannot overwrite each other.
+    # team_id is the team credited with the goal, own goals included.
+    goal_id = uuid.uuid4()
+    new_goal = insert(Goal).values(id=goal_id, **goal.model_dump()).returning(Goal.id).cte("new_goal")
+    score = Match.score_a if goal.team_id == match.team_a_id else Match.score_b
+    session.exec(
+        update(Match)
+        .where(Match.id == match.id)
+        .values({score: score + 1})
+        .add_cte(new_goal)
+    )
+    append_match_events(session, match.id, [
+        event_entry(MatchEventKind.goal, MatchEventAction.created, goal_id, GoalRead(id=goal_id, **goal.model_dump()))
+    ])
     
     # Audit Log
     record_audit_log(
@@ -79,11 +94,14 @@ def create_goal(
     )
 
     session.commit()
-    session.refresh(db_goal)
-    return db_goal
+    invalidate_leaders(match.tournament_id)
+    return session.get(Goal, goal_id)
 
 @router.get("/match/{match_id}", response_model=List[GoalReadWithPlayer])
 def read_match_goals(*, session: Session = Depends(get_session), match_id: uuid.UUID):
+    live = live_engine.snapshot(match_id)
+    if live is not None:
+        return live.goals
     goals = session.exec(select(Goal).where(Goal.match_id == match_id).order_by(Goal.minute)).all()
     return goals
 
@@ -94,22 +112,40 @@ def delete_goal(
     goal_id: uuid.UUID,
     current_user: User = Depends(get_current_referee)
 ):
+    if live_engine.delete_goal(session, goal_id, current_user):
+        return {"ok": True}
+
     db_goal = session.get(Goal, goal_id)
     if not db_goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     
     match = session.get(Match, db_goal.match_id)
-    if match:
-        # Ensure this referee is assigned to the match
-        if match.referee_id != current_user.id:
-            raise HTTPException(status_code=403, detail="You are not the assigned referee for this match")
-        # Deduct from score
-        if db_goal.team_id == match.team_a_id:
-            match.score_a = max(0, match.score_a - 1)
-        else:
-            match.score_b = max(0, match.score_b - 1)
-        session.add(match)
-        
+    # Ensure this referee is assigned to the match
+    if match and match.referee_id != current_user.id:
+        raise HTTPException(status_code=403, detail="You are not the assigned referee for this match")
+
+    # Delete the goal and deduct it from the score in one statement. When a concurrent
+    # request deleted it first, nothing is returned and the score is left alone.
+    removed = delete(Goal).where(Goal.id == goal_id).returning(Goal.match_id, Goal.team_id).cte("removed_goal")
+    credited_a = removed.c.team_id == Match.team_a_id
+    deducted = session.exec(
+        update(Match)
+        .where(Match.id == removed.c.match_id)
+        .values(
+            score_a=case((credited_a, func.greatest(Match.score_a - 1, 0)), else_=Match.score_a),
+            score_b=case((credited_a, Match.score_b), else_=func.greatest(Match.score_b - 1, 0)),
+        )
+        .returning(Match.id)
+        .add_cte(removed)
+        # The loaded match is not read again; skip syncing it (which cannot evaluate the CTE)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if deducted is None:
+        raise HTTPException(status_code=404, detail="Goal not found")
+    append_match_events(session, db_goal.match_id, [
+        event_entry(MatchEventKind.goal, MatchEventAction.deleted, goal_id)
+    ])
+
     # Audit Log
     record_audit_log(
         session,
@@ -119,6 +155,7 @@ def delete_goal(
         description=f"Deleted goal {goal_id} from match {db_goal.match_id}"
     )
 
-    session.delete(db_goal)
     session.commit()
+    if match:
+        invalidate_leaders(match.tournament_id)
     return {"ok": True}
@@ -1,20 +1,36 @@
 import logging
 import uuid
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
-from sqlalchemy.orm import selectinload
-from app.core.database import get_session
-from app.models.match import Match, MatchCreate, MatchRead, MatchUpdate
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Dict, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlmodel import Field, Session, SQLModel, delete, insert, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from pydantic import AliasChoices, TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy.orm import aliased, noload, selectinload
+from app.core.database import get_session, get_read_async_session
+from app.models.match import Match, MatchCreate, MatchRead, MatchStatus, MatchUpdate
 from app.models.team import Team, TeamRead
 from app.models.tournament import Tournament, TournamentRead
 from app.models.competition import Competition, CompetitionRead
 from app.models.lineup import Lineup, LineupRead, LineupReadWithPlayer
-from app.models.goal import Goal, GoalReadWithPlayer
-from app.models.card import Card, CardReadWithPlayer
-from app.models.substitution import Substitution, SubstitutionReadWithPlayers
+from app.models.goal import Goal, GoalRead, GoalReadWithPlayer
+from app.models.card import Card, CardRead, CardReadWithPlayer
+from app.models.match_event import (
+    MatchEvent,
+    MatchEventBatch,
+    MatchEventBatchRead,
+    MatchEventRead,
+    MatchSyncRead,
+    MatchSyncRequest,
+    MatchSyncStatus,
+)
+from app.models.player import PlayerRead
+from app.models.substitution import Substitution, SubstitutionRead, SubstitutionReadWithPlayers
 from app.api.v1.deps import (
     get_current_active_user, 
+    get_current_active_user_async,
     get_current_superuser, 
     get_current_coach, 
     get_current_referee,
@@ -23,6 +39,14 @@ from app.api.v1.deps import (
 )
 from app.models.user import User, UserRole, UserRead
 from app.core.audit import record_audit_log
+from app.core.pagination import paginate, set_next_cursor
+from app.core.query_stats import query_budget
+from app.core.fieldsets import FIELDS_DESCRIPTION, load_columns, parse_fields, sparse_adapter, sparse_response
+from app.core.responses import FastJSONResponse
+from app.core.streaming import STREAM_BATCH_SIZE, stream_rows, wants_stream
+from app.core.leaderboard import invalidate_leaders
+from app.core.live_match import LiveMatchRead, live_engine
+from app.core.match_events import apply_event_batch, sync_match_events
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -35,11 +59,114 @@ class EnrichedMatchRead(MatchRead):
     team_a: Optional[TeamRead] = None
     team_b: Optional[TeamRead] = None
     lineups: List[LineupReadWithPlayer] = []
-    goals: List[GoalReadWithPlayer] = []
-    cards: List[CardReadWithPlayer] = []
+    # Match stores these as goals_list / cards_list
+    goals: List[GoalReadWithPlayer] = Field(default=[], validation_alias=AliasChoices("goals", "goals_list"))
+    cards: List[CardReadWithPlayer] = Field(default=[], validation_alias=AliasChoices("cards", "cards_list"))
     substitutions: List[SubstitutionReadWithPlayers] = []
     referee: Optional[UserRead] = None
 
+# Built once per process. Validating the loaded Match graph straight from attributes
+# and dumping JSON from the same adapter is a single pass; the response is returned
+# as bytes so FastAPI does not validate it against response_model a second time.
+_enriched_match_adapter = TypeAdapter(EnrichedMatchRead)
+_enriched_match_list_adapter = TypeAdapter(List[EnrichedMatchRead])
+
+_live_match_adapter = TypeAdapter(LiveMatchRead)
+
+def _serialize_match(m: Match, live: Optional[LiveMatchRead] = None) -> bytes:
+    em = _enriched_match_adapter.validate_python(m, from_attributes=True)
+    if live is not None:
+        # Score and timeline of a live match are ahead of the database in memory
+        em.score_a, em.score_b = live.score_a, live.score_b
+        em.goals, em.cards, em.substitutions = live.goals, live.cards, live.substitutions
+    return _enriched_match_adapter.dump_json(em)
+
+def _serialize_matches(matches: List[Match]) -> bytes:
+    return _enriched_match_list_adapter.dump_json(
+        _enriched_match_list_adapter.validate_python(matches, from_attributes=True)
+    )
+
+class MatchListFormat(str, Enum):
+    nested = "nested"
+    normalized = "normalized"
+
+class NormalizedMatchRead(MatchRead):
+    """A match whose related entities are referenced by id (see `MatchIncluded`)."""
+    lineups: List[LineupRead] = []
+    goals: List[GoalRead] = Field(default=[], validation_alias=AliasChoices("goals", "goals_list"))
+    cards: List[CardRead] = Field(default=[], validation_alias=AliasChoices("cards", "cards_list"))
+    substitutions: List[SubstitutionRead] = []
+
+class MatchIncluded(SQLModel):
+    tournaments: Dict[uuid.UUID, TournamentRead] = {}
+    competitions: Dict[uuid.UUID, CompetitionRead] = {}
+    teams: Dict[uuid.UUID, TeamRead] = {}
+    players: Dict[uuid.UUID, PlayerRead] = {}
+    referees: Dict[int, UserRead] = {}
+
+class NormalizedMatchList(SQLModel):
+    """`format=normalized`: every tournament, team, player and referee appears once."""
+    matches: List[NormalizedMatchRead]
+    included: MatchIncluded
+
+_normalized_match_list_adapter = TypeAdapter(NormalizedMatchList)
+
+def _serialize_normalized(matches: List[Match]) -> bytes:
+    included = {"tournaments": {}, "competitions": {}, "teams": {}, "players": {}, "referees": {}}
+
+    def add(kind: str, entity) -> None:
+        if entity is not None:
+            included[kind].setdefault(entity.id, entity)
+
+    for m in matches:
+        add("tournaments", m.tournament)
+        if m.tournament:
+            add("competitions", m.tournament.competition)
+        add("teams", m.team_a)
+        add("teams", m.team_b)
+        add("referees", m.referee)
+        for lineup in m.lineups:
+            add("players", lineup.player)
+        for goal in m.goals_list:
+            add("players", goal.player)
+            add("players", goal.assistant)
+        for card in m.cards_list:
+            add("players", card.player)
+        for sub in m.substitutions:
+            add("players", sub.player_in)
+            add("players", sub.player_out)
+
+    return _normalized_match_list_adapter.dump_json(
+        _normalized_match_list_adapter.validate_python({"matches": matches, "included": included}, from_attributes=True)
+    )
+
+class MatchSummaryTeam(SQLModel):
+    id: uuid.UUID
+    name: str
+    logo_url: Optional[str] = None
+    color: Optional[str] = None
+
+class MatchSummaryRead(SQLModel):
+    """Fixture-list row: match columns plus the names clients show next to them."""
+    id: uuid.UUID
+    tournament_id: uuid.UUID
+    tournament_name: str
+    competition_id: Optional[uuid.UUID] = None
+    status: MatchStatus
+    start_time: datetime
+    match_day: int
+    stage: Optional[str] = None
+    score_a: int
+    score_b: int
+    penalty_score_a: int
+    penalty_score_b: int
+    is_halftime: bool
+    is_extra_time: bool
+    team_a: MatchSummaryTeam
+    team_b: MatchSummaryTeam
+    referee_id: Optional[int] = None
+    referee_name: Optional[str] = None
+
 @router.post("/", response_model=MatchRead)
 def create_match(
     *, 
@@ -80,35 +207,86 @@ def create_match(
     session.refresh(db_match)
     return db_match
 
-@router.get("/", response_model=List[EnrichedMatchRead])
-def read_matches(
+# Eager loads behind each relation field of EnrichedMatchRead
+_MATCH_RELATION_LOADS = {
+    "tournament": [selectinload(Match.tournament).selectinload(Tournament.competition)],
+    "team_a": [selectinload(Match.team_a)],
+    "team_b": [selectinload(Match.team_b)],
+    "referee": [selectinload(Match.referee)],
+    "lineups": [selectinload(Match.lineups).selectinload(Lineup.player)],
+    "goals": [
+        selectinload(Match.goals_list).selectinload(Goal.player),
+        selectinload(Match.goals_list).selectinload(Goal.assistant),
+    ],
+    "cards": [selectinload(Match.cards_list).selectinload(Card.player)],
+    "substitutions": [
+        selectinload(Match.substitutions).selectinload(Substitution.player_in),
+        selectinload(Match.substitutions).selectinload(Substitution.player_out),
+    ],
+}
+
+# Many-to-one relations are loaded through a foreign key column of Match
+_MATCH_RELATION_KEYS = {
+    "tournament": Match.tournament_id,
+    "team_a": Match.team_a_id,
+    "team_b": Match.team_b_id,
+    "referee": Match.referee_id,
+}
+
+def _match_load_options(enriched: bool = True) -> list:
+    """Eager-load everything EnrichedMatchRead reads (async sessions cannot lazy-load)."""
+    # Light load for list/dashboard: only tournament, teams, referee
+    options = [opt for name in _MATCH_RELATION_KEYS for opt in _MATCH_RELATION_LOADS[name]]
+    if enriched:
+        for name in ("lineups", "goals", "cards", "substitutions"):
+            options.extend(_MATCH_RELATION_LOADS[name])
+    else:
+        options.extend([
+            noload(Match.lineups),
+            noload(Match.goals_list),
+            noload(Match.cards_list),
+            noload(Match.substitutions),
+        ])
+    return options
+
+def _sparse_match_options(names: tuple[str, ...]) -> list:
+    """Only the `?fields=` columns and relations, plus the columns paging and eager loads need."""
+    keys = [_MATCH_RELATION_KEYS[name] for name in names if name in _MATCH_RELATION_KEYS]
+    options = [load_columns(Match, names, Match.start_time, *keys)]
+    for name in names:
+        options.extend(_MATCH_RELATION_LOADS.get(name, []))
+    return options
+
+async def _match_batches(session: AsyncSession, query):
+    """Matches off a server-side cursor; eager loads run once per batch."""
+    result = await session.stream_scalars(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    async for batch in result.partitions():
+        yield batch
+
+@router.get("/", response_model=Union[List[EnrichedMatchRead], NormalizedMatchList], dependencies=[Depends(query_budget(16))])
+async def read_matches(
     *,
-    session: Session = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_async_session),
     offset: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_user),
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from the previous page; replaces offset"),
+    current_user: User = Depends(get_current_active_user_async),
     tournament_id: Optional[uuid.UUID] = None,
     enriched: bool = Query(True, description="If false, omit lineups/goals/cards/substitutions for faster list/dashboard"),
+    stream: bool = Query(False, description="Send the page as a chunked JSON array (NDJSON with Accept: application/x-ndjson); no X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION + " (overrides enriched)"),
+    format: MatchListFormat = Query(MatchListFormat.nested, description="normalized: match rows reference tournaments, teams, players and referees by id; each is listed once under `included`"),
 ):
+    names = parse_fields(fields, EnrichedMatchRead)
+    normalized = format == MatchListFormat.normalized
+    if normalized and (names or wants_stream(request, stream)):
+        raise HTTPException(status_code=400, detail="format=normalized cannot be combined with fields or streaming")
     try:
-        # Light load for list/dashboard: only tournament, teams, referee
-        base_options = [
-            selectinload(Match.tournament).selectinload(Tournament.competition),
-            selectinload(Match.team_a),
-            selectinload(Match.team_b),
-            selectinload(Match.referee),
-        ]
-        if enriched:
-            base_options.extend([
-                selectinload(Match.lineups).selectinload(Lineup.player),
-                selectinload(Match.goals_list).selectinload(Goal.player),
-                selectinload(Match.goals_list).selectinload(Goal.assistant),
-                selectinload(Match.cards_list).selectinload(Card.player),
-                selectinload(Match.substitutions).selectinload(Substitution.player_in),
-                selectinload(Match.substitutions).selectinload(Substitution.player_out),
-            ])
-
-        query = select(Match).options(*base_options)
+        if names:
+            query = select(Match).options(*_sparse_match_options(names))
+        else:
+            query = select(Match).options(*_match_load_options(enriched))
 
         if current_user.role == UserRole.REFEREE:
             query = query.where(Match.referee_id == current_user.id)
@@ -116,35 +294,19 @@ def read_matches(
         if tournament_id:
             query = query.where(Match.tournament_id == tournament_id)
 
-        matches = session.exec(query.offset(offset).limit(limit)).all()
-        result = []
-        for m in matches:
-            em = EnrichedMatchRead.model_validate(m)
-
-            if m.tournament:
-                tournament_dict = TournamentReadWithCompetition.model_validate(m.tournament).model_dump()
-                if m.tournament.competition:
-                    tournament_dict["competition"] = CompetitionRead.model_validate(m.tournament.competition).model_dump()
-                em.tournament = TournamentReadWithCompetition(**tournament_dict)
-
-            em.team_a = m.team_a
-            em.team_b = m.team_b
-
-            if enriched:
-                em.lineups = [LineupReadWithPlayer.model_validate(l) for l in m.lineups]
-                em.goals = [GoalReadWithPlayer.model_validate(g) for g in m.goals_list]
-                em.cards = [CardReadWithPlayer.model_validate(c) for c in m.cards_list]
-                em.substitutions = [SubstitutionReadWithPlayers.model_validate(s) for s in m.substitutions]
-            else:
-                em.lineups = []
-                em.goals = []
-                em.cards = []
-                em.substitutions = []
-
-            if m.referee:
-                em.referee = UserRead.model_validate(m.referee)
-
-            result.append(em)
+        query = paginate(query, Match.start_time, Match.id, cursor=cursor, offset=offset, limit=limit, descending=False)
+        if wants_stream(request, stream):
+            adapter = sparse_adapter(EnrichedMatchRead, names, many=False) if names else _enriched_match_adapter
+            return stream_rows(request, _match_batches(session, query), adapter)
+
+        matches = (await session.exec(query)).all()
+        if normalized:
+            result = FastJSONResponse(_serialize_normalized(matches))
+        elif names:
+            result = sparse_response(EnrichedMatchRead, names, matches)
+        else:
+            result = FastJSONResponse(_serialize_matches(matches))
+        set_next_cursor(result, matches, "start_time", limit)
         return result
     except HTTPException:
         raise
@@ -152,58 +314,215 @@ def read_matches(
         logger.exception("read_matches failed")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
-@router.get("/{match_id}", response_model=EnrichedMatchRead)
-def read_match(
+_TeamA = aliased(Team)
+_TeamB = aliased(Team)
+
+def _match_summary_query():
+    """Only the columns of MatchSummaryRead, joined in one statement (no ORM entities)."""
+    return (
+        select(
+            Match.id, Match.tournament_id, Tournament.name.label("tournament_name"), Tournament.competition_id,
+            Match.status, Match.start_time, Match.match_day, Match.stage,
+            Match.score_a, Match.score_b, Match.penalty_score_a, Match.penalty_score_b,
+            Match.is_halftime, Match.is_extra_time,
+            _TeamA.id.label("team_a_id"), _TeamA.name.label("team_a_name"),
+            _TeamA.logo_url.label("team_a_logo_url"), _TeamA.color.label("team_a_color"),
+            _TeamB.id.label("team_b_id"), _TeamB.name.label("team_b_name"),
+            _TeamB.logo_url.label("team_b_logo_url"), _TeamB.color.label("team_b_color"),
+            Match.referee_id, User.full_name.label("referee_name"),
+        )
+        .join(Tournament, Tournament.id == Match.tournament_id)
+        .join(_TeamA, _TeamA.id == Match.team_a_id)
+        .join(_TeamB, _TeamB.id == Match.team_b_id)
+        .outerjoin(User, User.id == Match.referee_id)
+    )
+
+def _match_summary_row(r) -> dict:
+    return {
+        "id": r[0], "tournament_id": r[1], "tournament_name": r[2], "competition_id": r[3],
+        "status": r[4], "start_time": r[5], "match_day": r[6], "stage": r[7],
+        "score_a": r[8], "score_b": r[9], "penalty_score_a": r[10], "penalty_score_b": r[11],
+        "is_halftime": r[12], "is_extra_time": r[13],
+        "team_a": {"id": r[14], "name": r[15], "logo_url": r[16], "color": r[17]},
+        "team_b": {"id": r[18], "name": r[19], "logo_url": r[20], "color": r[21]},
+        "referee_id": r[22], "referee_name": r[23],
+    }
+
+@router.get("/summary", response_model=List[MatchSummaryRead], dependencies=[Depends(query_budget(2))])
+async def read_matches_summary(
+    *,
+    session: AsyncSession = Depends(get_read_async_session),
+    offset: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from the previous page; replaces offset"),
+    current_user: User = Depends(get_current_active_user_async),
+    tournament_id: Optional[uuid.UUID] = None,
+):
+    """
+    Lightweight match list for dashboards and fixture lists. Selects only the
+    summary columns through joins and serializes the rows straight to JSON,
+    skipping ORM objects and response-model validation.
+    """
+    query = _match_summary_query()
+    if current_user.role == UserRole.REFEREE:
+        query = query.where(Match.referee_id == current_user.id)
+    if tournament_id:
+        query = query.where(Match.tournament_id == tournament_id)
+
+    query = paginate(query, Match.start_time, Match.id, cursor=cursor, offset=offset, limit=limit, descending=False)
+    rows = (await session.exec(query)).all()
+    result = FastJSONResponse(to_json([_match_summary_row(r) for r in rows]))
+    set_next_cursor(result, rows, "start_time", limit)
+    return result
+
+def _check_match_read_access(match: Optional[Match], current_user: User) -> None:
+    if not match:
+        raise HTTPException(status_code=404, detail="Match not found")
+
+    # RBAC Check: Referees can only view matches they are assigned to
+    if current_user.role == UserRole.REFEREE and match.referee_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Referees can only view matches they are assigned to")
+
+@router.get("/{match_id}", response_model=EnrichedMatchRead, dependencies=[Depends(query_budget(16))])
+async def read_match(
     *, 
-    session: Session = Depends(get_session), 
+    session: AsyncSession = Depends(get_read_async_session), 
     match_id: uuid.UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user_async),
 ):
     try:
+        query = select(Match).where(Match.id == match_id).options(*_match_load_options())
+        match = (await session.exec(query)).first()
+        _check_match_read_access(match, current_user)
+        return FastJSONResponse(_serialize_match(match, live_engine.snapshot(match_id)))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("read_match failed")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+def _read_match_sync(session: Session, match_id: uuid.UUID, current_user: User) -> FastJSONResponse:
+    """`read_match` for sync write endpoints that answer with the enriched match."""
+    query = select(Match).where(Match.id == match_id).options(*_match_load_options())
+    match = session.exec(query).first()
+    _check_match_read_access(match, current_user)
+    return FastJSONResponse(_serialize_match(match))
+
+@router.get("/{match_id}/live", response_model=LiveMatchRead, dependencies=[Depends(query_budget(12))])
+def read_live_match(
+    *,
+    session: Session = Depends(get_session),
+    match_id: uuid.UUID,
+    current_user: User = Depends(get_current_active_user),
+):
+    """Score, clock and timeline; served from memory while the match is live."""
+    live = live_engine.read(session, match_id)
+    if live is None:
         query = select(Match).where(Match.id == match_id).options(
-            selectinload(Match.tournament).selectinload(Tournament.competition),
-            selectinload(Match.team_a),
-            selectinload(Match.team_b),
-            selectinload(Match.lineups).selectinload(Lineup.player),
-            selectinload(Match.goals_list).selectinload(Goal.player),
-            selectinload(Match.goals_list).selectinload(Goal.assistant),
-            selectinload(Match.cards_list).selectinload(Card.player),
-            selectinload(Match.substitutions).selectinload(Substitution.player_in),
-            selectinload(Match.substitutions).selectinload(Substitution.player_out),
-            selectinload(Match.referee),
+            *_MATCH_RELATION_LOADS["goals"], *_MATCH_RELATION_LOADS["cards"], *_MATCH_RELATION_LOADS["substitutions"]
         )
-        # ... rest of the logic
-        query = query.where(Match.id == match_id)
         match = session.exec(query).first()
+        _check_match_read_access(match, current_user)
+        return FastJSONResponse(_live_match_adapter.dump_json(
+            _live_match_adapter.validate_python(match, from_attributes=True)
+        ))
+    _check_match_read_access(live, current_user)
+    return FastJSONResponse(_live_match_adapter.dump_json(live))
+
+@router.get("/{match_id}/timeline", response_model=List[MatchEventRead], dependencies=[Depends(query_budget(3))])
+def read_match_timeline(
+    *,
+    session: Session = Depends(get_session),
+    match_id: uuid.UUID,
+    after_seq: int = Query(0, ge=0, description="Return only events after this sequence number"),
+    limit: int = Query(200, ge=1, le=1000),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Goals, cards and substitutions recorded or removed, in recording order. Polling
+    clients pass the last `seq` they have to fetch only what is new.
+    """
+    match = session.get(Match, match_id)
+    _check_match_read_access(match, current_user)
+    query = (
+        select(MatchEvent)
+        .where(MatchEvent.match_id == match_id, MatchEvent.seq > after_seq)
+        .order_by(MatchEvent.seq)
+        .limit(limit)
+    )
+    live = live_engine.timeline(match_id, after_seq, limit)
+    if live is None:
+        return session.exec(query).all()
+    # Live match: entries up to `loaded_seq` are in the database, later ones in memory
+    loaded_seq, recent = live
+    if after_seq >= loaded_seq:
+        return recent
+    events = session.exec(query.where(MatchEvent.seq <= loaded_seq)).all()
+    return [*events, *recent[:limit - len(events)]]
+
+@router.post("/{match_id}/events:batch", response_model=MatchEventBatchRead)
+def record_match_events(
+    *,
+    session: Session = Depends(get_session),
+    match_id: uuid.UUID,
+    batch: MatchEventBatch,
+    current_user: User = Depends(get_current_referee),
+):
+    """
+    Record an ordered list of goals, cards and substitutions in one request.
+    The batch is all-or-nothing: any invalid event rejects the whole batch.
+    """
+    events = [e.for_match(match_id) for e in batch.events]
+    # Live matches are handled in memory and persisted write-behind
+    recorded = live_engine.add_events(session, match_id, events, current_user)
+    if recorded is not None:
+        return recorded
+
+    match = session.get(Match, match_id)
+    if not match:
+        raise HTTPException(status_code=404, detail="Match not found")
+    if match.referee_id != current_user.id:
+        raise HTTPException(status_code=403, detail="You are not the assigned referee for this match")
+    recorded = apply_event_batch(session, match, events)
+    session.commit()
+    if recorded.goals or recorded.cards:
+        invalidate_leaders(match.tournament_id)
+    return recorded
+
+@router.post("/{match_id}/sync", response_model=MatchSyncRead)
+def sync_match_timeline(
+    *,
+    session: Session = Depends(get_session),
+    match_id: uuid.UUID,
+    sync: MatchSyncRequest,
+    current_user: User = Depends(get_current_referee),
+):
+    """
+    Offline-first referee devices: upload the queued goals, cards and substitutions
+    (and deletions) of a match in one request, and get back the per-entry outcome,
+    the resulting score and the server timeline after `after_seq`. Re-sending a
+    queue is safe: entries are identified by their client ids.
+    """
+    # Live events are written first; live writes to this match wait for the commit
+    with live_engine.detach(match_id):
+        match = session.get(Match, match_id)
         if not match:
             raise HTTPException(status_code=404, detail="Match not found")
+        if match.referee_id != current_user.id:
+            raise HTTPException(status_code=403, detail="You are not the assigned referee for this match")
+        if sync.events and match.status == MatchStatus.finished and match.finished_at:
+            finished_at = match.finished_at.replace(tzinfo=match.finished_at.tzinfo or timezone.utc)
+            if datetime.now(timezone.utc) > finished_at + timedelta(hours=1):
+                raise HTTPException(
+                    status_code=403,
+                    detail="Match data is locked and cannot be changed after 1 hour of completion"
+                )
 
-        # RBAC Check: Referees can only view matches they are assigned to
-        if current_user.role == UserRole.REFEREE and match.referee_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Referees can only view matches they are assigned to")
-
-        em = EnrichedMatchRead.model_validate(match)
-        if match.tournament:
-            tournament_dict = TournamentReadWithCompetition.model_validate(match.tournament).model_dump()
-            if match.tournament.competition:
-                tournament_dict['competition'] = CompetitionRead.model_validate(match.tournament.competition).model_dump()
-            em.tournament = TournamentReadWithCompetition(**tournament_dict)
-        em.team_a = match.team_a
-        em.team_b = match.team_b
-        
-        em.lineups = [LineupReadWithPlayer.model_validate(l) for l in match.lineups]
-        em.goals = [GoalReadWithPlayer.model_validate(g) for g in match.goals_list]
-        em.cards = [CardReadWithPlayer.model_validate(c) for c in match.cards_list]
-        em.substitutions = [SubstitutionReadWithPlayers.model_validate(s) for s in match.substitutions]
-        if match.referee:
-            em.referee = UserRead.model_validate(match.referee)
-        
-        return em
-    except HTTPException:
-        raise
-    except Exception:
-        logger.exception("read_match failed")
-        raise HTTPException(status_code=500, detail="Internal Server Error")
+        merged = sync_match_events(session, match, sync)
+        session.commit()
+    if any(r.status == MatchSyncStatus.applied for r in merged.results):
+        invalidate_leaders(match.tournament_id)
+    return merged
 
 @router.put("/{match_id}", response_model=EnrichedMatchRead)
 def update_match(
@@ -213,90 +532,98 @@ def update_match(
     match: MatchUpdate,
     current_user: User = Depends(get_current_match_manager)
 ):
-    db_match = session.get(Match, match_id)
-    if not db_match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    # Live scores reach the row before it is read; live writes wait for the commit
+    with live_engine.detach(match_id):
+        db_match = session.get(Match, match_id)
+        if not db_match:
+            raise HTTPException(status_code=404, detail="Match not found")
     
-    # RBAC Check
-    if current_user.role == UserRole.REFEREE:
-        if db_match.referee_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Referees can only update matches they are assigned to")
+        # RBAC Check
+        if current_user.role == UserRole.REFEREE:
+            if db_match.referee_id != current_user.id:
+                raise HTTPException(status_code=403, detail="Referees can only update matches they are assigned to")
     
-    match_data = match.model_dump(exclude_unset=True)
+        match_data = match.model_dump(exclude_unset=True)
 
-    # SECURE STATUS TRANSITIONS: Only Referees can start/finish matches
-    if "status" in match_data and match_data["status"] != db_match.status:
-        if current_user.role != UserRole.REFEREE:
-            raise HTTPException(
-                status_code=403, 
-                detail="Only the assigned referee can change a match status (start/finish)"
-            )
-        if db_match.referee_id != current_user.id:
-             raise HTTPException(status_code=403, detail="Only the assigned referee can start this match")
+        # SECURE STATUS TRANSITIONS: Only Referees can start/finish matches
+        if "status" in match_data and match_data["status"] != db_match.status:
+            if current_user.role != UserRole.REFEREE:
+                raise HTTPException(
+                    status_code=403, 
+                    detail="Only the assigned referee can change a match status (start/finish)"
+                )
+            if db_match.referee_id != current_user.id:
+                 raise HTTPException(status_code=403, detail="Only the assigned referee can start this match")
 
-    # Lock match data if finished for > 1 hour
-    if db_match.status == "finished" and db_match.finished_at:
-        import datetime
-        from datetime import timezone as _tz
-        lock_time = db_match.finished_at + datetime.timedelta(hours=1)
-        if datetime.datetime.now(tz=_tz.utc) > lock_time:
-            raise HTTPException(
-                status_code=403, 
-                detail="Match data is locked and cannot be changed after 1 hour of completion"
-            )
+        # Lock match data if finished for > 1 hour
+        if db_match.status == "finished" and db_match.finished_at:
+            import datetime
+            from datetime import timezone as _tz
+            lock_time = db_match.finished_at + datetime.timedelta(hours=1)
+            if datetime.datetime.now(tz=_tz.utc) > lock_time:
+                raise HTTPException(
+                    status_code=403, 
+                    detail="Match data is locked and cannot be changed after 1 hour of completion"
+                )
 
-    # (match_data was already dumped above for RBAC check)
+        # (match_data was already dumped above for RBAC check)
     
-    # Auto-set finished_at when status becomes finished
-    if match_data.get("status") == "finished" and db_match.status != "finished":
-        import datetime
-        from datetime import timezone as _tz
-        match_data["finished_at"] = datetime.datetime.now(tz=_tz.utc)
-
-    # Validate lineup before starting match
-    if match_data.get("status") == "live" and db_match.status != "live":
-        # Check team A
-        team_a_lineup = session.exec(
-            select(Lineup).where(
-                Lineup.match_id == match_id,
-                Lineup.team_id == db_match.team_a_id,
-                Lineup.is_starting == True
-            )
-        ).all()
-        # Check team B
-        team_b_lineup = session.exec(
-            select(Lineup).where(
-                Lineup.match_id == match_id,
-                Lineup.team_id == db_match.team_b_id,
-                Lineup.is_starting == True
-            )
-        ).all()
+        # Auto-set finished_at when status becomes finished
+        if match_data.get("status") == "finished" and db_match.status != "finished":
+            import datetime
+            from datetime import timezone as _tz
+            match_data["finished_at"] = datetime.datetime.now(tz=_tz.utc)
+
+        # Validate lineup before starting match
+        if match_data.get("status") == "live" and db_match.status != "live":
+            # Check team A
+            team_a_lineup = session.exec(
+                select(Lineup).where(
+                    Lineup.match_id == match_id,
+                    Lineup.team_id == db_match.team_a_id,
+                    Lineup.is_starting == True
+                )
+            ).all()
+            # Check team B
+            team_b_lineup = session.exec(
+                select(Lineup).where(
+                    Lineup.match_id == match_id,
+                    Lineup.team_id == db_match.team_b_id,
+                    Lineup.is_starting == True
+                )
+            ).all()
         
-        if len(team_a_lineup) < 7 or len(team_b_lineup) < 7:
-            raise HTTPException(
-                status_code=400,
-                detail="Starting XI must have at least 7 players (standard minimum) for both teams before starting the match"
-            )
+            if len(team_a_lineup) < 7 or len(team_b_lineup) < 7:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Starting XI must have at least 7 players (standard minimum) for both teams before starting the match"
+                )
 
-    for key, value in match_data.items():
-        setattr(db_match, key, value)
+        moved_tournaments = (
+            {db_match.tournament_id, match_data["tournament_id"]} if match_data.get("tournament_id") else set()
+        )
+        for key, value in match_data.items():
+            setattr(db_match, key, value)
         
-    session.add(db_match)
+        session.add(db_match)
     
-    # Audit Log
-    record_audit_log(
-        session,
-        action="UPDATE",
-        entity_type="Match",
-        entity_id=str(db_match.id),
-        description=f"Updated match info (Status: {db_match.status})"
-    )
+        # Audit Log
+        record_audit_log(
+            session,
+            action="UPDATE",
+            entity_type="Match",
+            entity_id=str(db_match.id),
+            description=f"Updated match info (Status: {db_match.status})"
+        )
     
-    session.commit()
+        session.commit()
+    # Its goals and cards count towards the other tournament now
+    for tournament_id in moved_tournaments:
+        invalidate_leaders(tournament_id)
     session.refresh(db_match)
     
     # Return enriched version for frontend
-    return read_match(session=session, match_id=db_match.id, current_user=current_user)
+    return _read_match_sync(session, db_match.id, current_user)
 
 @router.delete("/{match_id}")
 def delete_match(
@@ -305,21 +632,23 @@ def delete_match(
     match_id: uuid.UUID,
     current_user: User = Depends(get_current_superuser)
 ):
-    match = session.get(Match, match_id)
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    with live_engine.detach(match_id):
+        match = session.get(Match, match_id)
+        if not match:
+            raise HTTPException(status_code=404, detail="Match not found")
     
-    # Audit Log
-    record_audit_log(
-        session,
-        action="DELETE",
-        entity_type="Match",
-        entity_id=str(match_id),
-        description=f"Deleted match: {match.id}"
-    )
+        # Audit Log
+        record_audit_log(
+            session,
+            action="DELETE",
+            entity_type="Match",
+            entity_id=str(match_id),
+            description=f"Deleted match: {match.id}"
+        )
 
-    session.delete(match)
-    session.commit()
+        session.delete(match)
+        session.commit()
+    invalidate_leaders(match.tournament_id)
     return {"ok": True}
 
 @router.post("/{match_id}/lineups", response_model=List[LineupRead])
@@ -372,21 +701,58 @@ def set_lineups(
         else:
             db_match.formation_b = formation_b
 
-    # Delete existing lineups for this match for teams being updated
+    # Diff stored vs submitted lineups per (team, player) and write only the changes.
+    # Table models are not validated on input, so ids may still be strings here.
+    try:
+        for l in lineups:
+            l.team_id = uuid.UUID(str(l.team_id))
+            l.player_id = uuid.UUID(str(l.player_id))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid team_id or player_id in lineup")
+    submitted = {(l.team_id, l.player_id): l for l in lineups}
+    if len(submitted) != len(lineups):
+        raise HTTPException(status_code=422, detail="Player listed more than once in lineup")
     target_team_ids = {l.team_id for l in lineups}
-    existing_lineups = session.exec(
-        select(Lineup)
+    stored = session.exec(
+        select(Lineup.id, Lineup.team_id, Lineup.player_id, Lineup.is_starting, Lineup.slot_index)
         .where(Lineup.match_id == match_id)
-        .where(Lineup.team_id.in_(target_team_ids))
     ).all()
-    for l in existing_lineups:
-        session.delete(l)
-    
-    # Add new lineups
-    for l in lineups:
-        l.match_id = match_id
-        session.add(l)
-        
+    stored_by_player = {
+        (row.team_id, row.player_id): row for row in stored if row.team_id in target_team_ids
+    }
+
+    result = [
+        dict(row._mapping, match_id=match_id) for row in stored if row.team_id not in target_team_ids
+    ]
+    to_insert, to_update, kept_ids = [], [], set()
+    for key, l in submitted.items():
+        row = stored_by_player.get(key)
+        values = dict(
+            match_id=match_id,
+            team_id=l.team_id,
+            player_id=l.player_id,
+            is_starting=l.is_starting,
+            slot_index=l.slot_index,
+        )
+        if row is None:
+            values["id"] = uuid.uuid4()
+            to_insert.append(values)
+        else:
+            values["id"] = row.id
+            kept_ids.add(row.id)
+            if (row.is_starting, row.slot_index) != (l.is_starting, l.slot_index):
+                to_update.append({"id": row.id, "is_starting": l.is_starting, "slot_index": l.slot_index})
+        result.append(values)
+    # Older databases may hold repeated rows per player; drop every row that was not kept
+    to_delete = [row.id for row in stored if row.team_id in target_team_ids and row.id not in kept_ids]
+
+    if to_delete:
+        session.exec(delete(Lineup).where(Lineup.id.in_(to_delete)))
+    if to_update:
+        session.exec(update(Lineup), params=to_update)
+    if to_insert:
+        session.exec(insert(Lineup), params=to_insert)
+
     # Audit Log
     record_audit_log(
         session,
@@ -397,4 +763,4 @@ def set_lineups(
     )
 
     session.commit()
-    return session.exec(select(Lineup).where(Lineup.match_id == match_id)).all()
+    return result
@@ -1,17 +1,22 @@
 import uuid
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
 from datetime import datetime, timezone
-from app.core.database import get_session
+from app.core.database import get_session, get_read_async_session
 from app.models.news import News, NewsCreate, NewsRead, NewsUpdate, NewsCategory
 from app.api.v1.deps import get_current_news_reporter, get_current_superuser
 from app.models.user import User
 from app.core.audit import record_audit_log
+from app.core.pagination import paginate, set_next_cursor
 
 from app.core.notification import create_notification
 from app.core.supabase_client import get_signed_url, get_signed_urls_batch
+from app.core.query_stats import query_budget
+from app.core.fieldsets import FIELDS_DESCRIPTION, load_columns, parse_fields, pick, sparse_response
 
 router = APIRouter()
 
@@ -54,19 +59,28 @@ def create_news(
     return news_read
 
 
-@router.get("/", response_model=List[NewsRead])
-def read_news(
+@router.get("/", response_model=List[NewsRead], dependencies=[Depends(query_budget(3))])
+async def read_news(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_read_async_session),
     category: Optional[NewsCategory] = Query(None),
     team_id: Optional[uuid.UUID] = Query(None),
     player_id: Optional[uuid.UUID] = Query(None),
     offset: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from the previous page; replaces offset"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    response: Response,
 ):
-    query = select(News).options(
-        selectinload(News.reporter),
-    ).order_by(News.created_at.desc())
+    names = parse_fields(fields, NewsRead)
+    with_reporter = names is None or "reporter_name" in names
+    with_image = names is None or "image_url" in names
+
+    query = select(News)
+    if names:
+        query = query.options(load_columns(News, names, News.created_at, *([News.reporter_id] if with_reporter else [])))
+    if with_reporter:
+        query = query.options(selectinload(News.reporter).load_only(User.full_name))
     if category:
         query = query.where(News.category == category)
     if team_id:
@@ -74,30 +88,37 @@ def read_news(
     if player_id:
         query = query.where(News.player_id == player_id)
         
-    query = query.offset(offset).limit(limit)
-    news_list = session.exec(query).all()
+    query = paginate(query, News.created_at, News.id, cursor=cursor, offset=offset, limit=limit)
+    news_list = (await session.exec(query)).all()
+    set_next_cursor(response, news_list, "created_at", limit)
     
-    # Batch sign image URLs
-    image_paths = [n.image_url for n in news_list if n.image_url]
-    signed_urls = get_signed_urls_batch(image_paths) if image_paths else {}
+    # Batch sign image URLs (storage client is blocking — keep it off the event loop)
+    image_paths = [n.image_url for n in news_list if n.image_url] if with_image else []
+    signed_urls = await run_in_threadpool(get_signed_urls_batch, image_paths) if image_paths else {}
     
     results = []
     for n in news_list:
-        n_dict = n.model_dump()
-        if n.reporter:
-            n_dict["reporter_name"] = n.reporter.full_name
-        else:
-            n_dict["reporter_name"] = "GoalUp Reporter"
+        n_dict = n.model_dump() if names is None else pick(n, names)
+        if with_reporter:
+            if n.reporter:
+                n_dict["reporter_name"] = n.reporter.full_name
+            else:
+                n_dict["reporter_name"] = "GoalUp Reporter"
         
-        n_dict["image_url"] = signed_urls.get(n.image_url, "") if n.image_url else ""
+        if with_image:
+            n_dict["image_url"] = signed_urls.get(n.image_url, "") if n.image_url else ""
         results.append(n_dict)
-            
+
+    if names:
+        result = sparse_response(NewsRead, names, results)
+        set_next_cursor(result, news_list, "created_at", limit)
+        return result
     return results
 
 
-@router.get("/{news_id}", response_model=NewsRead)
-def read_news_by_id(*, session: Session = Depends(get_session), news_id: uuid.UUID):
-    news = session.get(News, news_id)
+@router.get("/{news_id}", response_model=NewsRead, dependencies=[Depends(query_budget(3))])
+async def read_news_by_id(*, session: AsyncSession = Depends(get_read_async_session), news_id: uuid.UUID):
+    news = await session.get(News, news_id, options=[selectinload(News.reporter)])
     if not news:
         raise HTTPException(status_code=404, detail="News article not found")
     
@@ -108,7 +129,7 @@ def read_news_by_id(*, session: Session = Depends(get_session), news_id: uuid.UU
         
     res = news.model_dump()
     res["reporter_name"] = reporter_name
-    res["image_url"] = get_signed_url(news.image_url)
+    res["image_url"] = await run_in_threadpool(get_signed_url, news.image_url)
     return res
 
 
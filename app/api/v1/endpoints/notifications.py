@@ -1,11 +1,12 @@
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, select
 from app.core.database import get_session
 from app.models.notification import Notification, NotificationRead, NotificationUpdate
 from app.api.v1.deps import get_current_active_user, get_current_management_admin
 from app.models.user import User
+from app.core.pagination import paginate, set_next_cursor
 
 router = APIRouter()
 
@@ -16,13 +17,19 @@ def read_notifications(
     session: Session = Depends(get_session),
     offset: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from the previous page; replaces offset"),
+    response: Response,
 ):
-    notifications = session.exec(
-        select(Notification)
-        .order_by(Notification.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    ).all()
+    query = paginate(
+        select(Notification),
+        Notification.created_at,
+        Notification.id,
+        cursor=cursor,
+        offset=offset,
+        limit=limit,
+    )
+    notifications = session.exec(query).all()
+    set_next_cursor(response, notifications, "created_at", limit)
     return notifications
 
 
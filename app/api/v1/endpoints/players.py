@@ -1,17 +1,25 @@
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
-from app.core.database import get_session
+from app.core.database import get_session, get_read_session
 from app.models.player import Player, PlayerCreate, PlayerRead, PlayerUpdate
 from app.models.team import Team
+from app.models.tournament import Tournament
 from app.api.v1.deps import get_current_tournament_admin, get_current_superuser, get_current_active_user
 from app.models.user import User, UserRole
 from app.core.audit import record_audit_log
-from app.core.supabase_client import get_signed_url
+from app.core.leaderboard import invalidate_leaders
+from app.core.supabase_client import get_signed_url, get_signed_urls_batch
+from app.core.query_stats import query_budget
+from app.core.fieldsets import FIELDS_DESCRIPTION, load_columns, parse_fields, pick, sparse_adapter, sparse_response
+from app.core.streaming import STREAM_BATCH_SIZE, stream_rows, wants_stream
 
 router = APIRouter()
 
+_player_adapter = TypeAdapter(PlayerRead)
+
 @router.post("/", response_model=PlayerRead)
 def create_player(
     *, 
@@ -66,12 +74,35 @@ def create_player(
     res["image_url"] = get_signed_url(db_player.image_url)
     return res
 
-@router.get("/", response_model=List[PlayerRead])
+def _player_rows(players: List[Player], names: Optional[tuple[str, ...]] = None) -> List[dict]:
+    """Response rows for a batch of players, image URLs signed in one batch (`names`: `?fields=`)."""
+    sign = names is None or "image_url" in names
+    signed_urls = get_signed_urls_batch([p.image_url for p in players if p.image_url]) if sign else {}
+    rows = []
+    for p in players:
+        row = p.model_dump() if names is None else pick(p, names)
+        if sign:
+            row["image_url"] = signed_urls.get(p.image_url, "") if p.image_url else ""
+        rows.append(row)
+    return rows
+
+def _player_batches(session: Session, query, names: Optional[tuple[str, ...]] = None):
+    """Players off a server-side cursor, turned into response rows per batch."""
+    for batch in session.exec(query.execution_options(yield_per=STREAM_BATCH_SIZE)).partitions():
+        yield _player_rows(batch, names)
+
+@router.get("/", response_model=List[PlayerRead], dependencies=[Depends(query_budget(3))])
 def read_players(
-    session: Session = Depends(get_session),
+    request: Request,
+    stream: bool = Query(False, description="Send the list as a chunked JSON array (NDJSON with Accept: application/x-ndjson)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    session: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_active_user)
 ):
+    names = parse_fields(fields, PlayerRead)
     query = select(Player)
+    if names:
+        query = query.options(load_columns(Player, names))
     
     if current_user.role == UserRole.TOURNAMENT_ADMIN:
         # Complex join required: Player -> Team -> Tournament
@@ -79,19 +110,21 @@ def read_players(
             query = query.join(Team).where(Team.tournament_id == current_user.tournament_id)
         elif current_user.competition_id:
             query = query.join(Team).join(Tournament).where(Tournament.competition_id == current_user.competition_id)
-            
+
+    if wants_stream(request, stream):
+        adapter = sparse_adapter(PlayerRead, names, many=False) if names else _player_adapter
+        return stream_rows(request, _player_batches(session, query, names), adapter)
+
     players = session.exec(query).all()
-    results = []
-    for p in players:
-        p_dict = p.model_dump()
-        p_dict["image_url"] = get_signed_url(p.image_url)
-        results.append(p_dict)
-    return results
+    rows = _player_rows(players, names)
+    if names:
+        return sparse_response(PlayerRead, names, rows)
+    return rows
 
-@router.get("/{player_id}", response_model=PlayerRead)
+@router.get("/{player_id}", response_model=PlayerRead, dependencies=[Depends(query_budget(3))])
 def read_player(
     *, 
-    session: Session = Depends(get_session), 
+    session: Session = Depends(get_read_session), 
     player_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -167,6 +200,12 @@ def update_player(
                 detail=f"Jersey number {new_jersey} is already taken in this team"
             )
 
+    # Leaders show the player's name, photo and team
+    leader_team_ids = (
+        {db_player.team_id, player_data.get("team_id", db_player.team_id)}
+        if player_data.keys() & {"name", "image_url", "team_id"} else set()
+    )
+
     for key, value in player_data.items():
         setattr(db_player, key, value)
     
@@ -182,6 +221,9 @@ def update_player(
     )
 
     session.commit()
+    if leader_team_ids:
+        for tournament_id in session.exec(select(Team.tournament_id).where(Team.id.in_(leader_team_ids))).all():
+            invalidate_leaders(tournament_id)
     session.refresh(db_player)
     
     res = db_player.model_dump()
@@ -215,6 +257,9 @@ def delete_player(
         description=f"Deleted player: {db_player.name}"
     )
 
+    team = session.get(Team, db_player.team_id)
+    tournament_id = team.tournament_id if team else None
     session.delete(db_player)
     session.commit()
+    invalidate_leaders(tournament_id)
     return {"ok": True}
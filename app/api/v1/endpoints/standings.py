@@ -2,14 +2,17 @@ import uuid
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select, func, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
-from app.core.database import get_session
+from app.core.database import get_session, get_read_async_session
 from app.models.standing import Standing, StandingRead
 from app.models.match import Match, MatchStatus
 from app.models.team import Team, TeamRead
 from app.models.tournament import Tournament, TournamentRead
 from app.models.user import User, UserRole
-from app.api.v1.deps import get_current_active_user
+from app.api.v1.deps import get_current_active_user, get_current_active_user_async, get_current_superuser
+from app.core.standings import recompute_standings
+from app.core.query_stats import query_budget
 
 router = APIRouter()
 
@@ -25,11 +28,11 @@ class GroupedTournamentStandings(SQLModel):
     tournament: TournamentReadWithCompetition
     teams: List[TeamStandingRead]
 
-@router.get("/", response_model=List[GroupedTournamentStandings])
-def read_standings(
+@router.get("/", response_model=List[GroupedTournamentStandings], dependencies=[Depends(query_budget(6))])
+async def read_standings(
     year: Optional[int] = None, 
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user)
+    session: AsyncSession = Depends(get_read_async_session),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     query = select(Tournament).options(
         selectinload(Tournament.competition),
@@ -44,7 +47,7 @@ def read_standings(
             
     if year:
         query = query.where(Tournament.year == year)
-    tournaments = session.exec(query).all()
+    tournaments = (await session.exec(query)).all()
     result = []
     
     for t in tournaments:
@@ -67,12 +70,12 @@ def read_standings(
         
     return result
 
-@router.get("/{tournament_id}", response_model=GroupedTournamentStandings)
-def get_tournament_standings(
+@router.get("/{tournament_id}", response_model=GroupedTournamentStandings, dependencies=[Depends(query_budget(6))])
+async def get_tournament_standings(
     *, 
-    session: Session = Depends(get_session), 
+    session: AsyncSession = Depends(get_read_async_session), 
     tournament_id: uuid.UUID,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user_async)
 ):
     # RBAC Check
     if current_user.role == UserRole.TOURNAMENT_ADMIN:
@@ -83,7 +86,7 @@ def get_tournament_standings(
         selectinload(Tournament.competition),
         selectinload(Tournament.standings).selectinload(Standing.team),
     )
-    tournament = session.exec(query).first()
+    tournament = (await session.exec(query)).first()
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
         
@@ -107,6 +110,17 @@ def get_tournament_standings(
         teams=team_standings
     )
 
+@router.post("/recalculate")
+def recalculate_all_standings(
+    *,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_superuser)
+):
+    """Rebuild the standings of every tournament in one set-based pass."""
+    teams_processed = recompute_standings(session)
+    session.commit()
+    return {"ok": True, "teams_processed": teams_processed}
+
 @router.post("/{tournament_id}/recalculate")
 def recalculate_standings(
     *, 
@@ -125,58 +139,6 @@ def recalculate_standings(
         if current_user.competition_id and tournament.competition_id != current_user.competition_id:
              raise HTTPException(status_code=403, detail="Not authorized to recalculate these standings")
     
-    # Get all teams in this tournament
-    teams = tournament.teams
-    
-    # Reset or clear existing standings for this tournament
-    existings = session.exec(select(Standing).where(Standing.tournament_id == tournament_id)).all()
-    for e in existings:
-        session.delete(e)
-    session.commit()
-    
-    # Get all finished matches
-    matches = session.exec(
-        select(Match).where(Match.tournament_id == tournament_id, Match.status == MatchStatus.finished)
-    ).all()
-    
-    # Stats map: team_id -> dict
-    stats = {team.id: {
-        "played": 0, "won": 0, "drawn": 0, "lost": 0,
-        "goals_for": 0, "goals_against": 0, "points": 0
-    } for team in teams}
-    
-    for m in matches:
-        if m.team_a_id not in stats: stats[m.team_a_id] = {"played": 0, "won": 0, "drawn": 0, "lost": 0, "goals_for": 0, "goals_against": 0, "points": 0}
-        if m.team_b_id not in stats: stats[m.team_b_id] = {"played": 0, "won": 0, "drawn": 0, "lost": 0, "goals_for": 0, "goals_against": 0, "points": 0}
-        
-        stats[m.team_a_id]["played"] += 1
-        stats[m.team_b_id]["played"] += 1
-        stats[m.team_a_id]["goals_for"] += m.score_a
-        stats[m.team_a_id]["goals_against"] += m.score_b
-        stats[m.team_b_id]["goals_for"] += m.score_b
-        stats[m.team_b_id]["goals_against"] += m.score_a
-        
-        if m.score_a > m.score_b:
-            stats[m.team_a_id]["won"] += 1
-            stats[m.team_a_id]["points"] += 3
-            stats[m.team_b_id]["lost"] += 1
-        elif m.score_b > m.score_a:
-            stats[m.team_b_id]["won"] += 1
-            stats[m.team_b_id]["points"] += 3
-            stats[m.team_a_id]["lost"] += 1
-        else:
-            stats[m.team_a_id]["drawn"] += 1
-            stats[m.team_a_id]["points"] += 1
-            stats[m.team_b_id]["drawn"] += 1
-            stats[m.team_b_id]["points"] += 1
-            
-    for team_id, s in stats.items():
-        db_standing = Standing(
-            tournament_id=tournament_id,
-            team_id=team_id,
-            **s
-        )
-        session.add(db_standing)
-        
+    teams_processed = recompute_standings(session, [tournament_id])
     session.commit()
-    return {"ok": True, "teams_processed": len(stats)}
+    return {"ok": True, "teams_processed": teams_processed}
@@ -5,11 +5,14 @@ from sqlmodel import Session, select
 from app.core.database import get_session
 from app.models.substitution import Substitution, SubstitutionCreate, SubstitutionRead
 from app.models.match import Match
+from app.models.match_event import MatchEventAction, MatchEventKind
 from app.models.team import Team
 from app.models.player import Player
 from app.api.v1.deps import get_current_active_user, get_current_referee, get_current_superuser
 from app.models.user import User, UserRole
 from app.core.audit import record_audit_log
+from app.core.live_match import live_engine
+from app.core.match_events import append_match_events, event_entry
 
 router = APIRouter()
 
@@ -20,6 +23,11 @@ def create_substitution(
     substitution: SubstitutionCreate,
     current_user: User = Depends(get_current_referee)
 ):
+    # Live matches are handled in memory and persisted write-behind
+    live_substitution = live_engine.add_substitution(session, substitution, current_user)
+    if live_substitution is not None:
+        return live_substitution
+
     match = session.get(Match, substitution.match_id)
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
@@ -42,6 +50,10 @@ def create_substitution(
         
     db_substitution = Substitution.model_validate(substitution)
     session.add(db_substitution)
+    append_match_events(session, match.id, [event_entry(
+        MatchEventKind.substitution, MatchEventAction.created, db_substitution.id,
+        SubstitutionRead.model_validate(db_substitution),
+    )])
     
     # Audit Log
     record_audit_log(
@@ -60,6 +72,9 @@ def create_substitution(
 def read_substitutions_by_match(
     *, session: Session = Depends(get_session), match_id: uuid.UUID
 ):
+    live = live_engine.snapshot(match_id)
+    if live is not None:
+        return live.substitutions
     substitutions = session.exec(select(Substitution).where(Substitution.match_id == match_id)).all()
     return substitutions
 
@@ -70,6 +85,9 @@ def delete_substitution(
     substitution_id: uuid.UUID,
     current_user: User = Depends(get_current_referee)
 ):
+    if live_engine.delete_substitution(session, substitution_id, current_user):
+        return {"ok": True}
+
     substitution = session.get(Substitution, substitution_id)
     if not substitution:
         raise HTTPException(status_code=404, detail="Substitution not found")
@@ -87,5 +105,8 @@ def delete_substitution(
     )
 
     session.delete(substitution)
+    append_match_events(session, substitution.match_id, [
+        event_entry(MatchEventKind.substitution, MatchEventAction.deleted, substitution_id)
+    ])
     session.commit()
     return {"ok": True}
@@ -1,16 +1,21 @@
 import uuid
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload
-from app.core.database import get_session
+from app.core.database import get_session, get_read_session
 from app.models.team import Team, TeamCreate, TeamRead, TeamUpdate, TeamReadWithTournaments, TeamReadDetail
 from app.models.standing import Standing
 from app.models.tournament import Tournament, TournamentRead, TournamentReadWithCompetition
 from app.api.v1.deps import get_current_tournament_admin, get_current_superuser, get_current_active_user
 from app.models.user import User, UserRole
 from app.core.audit import record_audit_log
+from app.core.leaderboard import invalidate_leaders
 from app.core.supabase_client import get_signed_url, get_signed_urls_batch
+from app.core.query_stats import query_budget
+from app.core.fieldsets import FIELDS_DESCRIPTION, load_columns, parse_fields, pick, sparse_adapter, sparse_response
+from app.core.streaming import STREAM_BATCH_SIZE, stream_rows, wants_stream
 
 from app.models.competition import Competition
 
@@ -81,49 +86,76 @@ def create_team(
     
 class TeamReadWithTournament(TeamRead):
     tournament: Optional[TournamentRead] = None
-    
-@router.get("/", response_model=List[TeamReadWithTournament])
+
+_team_adapter = TypeAdapter(TeamReadWithTournament)
+
+def _team_rows(session: Session, teams: List[Team], names: Optional[tuple[str, ...]] = None) -> List[dict]:
+    """
+    Response rows for a batch of teams: their tournaments are fetched in one
+    query and logo URLs signed in one batch. With `?fields=` (`names`) only
+    those keys are built, from teams loaded with just those columns.
+    """
+    def wanted(name: str) -> bool:
+        return names is None or name in names
+
+    tournaments_map = {}
+    tournament_ids = {t.tournament_id for t in teams if t.tournament_id} if wanted("tournament") else set()
+    if tournament_ids:
+        tournaments = session.exec(select(Tournament).where(Tournament.id.in_(tournament_ids))).all()
+        tournaments_map = {t.id: t for t in tournaments}
+
+    logo_paths = [t.logo_url for t in teams if t.logo_url] if wanted("logo_url") else []
+    signed_urls = get_signed_urls_batch(logo_paths) if logo_paths else {}
+
+    rows = []
+    for t in teams:
+        row = t.model_dump() if names is None else pick(t, names)
+        if wanted("tournament"):
+            row["tournament"] = tournaments_map.get(t.tournament_id)
+        if wanted("logo_url"):
+            row["logo_url"] = signed_urls.get(t.logo_url, "") if t.logo_url else ""
+        rows.append(row)
+    return rows
+
+def _team_batches(session: Session, query, names: Optional[tuple[str, ...]] = None):
+    """Teams off a server-side cursor, turned into response rows per batch."""
+    for batch in session.exec(query.execution_options(yield_per=STREAM_BATCH_SIZE)).partitions():
+        yield _team_rows(session, batch, names)
+
+@router.get("/", response_model=List[TeamReadWithTournament], dependencies=[Depends(query_budget(4))])
 def read_teams(
-    session: Session = Depends(get_session),
+    request: Request,
+    stream: bool = Query(False, description="Send the list as a chunked JSON array (NDJSON with Accept: application/x-ndjson)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    session: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_active_user)
 ):
+    names = parse_fields(fields, TeamReadWithTournament)
     query = select(Team)
+    if names:
+        query = query.options(load_columns(Team, names, *([Team.tournament_id] if "tournament" in names else [])))
     
     if current_user.role == UserRole.TOURNAMENT_ADMIN:
         if current_user.tournament_id:
             query = query.where(Team.tournament_id == current_user.tournament_id)
         elif current_user.competition_id:
             query = query.join(Tournament).where(Tournament.competition_id == current_user.competition_id)
-            
+
+    if wants_stream(request, stream):
+        adapter = sparse_adapter(TeamReadWithTournament, names, many=False) if names else _team_adapter
+        return stream_rows(request, _team_batches(session, query, names), adapter)
+
     teams = session.exec(query).all()
-    
-    # Pre-load all needed tournaments in one query
-    tournament_ids = {t.tournament_id for t in teams if t.tournament_id}
-    tournaments_map = {}
-    if tournament_ids:
-        tournaments = session.exec(select(Tournament).where(Tournament.id.in_(tournament_ids))).all()
-        tournaments_map = {t.id: t for t in tournaments}
-    
-    # Batch sign all logo URLs
-    logo_paths = [t.logo_url for t in teams if t.logo_url]
-    signed_urls = get_signed_urls_batch(logo_paths) if logo_paths else {}
-    
-    result = []
-    for t in teams:
-        tt = TeamReadWithTournament.model_validate(t)
-        if t.tournament_id and t.tournament_id in tournaments_map:
-            tt.tournament = TournamentRead.model_validate(tournaments_map[t.tournament_id])
-        
-        tt_dict = tt.model_dump()
-        tt_dict["logo_url"] = signed_urls.get(t.logo_url, "") if t.logo_url else ""
-        result.append(tt_dict)
-    return result
+    rows = _team_rows(session, teams, names)
+    if names:
+        return sparse_response(TeamReadWithTournament, names, rows)
+    return rows
 
 
-@router.get("/{team_id}", response_model=TeamReadDetail)
+@router.get("/{team_id}", response_model=TeamReadDetail, dependencies=[Depends(query_budget(7))])
 def read_team(
     *,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
     team_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -215,6 +247,7 @@ def update_team(
             raise HTTPException(status_code=403, detail="Tournament Admins can only update teams for their assigned tournament")
             
     team_data = team.model_dump(exclude_unset=True)
+    previous_tournament_id = db_team.tournament_id
     
     # Prevent persisting signed URLs (absolute URLs)
     if "logo_url" in team_data and team_data["logo_url"] and team_data["logo_url"].startswith("http"):
@@ -255,6 +288,9 @@ def update_team(
     )
 
     session.commit()
+    # Leaders show team names
+    for tournament_id in {previous_tournament_id, team.tournament_id} - {None}:
+        invalidate_leaders(tournament_id)
     session.refresh(db_team)
     
     res = db_team.model_dump()
@@ -286,6 +322,8 @@ def delete_team(
         description=f"Deleted team: {db_team.name}"
     )
 
+    tournament_id = db_team.tournament_id
     session.delete(db_team)
     session.commit()
+    invalidate_leaders(tournament_id)
     return {"ok": True}
@@ -1,19 +1,35 @@
 import uuid
 from datetime import datetime, timedelta
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from app.core.database import get_session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_session, get_read_async_session
 from app.models.tournament import Tournament, TournamentCreate, TournamentRead, TournamentUpdate, TournamentReadWithTeams, TournamentScheduleCreate, TournamentKnockoutCreate, TournamentReadWithCompetition
 from app.models.match import Match, MatchStatus
-from app.api.v1.deps import get_current_tournament_admin, get_current_superuser, get_current_management_admin, get_current_active_user
+from app.api.v1.deps import get_current_tournament_admin, get_current_superuser, get_current_management_admin, get_current_active_user, get_current_active_user_async
 from sqlalchemy.orm import selectinload
 from app.models.user import User, UserRole
 from app.core.audit import record_audit_log
 from app.core.supabase_client import get_signed_url, get_signed_urls_batch
+from app.core.leaderboard import MAX_LEADERS_LIMIT, LeaderStat, PlayerLeaderRead, get_leaders_body
+from app.core.query_stats import query_budget
+from app.core.fieldsets import FIELDS_DESCRIPTION, load_columns, parse_fields, pick, sparse_response
 
 router = APIRouter()
 
+
+def _bulk_insert_matches(session: Session, rows: List[dict]) -> int:
+    """
+    Persist generated fixtures as multi-row INSERTs (up to 1000 rows per
+    statement) instead of building and flushing one ORM object per match.
+    Column defaults, including the id, are filled in by SQLAlchemy.
+    """
+    if rows:
+        session.exec(insert(Match), params=rows)
+    return len(rows)
+
 @router.post("/", response_model=TournamentRead)
 def create_tournament(
     *, 
@@ -32,41 +48,51 @@ def create_tournament(
     
     return db_tournament.model_dump()
 
-@router.get("/", response_model=List[TournamentReadWithCompetition])
-def read_tournaments(
+@router.get("/", response_model=List[TournamentReadWithCompetition], dependencies=[Depends(query_budget(4))])
+async def read_tournaments(
     *,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user)
+    session: AsyncSession = Depends(get_read_async_session),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    current_user: User = Depends(get_current_active_user_async)
 ):
-    query = select(Tournament).options(selectinload(Tournament.competition))
+    names = parse_fields(fields, TournamentReadWithCompetition)
+    with_competition = names is None or "competition" in names
+
+    query = select(Tournament)
+    if names:
+        query = query.options(load_columns(Tournament, names, *([Tournament.competition_id] if with_competition else [])))
+    if with_competition:
+        query = query.options(selectinload(Tournament.competition))
     
     if current_user.role == UserRole.TOURNAMENT_ADMIN and current_user.tournament_id:
         query = query.where(Tournament.id == current_user.tournament_id)
     elif current_user.role == UserRole.TOURNAMENT_ADMIN and current_user.competition_id:
         query = query.where(Tournament.competition_id == current_user.competition_id)
             
-    tournaments = session.exec(query).all()
+    tournaments = (await session.exec(query)).all()
 
-    paths = [t.competition.image_url for t in tournaments if t.competition and t.competition.image_url]
-    signed = get_signed_urls_batch(paths) if paths else {}
+    paths = [t.competition.image_url for t in tournaments if t.competition and t.competition.image_url] if with_competition else []
+    signed = await run_in_threadpool(get_signed_urls_batch, paths) if paths else {}
 
     results = []
     for t in tournaments:
-        t_dict = t.model_dump()
-        if t.competition:
+        t_dict = t.model_dump() if names is None else pick(t, names)
+        if with_competition and t.competition:
             comp_dict = t.competition.model_dump()
             comp_dict["image_url"] = signed.get(t.competition.image_url, "") if t.competition.image_url else ""
             t_dict["competition"] = comp_dict
         results.append(t_dict)
 
+    if names:
+        return sparse_response(TournamentReadWithCompetition, names, results)
     return results
 
-@router.get("/{tournament_id}", response_model=TournamentReadWithTeams)
-def read_tournament(
+@router.get("/{tournament_id}", response_model=TournamentReadWithTeams, dependencies=[Depends(query_budget(5))])
+async def read_tournament(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_read_async_session),
     tournament_id: uuid.UUID,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user_async)
 ):
     # Single query with eager load: competition + registered_teams (teams in this tournament)
     query = (
@@ -77,7 +103,7 @@ def read_tournament(
             selectinload(Tournament.registered_teams),
         )
     )
-    tournament = session.exec(query).first()
+    tournament = (await session.exec(query)).first()
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
@@ -96,7 +122,7 @@ def read_tournament(
     for team in tournament.registered_teams:
         if team.logo_url:
             paths_to_sign.append(team.logo_url)
-    signed = get_signed_urls_batch(paths_to_sign) if paths_to_sign else {}
+    signed = await run_in_threadpool(get_signed_urls_batch, paths_to_sign) if paths_to_sign else {}
 
     if tournament.competition:
         comp_dict = tournament.competition.model_dump()
@@ -112,6 +138,31 @@ def read_tournament(
     res["teams"] = teams_signed
     return res
 
+@router.get("/{tournament_id}/leaders", response_model=List[PlayerLeaderRead], dependencies=[Depends(query_budget(3))])
+def read_tournament_leaders(
+    *,
+    request: Request,
+    # Primary, not a replica: the result is cached until the next goal/card write
+    # invalidates it, so a lagging replica read would stay cached for the full TTL
+    session: Session = Depends(get_session),
+    tournament_id: uuid.UUID,
+    stat: LeaderStat = Query(LeaderStat.goals),
+    limit: int = Query(10, ge=1, le=MAX_LEADERS_LIMIT),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Top scorers / assisters / most-booked players, aggregated from goal and card rows."""
+    tournament = session.get(Tournament, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    if current_user.role == UserRole.TOURNAMENT_ADMIN:
+        if current_user.tournament_id and current_user.tournament_id != tournament_id:
+            raise HTTPException(status_code=403, detail="Not authorized to access this tournament")
+        if current_user.competition_id and tournament.competition_id != current_user.competition_id:
+            raise HTTPException(status_code=403, detail="Not authorized to access this tournament")
+
+    return get_leaders_body(session, tournament_id, stat, limit).response(request)
+
 @router.put("/{tournament_id}", response_model=TournamentRead)
 def update_tournament(
     *, 
@@ -252,7 +303,7 @@ def schedule_tournament(
             if referees:
                 assigned_referee_id = referees[match_count % len(referees)].id
 
-            db_match = Match(
+            created_matches.append(dict(
                 tournament_id=tournament_id,
                 team_a_id=t1,
                 team_b_id=t2,
@@ -261,9 +312,7 @@ def schedule_tournament(
                 total_time=schedule.total_time,
                 match_day=round_idx + 1,
                 referee_id=assigned_referee_id
-            )
-            session.add(db_match)
-            created_matches.append(db_match)
+            ))
             
             # Simple scheduling strategy:
             # Increment time if we've filled the "day" quota
@@ -275,7 +324,9 @@ def schedule_tournament(
         # we might want to ensure next round is at least next interval?
         # For now, simplistic approach respecting matches_per_day is safer for general use.
         # If user wants 1 round per week: matches_per_day = teams/2, interval = 7.
-                
+
+    _bulk_insert_matches(session, created_matches)
+
     # Audit Log
     record_audit_log(
         session,
@@ -370,7 +421,7 @@ def generate_knockout_fixtures(
         if referees:
             assigned_referee_id = referees[len(created_matches) % len(referees)].id
 
-        db_match = Match(
+        created_matches.append(dict(
             tournament_id=tournament_id,
             team_a_id=t1,
             team_b_id=t2,
@@ -380,9 +431,7 @@ def generate_knockout_fixtures(
             match_day=1,
             stage=stage_name,
             referee_id=assigned_referee_id
-        )
-        session.add(db_match)
-        created_matches.append(db_match)
+        ))
         
         # Increment time based on matches_per_day
         if schedule.matches_per_day > 0 and len(created_matches) % schedule.matches_per_day == 0:
@@ -391,7 +440,9 @@ def generate_knockout_fixtures(
     # Note: For now, we only generate the first round. 
     # Subsequent rounds depend on winners of these matches.
     # The teams_with_bye would enter in the next stage.
-    
+
+    _bulk_insert_matches(session, created_matches)
+
     # Audit Log
     record_audit_log(
         session,
@@ -1,6 +1,6 @@
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Response
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Response
 from sqlmodel import Session, select, func
 from app.core.database import get_session
 from app.models.user import User, UserCreate, UserRead, UserUpdate, UserRole
@@ -10,6 +10,7 @@ from app.core.audit import record_audit_log
 from app.core.security import get_password_hash, create_password_reset_token
 from app.core.email import send_invitation_email
 from app.core.supabase_client import get_signed_url
+from app.core.pagination import paginate, set_next_cursor
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -109,13 +110,15 @@ def read_users(
     role: Optional[UserRole] = None,
     offset: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from the previous page; replaces offset"),
     response: Response = None,
 ):
     """
-    List users.
+    List users in creation order, oldest first.
     - Super Admins see all users.
     - Tournament Admins see only users belonging to their tournament.
     Supports role filtering via ?role= query param.
+    Cursor pages skip the X-Total-Count query.
     """
     statement = select(User).where(User.is_deleted == False)  # type: ignore[comparison-overlap]
 
@@ -126,19 +129,21 @@ def read_users(
     if role:
         statement = statement.where(User.role == role)
 
-    total = session.exec(
-        select(func.count()).select_from(statement.subquery())
-    ).one()
+    if not cursor and response is not None:
+        total = session.exec(
+            select(func.count()).select_from(statement.subquery())
+        ).one()
+        response.headers["X-Total-Count"] = str(total)
 
-    users = session.exec(statement.offset(offset).limit(limit)).all()
+    statement = paginate(statement, User.created_at, User.id, cursor=cursor, offset=offset, limit=limit, descending=False)
+    users = session.exec(statement).all()
+    set_next_cursor(response, users, "created_at", limit)
     result = []
     for u in users:
         u_dict = u.model_dump()
         u_dict["profile_image_url"] = get_signed_url(u.profile_image_url)
         u_dict["has_password"] = bool(u.hashed_password)
         result.append(u_dict)
-    if response is not None:
-        response.headers["X-Total-Count"] = str(total)
     return result
 
 
@@ -1,5 +1,6 @@
+import uuid
 from datetime import datetime, timezone
-from sqlmodel import Session
+from sqlmodel import Session, insert
 from app.models.audit_log import AuditLog
 
 def record_audit_log(
@@ -21,3 +22,19 @@ def record_audit_log(
     )
     session.add(db_log)
     # We don't commit here to allow it to be part of the caller's transaction
+
+def audit_log_row(action: str, entity_type: str, entity_id: str, description: str) -> dict:
+    """Column values of one audit log entry, for `record_audit_logs` or a write-behind queue."""
+    return dict(
+        id=uuid.uuid4(),
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        description=description,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+def record_audit_logs(session: Session, rows: list[dict]) -> None:
+    """Record many `audit_log_row` entries with one multi-row INSERT, in the caller's transaction."""
+    if rows:
+        session.exec(insert(AuditLog), params=rows)
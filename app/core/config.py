@@ -12,6 +12,47 @@ class Settings(BaseSettings):
     # Optional overrides for specific environments
     DATABASE_URL_DEV: Optional[str] = None
     DATABASE_URL_TEST: Optional[str] = None
+    # Optional read replicas — comma-separated URLs. Safe GETs are spread over them;
+    # a client's reads stay on the primary for REPLICA_STICKY_SECONDS after its own write.
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_STICKY_SECONDS: int = 10
+    # How long a replica that failed to connect is skipped before being retried
+    REPLICA_RETRY_SECONDS: int = 30
+
+    # Connection pool: profile "direct" (default), "pgbouncer-transaction" or "serverless";
+    # the DB_POOL_* values below override the profile's defaults when set.
+    DB_POOL_PROFILE: str = "direct"
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+
+    # Slow-query log: statements slower than SLOW_QUERY_MS (0 disables) go to an
+    # in-memory ring buffer; a sample of the SELECTs is re-run under EXPLAIN ANALYZE.
+    SLOW_QUERY_MS: float = 500
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_BUFFER_SIZE: int = 100
+
+    # Response compression (brotli or gzip, as the client accepts): bodies smaller
+    # than COMPRESSION_MIN_SIZE bytes are sent as is; streamed bodies are always compressed.
+    COMPRESSION_MIN_SIZE: int = 1024
+
+    # In-memory live-match engine (single worker only): goal/card/substitution writes for
+    # live matches are journaled to LIVE_JOURNAL_PATH and written to Postgres in batches
+    # every LIVE_FLUSH_SECONDS; unflushed journal entries are replayed on startup.
+    LIVE_ENGINE_ENABLED: bool = False
+    LIVE_FLUSH_SECONDS: float = 0.5
+    LIVE_JOURNAL_PATH: str = "live_journal.jsonl"
+
+    # Idempotency-Key on referee write endpoints: responses are kept per process for
+    # IDEMPOTENCY_TTL_SECONDS, at most IDEMPOTENCY_MAX_KEYS at a time (oldest dropped first).
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60
+    IDEMPOTENCY_MAX_KEYS: int = 20000
+
+    @property
+    def DATABASE_REPLICA_URL_LIST(self) -> List[str]:
+        return [u.strip() for u in self.DATABASE_REPLICA_URLS.split(",") if u.strip()]
 
     SUPABASE_PROJECT_URL: str
     SUPABASE_PUBLISHABLE_KEY: str
@@ -1,5 +1,21 @@
+import itertools
+import logging
+import time
+import uuid
+from typing import Optional
+from fastapi import Request
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
+from app.core.security import bearer_subject
+from app.core.pool_metrics import TimedAsyncQueuePool, TimedQueuePool, register_pool
+from app.core.slow_query import install_slow_query_log
+
+logger = logging.getLogger(__name__)
 
 
 def _get_database_url() -> str:
@@ -18,17 +34,222 @@ def _get_database_url() -> str:
     return settings.DATABASE_URL
 
 
-# Neon/PgBouncer often works best with simplified connect_args when the URL already contains them.
-engine = create_engine(
-    _get_database_url(),
-    pool_size=10,
-    max_overflow=5,
-    pool_pre_ping=True,       # Tests connection before use
-    pool_recycle=300          # Recycle connections every 5 minutes
-)
+def _get_async_database_url(database_url: Optional[str] = None) -> tuple[URL, dict]:
+    """
+    Same database as `_get_database_url` (or the given URL), addressed through asyncpg.
+
+    libpq-only query options (sslmode, channel_binding) are not understood by
+    asyncpg, so sslmode is translated into its `ssl` connect argument.
+    """
+    url = make_url(database_url or _get_database_url())
+    query = dict(url.query)
+    query.pop("channel_binding", None)
+    sslmode = query.pop("sslmode", None)
+    connect_args = {"ssl": sslmode} if sslmode else {}
+    return url.set(drivername="postgresql+asyncpg", query=query), connect_args
+
+
+# Pool profiles (DB_POOL_PROFILE); individual DB_POOL_* settings override them.
+# - direct: app talks to Postgres itself, moderate pool, server-side prepared statements fine.
+# - pgbouncer-transaction: PgBouncer (e.g. Neon "-pooler" host) multiplexes connections,
+#   so the app pool can be larger, but prepared statements must be off: consecutive
+#   statements may land on different server connections.
+# - serverless: short-lived processes; no pooling in the app, the pooler owns connections.
+POOL_PROFILES: dict[str, dict] = {
+    "direct": {
+        "pool_size": 10, "max_overflow": 5, "pool_timeout": 30, "pool_recycle": 300,
+        "pool_pre_ping": True, "prepared_statements": True, "pooled": True,
+    },
+    "pgbouncer-transaction": {
+        "pool_size": 20, "max_overflow": 10, "pool_timeout": 10, "pool_recycle": 300,
+        "pool_pre_ping": True, "prepared_statements": False, "pooled": True,
+    },
+    "serverless": {
+        "pool_size": 0, "max_overflow": 0, "pool_timeout": 10, "pool_recycle": -1,
+        "pool_pre_ping": False, "prepared_statements": False, "pooled": False,
+    },
+}
+
+
+def _pool_config() -> dict:
+    """Selected profile with any explicit DB_POOL_* overrides applied."""
+    if settings.DB_POOL_PROFILE not in POOL_PROFILES:
+        raise ValueError(
+            f"Unknown DB_POOL_PROFILE {settings.DB_POOL_PROFILE!r}; "
+            f"expected one of {', '.join(POOL_PROFILES)}"
+        )
+    config = dict(POOL_PROFILES[settings.DB_POOL_PROFILE])
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    config.update({k: v for k, v in overrides.items() if v is not None})
+    return config
+
+
+def _create_engine(url: str):
+    config = _pool_config()
+    if not config["pooled"]:
+        return create_engine(url, poolclass=NullPool)
+    # psycopg2 never prepares statements server-side, so nothing to disable here
+    return create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_size=config["pool_size"],
+        max_overflow=config["max_overflow"],
+        pool_timeout=config["pool_timeout"],
+        pool_pre_ping=config["pool_pre_ping"],   # Tests connection before use
+        pool_recycle=config["pool_recycle"],     # Recycle connections (default every 5 minutes)
+    )
+
+
+def _create_async_engine(database_url: Optional[str] = None):
+    config = _pool_config()
+    url, connect_args = _get_async_database_url(database_url)
+    if not config["prepared_statements"]:
+        # asyncpg prepares every statement; behind PgBouncer (transaction mode) turn
+        # off both caches and use unique names so statements never collide
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+    if not config["pooled"]:
+        return create_async_engine(url, connect_args=connect_args, poolclass=NullPool)
+    return create_async_engine(
+        url,
+        connect_args=connect_args,
+        poolclass=TimedAsyncQueuePool,
+        pool_size=config["pool_size"],
+        max_overflow=config["max_overflow"],
+        pool_timeout=config["pool_timeout"],
+        pool_pre_ping=config["pool_pre_ping"],
+        pool_recycle=config["pool_recycle"],
+    )
+
+
+engine = _create_engine(_get_database_url())
+
+# Async engine for hot read paths: requests await the database on the event loop
+# instead of holding one of the threadpool's workers for the whole round trip.
+async_engine = _create_async_engine()
+
+# Read replicas (optional). Same pool shape as the primary, one pool per replica.
+replica_engines = [_create_engine(url) for url in settings.DATABASE_REPLICA_URL_LIST]
+async_replica_engines = [_create_async_engine(url) for url in settings.DATABASE_REPLICA_URL_LIST]
+
+register_pool("primary", engine)
+register_pool("primary-async", async_engine.sync_engine)
+for _i, (_replica, _async_replica) in enumerate(zip(replica_engines, async_replica_engines)):
+    register_pool(f"replica-{_i}", _replica)
+    register_pool(f"replica-{_i}-async", _async_replica.sync_engine)
+
+for _engine in [engine, async_engine.sync_engine, *replica_engines, *(e.sync_engine for e in async_replica_engines)]:
+    install_slow_query_log(_engine)
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Read-your-writes: { client_key: sticky_until_timestamp } (per process)
+_recent_writers: dict[str, float] = {}
+# Replicas that failed to connect: { replica_index: retry_after_timestamp }
+_replica_down_until: dict[int, float] = {}
+_replica_cycle = itertools.count()
+
+
+def _session_info(request: Request) -> dict:
+    """Tag sessions with the route they serve (shown in the slow-query log)."""
+    route = request.scope.get("route")
+    return {"route": f"{request.method} {getattr(route, 'path', request.url.path)}"}
+
+
+def _client_key(request: Request) -> Optional[str]:
+    """Identify the caller by its user (token `sub`), falling back to its address."""
+    subject = bearer_subject(request.headers.get("authorization"))
+    if subject is not None:
+        return subject
+    return request.client.host if request.client else None
+
+
+def note_write(request: Request) -> None:
+    """Pin the caller's reads to the primary for the sticky window."""
+    key = _client_key(request)
+    if key is None:
+        return
+    now = time.time()
+    if len(_recent_writers) > 10_000:
+        for k, until in list(_recent_writers.items()):
+            if until <= now:
+                _recent_writers.pop(k, None)
+    _recent_writers[key] = now + settings.REPLICA_STICKY_SECONDS
+
+
+def _pick_replica(request: Request) -> Optional[int]:
+    """Index of the replica to serve this request, or None for the primary."""
+    if not replica_engines or request.method not in _SAFE_METHODS:
+        return None
+    now = time.time()
+    key = _client_key(request)
+    if key is not None and _recent_writers.get(key, 0) > now:
+        return None
+    healthy = [i for i in range(len(replica_engines)) if _replica_down_until.get(i, 0) <= now]
+    if not healthy:
+        return None
+    return healthy[next(_replica_cycle) % len(healthy)]
+
+
+def _mark_replica_down(index: int, exc: Exception) -> None:
+    logger.warning("Read replica %d unavailable, failing over to primary: %s", index, exc)
+    _replica_down_until[index] = time.time() + settings.REPLICA_RETRY_SECONDS
+
+
+def get_session(request: Request):
+    if request.method not in _SAFE_METHODS:
+        note_write(request)
+    with Session(engine, info=_session_info(request)) as session:
+        yield session
+
+async def get_async_session():
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+def get_read_session(request: Request):
+    """
+    Session for read-only endpoints: a replica when one is configured and
+    healthy, otherwise (or right after the caller's own write) the primary.
+    """
+    index = _pick_replica(request)
+    if index is not None:
+        try:
+            conn = replica_engines[index].connect()
+        except DBAPIError as e:
+            _mark_replica_down(index, e)
+        else:
+            try:
+                with Session(bind=conn, info=_session_info(request)) as session:
+                    yield session
+            finally:
+                conn.close()
+            return
+    with Session(engine, info=_session_info(request)) as session:
+        yield session
 
-def get_session():
-    with Session(engine) as session:
+async def get_read_async_session(request: Request):
+    """Async counterpart of `get_read_session`."""
+    index = _pick_replica(request)
+    if index is not None:
+        try:
+            conn = await async_replica_engines[index].connect()
+        except (DBAPIError, OSError) as e:
+            _mark_replica_down(index, e)
+        else:
+            try:
+                async with AsyncSession(bind=conn, expire_on_commit=False, info=_session_info(request)) as session:
+                    yield session
+            finally:
+                await conn.close()
+            return
+    async with AsyncSession(async_engine, expire_on_commit=False, info=_session_info(request)) as session:
         yield session
 
 def create_db_and_tables():
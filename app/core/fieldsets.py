@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Any, List, Optional
+from fastapi import HTTPException
+from pydantic import TypeAdapter, create_model, field_validator
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from sqlmodel import SQLModel
+from app.core.responses import FastJSONResponse
+
+FIELDS_DESCRIPTION = "Comma-separated fields to return, e.g. `id,name,logo_url`; omit for the full representation"
+
+
+def parse_fields(fields: Optional[str], model: type[SQLModel]) -> Optional[tuple[str, ...]]:
+    """
+    `?fields=` as a tuple of field names of `model` (in the model's own order),
+    or None when the parameter is absent. Unknown names are rejected with 400.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise HTTPException(status_code=400, detail="fields must name at least one field")
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+@lru_cache(maxsize=None)
+def _column_keys(entity: type[SQLModel]) -> frozenset[str]:
+    return frozenset(inspect(entity).column_attrs.keys())
+
+
+def load_columns(entity: type[SQLModel], names: tuple[str, ...], *always):
+    """
+    `load_only` for the requested columns of `entity`, plus `always`: columns
+    the endpoint itself needs (sort keys, foreign keys of requested relations).
+    """
+    columns = [getattr(entity, name) for name in names if name in _column_keys(entity)]
+    return load_only(*columns, *always)
+
+
+def pick(row: SQLModel, names: tuple[str, ...]) -> dict[str, Any]:
+    """The requested column values of a row loaded with `load_columns` (no deferred loads)."""
+    keys = _column_keys(type(row))
+    return {name: getattr(row, name) for name in names if name in keys}
+
+
+@lru_cache(maxsize=256)
+def sparse_adapter(model: type[SQLModel], names: tuple[str, ...], many: bool = True) -> TypeAdapter:
+    """
+    TypeAdapter for `model` narrowed to `names` (a list of them when `many`).
+    The field validators of the kept fields still run.
+    """
+    validators = {}
+    for key, decorator in model.__pydantic_decorators__.field_validators.items():
+        kept = [name for name in decorator.info.fields if name in names]
+        if kept:
+            func = getattr(decorator.func, "__func__", decorator.func)  # unbind the classmethod
+            validators[key] = field_validator(*kept, mode=decorator.info.mode)(func)
+    partial = create_model(
+        f"{model.__name__}Fields",
+        __validators__=validators,
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in names},
+    )
+    return TypeAdapter(List[partial] if many else partial)
+
+
+def sparse_response(model: type[SQLModel], names: tuple[str, ...], rows: list) -> FastJSONResponse:
+    """Serialize rows (dicts or partially loaded ORM objects) with only `names`."""
+    adapter = sparse_adapter(model, names)
+    return FastJSONResponse(adapter.dump_json(adapter.validate_python(rows, from_attributes=True)))
@@ -0,0 +1,147 @@
+import hashlib
+import re
+import time
+from typing import Optional
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.core.security import bearer_subject
+
+# Referee writes that are retried over flaky connections
+_IDEMPOTENT_PATHS = re.compile(
+    re.escape(settings.API_V1_STR) + r"/(goals|cards|substitutions)/|" +
+    re.escape(settings.API_V1_STR) + r"/matches/[^/]+/events:batch"
+)
+
+_MAX_KEY_LENGTH = 255
+
+# In-memory store: { key digest: (body fingerprint, status, raw headers, body, expiry_timestamp) }.
+# Every entry lives IDEMPOTENCY_TTL_SECONDS, so insertion order is expiry order.
+_responses: dict[bytes, tuple[bytes, int, list, bytes, float]] = {}
+# Key digests whose first request is still running
+_in_flight: set[bytes] = set()
+
+
+def _digest(*parts: bytes) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(len(part).to_bytes(4, "big"))
+        h.update(part)
+    return h.digest()
+
+
+def _store(key: bytes, entry: tuple) -> None:
+    now = time.time()
+    while _responses:
+        oldest = next(iter(_responses))
+        if _responses[oldest][4] > now and len(_responses) < settings.IDEMPOTENCY_MAX_KEYS:
+            break
+        del _responses[oldest]
+    _responses[key] = entry
+
+
+def _lookup(key: bytes) -> Optional[tuple]:
+    entry = _responses.get(key)
+    if entry is not None and entry[4] <= time.time():
+        del _responses[key]
+        return None
+    return entry
+
+
+class IdempotencyMiddleware:
+    """
+    Replays the stored response for a repeated `Idempotency-Key` on referee write
+    endpoints, without running the request again. Keys are scoped to the
+    authenticated user (token `sub`), the method and the path; requests without a
+    valid token pass through and are rejected by the endpoint. Reusing a key with a different body is
+    rejected (422); a retry while the first request is still running gets 409.
+    Responses under 500 are kept for IDEMPOTENCY_TTL_SECONDS, per process.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not _IDEMPOTENT_PATHS.fullmatch(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get("idempotency-key")
+        principal = bearer_subject(headers.get("authorization")) if idempotency_key is not None else None
+        if principal is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > _MAX_KEY_LENGTH:
+            response = FastJSONResponse(
+                {"detail": f"Idempotency-Key must be 1 to {_MAX_KEY_LENGTH} characters"}, status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        # Buffer the body: it is fingerprinted, then handed to the app unchanged
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        key = _digest(
+            principal.encode(), scope["method"].encode(), scope["path"].encode(), idempotency_key.encode()
+        )
+        fingerprint = _digest(body)
+        entry = _lookup(key)
+        if entry is not None or key in _in_flight:
+            if entry is None:
+                response = FastJSONResponse(
+                    {"detail": "A request with this Idempotency-Key is still being processed"}, status_code=409
+                )
+            elif entry[0] != fingerprint:
+                response = FastJSONResponse(
+                    {"detail": "Idempotency-Key was already used with a different request body"}, status_code=422
+                )
+            else:
+                _, status, raw_headers, stored_body, _ = entry
+                await send({
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": [*raw_headers, (b"idempotent-replayed", b"true")],
+                })
+                await send({"type": "http.response.body", "body": stored_body})
+                return
+            await response(scope, receive, send)
+            return
+
+        replayed = False
+
+        async def receive_buffered() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status = 500
+        raw_headers: list = []
+        response_chunks: list[bytes] = []
+
+        async def send_and_capture(message: Message):
+            nonlocal status, raw_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                raw_headers = list(message["headers"])
+            elif message["type"] == "http.response.body":
+                response_chunks.append(message.get("body", b""))
+            await send(message)
+
+        _in_flight.add(key)
+        try:
+            await self.app(scope, receive_buffered, send_and_capture)
+        finally:
+            _in_flight.discard(key)
+        # Server errors are not kept: the client may retry them
+        if status < 500:
+            expiry = time.time() + settings.IDEMPOTENCY_TTL_SECONDS
+            _store(key, (fingerprint, status, raw_headers, b"".join(response_chunks), expiry))
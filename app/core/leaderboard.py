@@ -0,0 +1,194 @@
+import time
+import uuid
+from enum import Enum
+from typing import List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy import case
+from sqlmodel import Session, SQLModel, func, select
+from app.core.compression import CachedBody
+from app.core.supabase_client import get_signed_urls_batch
+from app.models.card import Card, CardType
+from app.models.goal import Goal
+from app.models.match import Match
+from app.models.player import Player
+from app.models.team import Team
+
+
+class LeaderStat(str, Enum):
+    goals = "goals"
+    assists = "assists"
+    cards = "cards"
+
+
+class PlayerLeaderRead(SQLModel):
+    rank: int
+    player_id: uuid.UUID
+    player_name: str
+    team_id: uuid.UUID
+    team_name: str
+    image_url: Optional[str] = None
+    value: int
+    yellow_cards: Optional[int] = None
+    red_cards: Optional[int] = None
+
+
+# Largest `limit` served; one board of this size is cached per tournament and stat
+MAX_LEADERS_LIMIT = 100
+
+# In-memory cache: { (tournament_id, stat): (top MAX_LEADERS_LIMIT rows, expiry_timestamp) }
+_leaders_cache: dict[tuple[uuid.UUID, LeaderStat], tuple[list[dict], float]] = {}
+
+# Serialized responses (signed image URLs, compressed variants) per (tournament_id, stat, limit).
+# Signed URLs stay valid for 60 minutes, well past the TTL.
+_leaders_body_cache: dict[tuple[uuid.UUID, LeaderStat, int], tuple[CachedBody, float]] = {}
+
+# Safety net only — goal/card, match, player and team writes invalidate explicitly
+_CACHE_TTL = 10 * 60
+
+# Entries per cache; expired entries, then the oldest, are dropped to make room
+_CACHE_MAX_ENTRIES = 1000
+
+_leaders_adapter = TypeAdapter(List[PlayerLeaderRead])
+
+
+def _cache_put(cache: dict, key, value) -> None:
+    """Store `value` for _CACHE_TTL. Every entry has the same TTL, so insertion order is expiry order."""
+    now = time.time()
+    cache.pop(key, None)
+    for oldest in list(cache):
+        entry = cache.get(oldest)
+        if entry is not None and entry[1] > now and len(cache) < _CACHE_MAX_ENTRIES:
+            break
+        cache.pop(oldest, None)
+    cache[key] = (value, now + _CACHE_TTL)
+
+
+def _leaders_query(tournament_id: uuid.UUID, stat: LeaderStat, limit: int):
+    """Aggregate goal/card rows per player for one tournament, best first."""
+    if stat == LeaderStat.cards:
+        player_col = Card.player_id
+        value = func.count(Card.id)
+        yellow = func.sum(case((Card.type == CardType.yellow, 1), else_=0))
+        red = func.sum(case((Card.type == CardType.red, 1), else_=0))
+        agg = (
+            select(
+                player_col.label("player_id"),
+                value.label("value"),
+                yellow.label("yellow_cards"),
+                red.label("red_cards"),
+            )
+            .join(Match, Match.id == Card.match_id)
+            .where(Match.tournament_id == tournament_id)
+            .group_by(player_col)
+        )
+        order = [value.desc(), red.desc()]
+    else:
+        player_col = Goal.player_id if stat == LeaderStat.goals else Goal.assistant_id
+        value = func.count(Goal.id)
+        agg = (
+            select(player_col.label("player_id"), value.label("value"))
+            .join(Match, Match.id == Goal.match_id)
+            .where(Match.tournament_id == tournament_id, player_col.is_not(None))
+            .group_by(player_col)
+        )
+        if stat == LeaderStat.goals:
+            agg = agg.where(Goal.is_own_goal == False)  # noqa: E712
+        order = [value.desc()]
+
+    # Rank and cut inside the aggregate, then join names for the top rows only
+    agg = agg.order_by(*order, player_col).limit(limit).subquery()
+    columns = [
+        agg.c.player_id,
+        Player.name,
+        Player.team_id,
+        Team.name,
+        Player.image_url,
+        agg.c.value,
+    ]
+    final_order = [agg.c.value.desc()]
+    if stat == LeaderStat.cards:
+        columns += [agg.c.yellow_cards, agg.c.red_cards]
+        final_order.append(agg.c.red_cards.desc())
+    return (
+        select(*columns)
+        .join(Player, Player.id == agg.c.player_id)
+        .join(Team, Team.id == Player.team_id)
+        .order_by(*final_order, Player.name)
+    )
+
+
+def get_leaders(
+    session: Session,
+    tournament_id: uuid.UUID,
+    stat: LeaderStat,
+    limit: int = 10,
+) -> list[dict]:
+    """
+    Top players of a tournament for one stat, computed by SQL aggregation.
+    The top MAX_LEADERS_LIMIT are cached in memory until a write invalidates them,
+    and every `limit` is a slice of that board.
+    """
+    key = (tournament_id, stat)
+    cached = _leaders_cache.get(key)
+    if cached and cached[1] > time.time():
+        return cached[0][:limit]
+
+    rows = []
+    for rank, row in enumerate(
+        session.exec(_leaders_query(tournament_id, stat, MAX_LEADERS_LIMIT)).all(), start=1
+    ):
+        entry = {
+            "rank": rank,
+            "player_id": row[0],
+            "player_name": row[1],
+            "team_id": row[2],
+            "team_name": row[3],
+            "image_url": row[4],
+            "value": row[5],
+        }
+        if stat == LeaderStat.cards:
+            entry["yellow_cards"] = row[6]
+            entry["red_cards"] = row[7]
+        rows.append(entry)
+
+    _cache_put(_leaders_cache, key, rows)
+    return rows[:limit]
+
+
+def get_leaders_body(
+    session: Session,
+    tournament_id: uuid.UUID,
+    stat: LeaderStat,
+    limit: int = 10,
+) -> CachedBody:
+    """
+    The leaders response as cached JSON with signed image URLs. Its gzip/brotli
+    variants are kept with it, so repeat reads are neither re-serialized nor
+    re-compressed.
+    """
+    key = (tournament_id, stat, limit)
+    cached = _leaders_body_cache.get(key)
+    if cached and cached[1] > time.time():
+        return cached[0]
+
+    leaders = get_leaders(session, tournament_id, stat, limit)
+    paths = [l["image_url"] for l in leaders if l["image_url"]]
+    signed = get_signed_urls_batch(paths) if paths else {}
+    rows = [
+        {**l, "image_url": signed.get(l["image_url"], "") if l["image_url"] else ""}
+        for l in leaders
+    ]
+    body = CachedBody(_leaders_adapter.dump_json(_leaders_adapter.validate_python(rows)))
+    _cache_put(_leaders_body_cache, key, body)
+    return body
+
+
+def invalidate_leaders(tournament_id: Optional[uuid.UUID]) -> None:
+    """
+    Drop cached leaderboards of a tournament after a write that changes them: goals,
+    cards, match deletes, and player/team edits (leaders show names and photos).
+    """
+    for cache in (_leaders_cache, _leaders_body_cache):
+        for key in list(cache):
+            if key[0] == tournament_id:
+                cache.pop(key, None)
@@ -0,0 +1,689 @@
+import logging
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import groupby
+from typing import Callable, Iterator, List, Optional, TypeVar
+import orjson
+from fastapi import HTTPException
+from pydantic import AliasChoices
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import Field, Session, SQLModel, delete, select, update
+from app.core.config import settings
+from app.core.audit import audit_log_row
+from app.core.database import engine
+from app.core.leaderboard import invalidate_leaders
+from app.core.match_events import event_entry, last_event_seq
+from app.models.audit_log import AuditLog, AuditLogRead
+from app.models.card import Card, CardCreate, CardRead, CardReadWithPlayer, CardType
+from app.models.goal import Goal, GoalCreate, GoalRead, GoalReadWithPlayer
+from app.models.match import Match, MatchRead, MatchStatus
+from app.models.match_event import (
+    MatchEvent,
+    MatchEventAction,
+    MatchEventBatchRead,
+    MatchEventKind,
+    MatchEventRead,
+)
+from app.models.player import Player, PlayerRead
+from app.models.substitution import (
+    Substitution,
+    SubstitutionCreate,
+    SubstitutionRead,
+    SubstitutionReadWithPlayers,
+)
+from app.models.team import Team
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LiveMatchRead(MatchRead):
+    # Match stores these as goals_list / cards_list
+    goals: List[GoalReadWithPlayer] = Field(default=[], validation_alias=AliasChoices("goals", "goals_list"))
+    cards: List[CardReadWithPlayer] = Field(default=[], validation_alias=AliasChoices("cards", "cards_list"))
+    substitutions: List[SubstitutionReadWithPlayers] = []
+
+
+@dataclass
+class LiveMatch:
+    """Authoritative state of one live match: the match row plus its timeline."""
+    match: MatchRead
+    players: dict[uuid.UUID, PlayerRead]
+    goals: dict[uuid.UUID, GoalReadWithPlayer] = field(default_factory=dict)
+    cards: dict[uuid.UUID, CardReadWithPlayer] = field(default_factory=dict)
+    substitutions: dict[uuid.UUID, SubstitutionReadWithPlayers] = field(default_factory=dict)
+    # Event log entries recorded since the match was loaded; `seq` is the last one's
+    events: list[MatchEventRead] = field(default_factory=list)
+    seq: int = 0
+    # Serializes writes to this match; `evicted` is set under it once the engine drops the match
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    evicted: bool = False
+
+    @property
+    def referee_id(self) -> Optional[int]:
+        return self.match.referee_id
+
+    def read(self) -> LiveMatchRead:
+        by_minute = lambda e: e.minute
+        return LiveMatchRead.model_construct(
+            **dict(self.match),
+            goals=sorted(self.goals.values(), key=by_minute),
+            cards=sorted(self.cards.values(), key=by_minute),
+            substitutions=sorted(self.substitutions.values(), key=by_minute),
+        )
+
+
+# Journaled row inserts/deletes: table name -> (table model, read model used to decode the journal)
+_TABLES = {
+    "goal": (Goal, GoalRead),
+    "card": (Card, CardRead),
+    "substitution": (Substitution, SubstitutionRead),
+    "audit_logs": (AuditLog, AuditLogRead),
+    "match_event": (MatchEvent, MatchEventRead),
+}
+
+
+def _audit_row(action: str, match_id: uuid.UUID, description: str) -> dict:
+    return audit_log_row(action, "Match", str(match_id), description)
+
+
+def _decode(op: dict) -> dict:
+    """A journal line back into the op `_write_ops` expects (UUIDs, datetimes, enums)."""
+    op = {**op, "match_id": uuid.UUID(op["match_id"])}
+    if op["op"] == "insert":
+        read_model = _TABLES[op["table"]][1]
+        return {**op, "row": read_model.model_validate(op["row"]).model_dump()}
+    if op["op"] == "delete":
+        return {**op, "id": uuid.UUID(op["id"])}
+    return op
+
+
+def _bump_card_counts(session: Session, rows, step: int) -> None:
+    for player_id, card_type in rows:
+        column = Player.yellow_cards if card_type == CardType.yellow else Player.red_cards
+        session.exec(
+            update(Player).where(Player.id == player_id).values({column: func.greatest(column + step, 0)})
+        )
+
+
+def _bump_scores(session: Session, goals, step: int) -> None:
+    """Add `step` to the credited side's score per (match_id, team_id) goal, never below zero."""
+    for match_id, team_id in goals:
+        credited_a = Match.team_a_id == team_id
+        session.exec(
+            update(Match)
+            .where(Match.id == match_id)
+            .values(
+                score_a=case((credited_a, func.greatest(Match.score_a + step, 0)), else_=Match.score_a),
+                score_b=case((credited_a, Match.score_b), else_=func.greatest(Match.score_b + step, 0)),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _write_ops(session: Session, ops: list[dict], isolate: bool = False) -> set[uuid.UUID]:
+    """
+    Apply queued ops in order; returns the matches whose in-memory state no longer
+    matches what was written. Every op is idempotent (inserts carry their id and
+    skip conflicts; scores and card counts change only for goal/card rows actually
+    inserted or deleted), so replaying a journal tail is safe. Event log seqs are
+    taken here, after anything written to the match directly.
+    With `isolate`, the ops of each request run in one savepoint, and a request
+    that violates a constraint (e.g. its match was deleted meanwhile) is logged
+    and dropped whole.
+    """
+    stale = set()
+    if isolate:
+        for _, group in groupby(ops, key=lambda op: op["group"]):
+            group = list(group)
+            try:
+                with session.begin_nested():
+                    stale |= _write_ops(session, group)
+            except IntegrityError:
+                logger.exception("Dropping live match write %s", group[0]["seq"])
+                stale.add(group[0]["match_id"])
+        return stale
+    for op in ops:
+        model = _TABLES[op["table"]][0]
+        if op["op"] == "insert":
+            row = op["row"]
+            if model is MatchEvent:
+                seq = last_event_seq(session, row["match_id"]) + 1
+                if seq != row["seq"]:
+                    stale.add(row["match_id"])
+                row = {**row, "seq": seq}
+            stmt = pg_insert(model).values(**row).on_conflict_do_nothing(index_elements=["id"])
+            step = 1
+        else:
+            stmt = delete(model).where(model.id == op["id"])
+            step = -1
+        if model is Card:
+            _bump_card_counts(session, session.exec(stmt.returning(Card.player_id, Card.type)).all(), step)
+        elif model is Goal:
+            _bump_scores(session, session.exec(stmt.returning(Goal.match_id, Goal.team_id)).all(), step)
+        else:
+            session.exec(stmt)
+    return stale
+
+
+class LiveMatchEngine:
+    """
+    In-process state for matches with status `live`. Goal, card and substitution
+    writes are validated against memory, appended to a local journal (fsynced
+    before the request returns) and written to Postgres by a background thread
+    every LIVE_FLUSH_SECONDS, one transaction per batch. After a successful flush
+    the journal is checkpointed. On startup, journal entries past the last
+    checkpoint are replayed and live matches are reloaded from the database.
+
+    Each match has its own lock for writes; the engine lock only guards the
+    registry and the queue and is never held across database calls.
+    State is per process: enable it only with a single worker.
+    """
+
+    def __init__(self, journal_path: str, flush_seconds: float, enabled: bool = True):
+        self.enabled = enabled
+        self.journal_path = journal_path
+        self.flush_seconds = flush_seconds
+        self._matches: dict[uuid.UUID, LiveMatch] = {}
+        self._event_matches: dict[uuid.UUID, uuid.UUID] = {}  # goal/card/substitution id -> match id
+        self._detached: dict[uuid.UUID, int] = {}  # match id -> requests writing it directly
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._seq = 0
+        self._journal = None
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+
+    # ─── Lifecycle ────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if not self.enabled or self._writer is not None:
+            return
+        self._recover()
+        self._journal = open(self.journal_path, "ab")
+        with Session(engine) as session:
+            for match_id in session.exec(select(Match.id).where(Match.status == MatchStatus.live)).all():
+                self.get(session, match_id)
+        self._stop.clear()
+        self._writer = threading.Thread(target=self._run, name="live-match-writer", daemon=True)
+        self._writer.start()
+        logger.info("Live match engine started — %d live match(es)", len(self._matches))
+
+    def stop(self) -> None:
+        if self._writer is None:
+            return
+        self._stop.set()
+        self._writer.join()
+        self._writer = None
+        self.flush()
+        self._journal.close()
+        self._journal = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_seconds):
+            self.flush()
+
+    def _recover(self) -> None:
+        """Write journal entries past the last checkpoint to Postgres, then reset the journal."""
+        if not os.path.exists(self.journal_path):
+            return
+        ops: list[dict] = []
+        with open(self.journal_path, "rb") as journal:
+            for line in journal:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    break  # torn final write: it was never acknowledged
+                if "checkpoint" in entry:
+                    ops = [op for op in ops if op["seq"] > entry["checkpoint"]]
+                else:
+                    ops.append(entry)
+        if ops:
+            with Session(engine) as session:
+                _write_ops(session, [_decode(op) for op in ops], isolate=True)
+                session.commit()
+            logger.warning("Live match engine replayed %d journaled op(s)", len(ops))
+        open(self.journal_path, "wb").close()
+
+    # ─── Write-behind ─────────────────────────────────────────────────────────
+
+    def _record(self, live: LiveMatch, ops: list[dict]) -> None:
+        """Journal one request's ops durably and queue them for Postgres. Caller holds the match lock."""
+        with self._lock:
+            group = self._seq + 1
+            lines = []
+            for op in ops:
+                self._seq += 1
+                op.update(seq=self._seq, group=group, match_id=live.match.id)
+                lines.append(orjson.dumps(op) + b"\n")
+            if self._journal is not None:
+                self._journal.write(b"".join(lines))
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+            self._pending.extend(ops)
+
+    def flush(self) -> None:
+        """Write everything queued so far to Postgres (also called before DB-side match writes)."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                try:
+                    with Session(engine) as session:
+                        stale = _write_ops(session, batch)
+                        session.commit()
+                except IntegrityError:
+                    with Session(engine) as session:
+                        stale = _write_ops(session, batch, isolate=True)
+                        session.commit()
+            except Exception:
+                logger.exception("Live match flush failed; %d op(s) will be retried", len(batch))
+                with self._lock:
+                    self._pending[:0] = batch
+                return
+            with self._lock:
+                if self._journal is not None:
+                    if self._pending:
+                        self._journal.write(orjson.dumps({"checkpoint": batch[-1]["seq"]}) + b"\n")
+                    else:
+                        self._journal.truncate(0)
+                    self._journal.flush()
+                    os.fsync(self._journal.fileno())
+        for match_id in stale:
+            self.evict(match_id)  # reloaded from what was written on next use
+        for tournament_id in {op["tournament_id"] for op in batch if "tournament_id" in op}:
+            invalidate_leaders(tournament_id)
+
+    # ─── State ────────────────────────────────────────────────────────────────
+
+    def get(self, session: Session, match_id: uuid.UUID) -> Optional[LiveMatch]:
+        """
+        State of a live match, loaded from the database on first use; None if it is
+        not live or is detached for a direct write. Loading happens outside the engine
+        lock; the result is installed only if no match was evicted meanwhile.
+        """
+        if not self.enabled:
+            return None
+        while True:
+            with self._lock:
+                live = self._matches.get(match_id)
+                if live is not None or match_id in self._detached:
+                    return live
+                evictions = self._evictions
+            self.flush()  # queued or in-flight writes must land before the match is loaded
+            loaded = self._load(session, match_id)
+            if loaded is None:
+                return None
+            with self._lock:
+                if self._evictions == evictions:
+                    live = self._matches.setdefault(match_id, loaded)
+                    for events in (live.goals, live.cards, live.substitutions):
+                        self._event_matches.update(dict.fromkeys(events, match_id))
+                    return live
+            # A direct write may have landed after the load: read the rows again
+            session.expire_all()
+
+    def _load(self, session: Session, match_id: uuid.UUID) -> Optional[LiveMatch]:
+        match = session.get(Match, match_id)
+        if match is None or match.status != MatchStatus.live:
+            return None
+        team_ids = [match.team_a_id, match.team_b_id]
+        goals = session.exec(
+            select(Goal).where(Goal.match_id == match_id)
+            .options(selectinload(Goal.player), selectinload(Goal.assistant))
+        ).all()
+        cards = session.exec(select(Card).where(Card.match_id == match_id).options(selectinload(Card.player))).all()
+        substitutions = session.exec(
+            select(Substitution).where(Substitution.match_id == match_id)
+            .options(selectinload(Substitution.player_in), selectinload(Substitution.player_out))
+        ).all()
+        players = session.exec(select(Player).where(Player.team_id.in_(team_ids))).all()
+        last_seq = session.exec(
+            select(func.coalesce(func.max(MatchEvent.seq), 0)).where(MatchEvent.match_id == match_id)
+        ).one()
+        live = LiveMatch(
+            match=MatchRead.model_validate(match),
+            players={p.id: PlayerRead.model_validate(p) for p in players},
+            goals={g.id: GoalReadWithPlayer.model_validate(g) for g in goals},
+            cards={c.id: CardReadWithPlayer.model_validate(c) for c in cards},
+            substitutions={s.id: SubstitutionReadWithPlayers.model_validate(s) for s in substitutions},
+            seq=last_seq,
+        )
+        return live
+
+    def _tracked(self, match_id: uuid.UUID) -> Optional[LiveMatch]:
+        with self._lock:
+            return self._matches.get(match_id)
+
+    def snapshot(self, match_id: uuid.UUID) -> Optional[LiveMatchRead]:
+        """In-memory view of a tracked match, without touching the database."""
+        live = self._tracked(match_id)
+        if live is None:
+            return None
+        with live.lock:
+            return live.read()
+
+    def read(self, session: Session, match_id: uuid.UUID) -> Optional[LiveMatchRead]:
+        if self.get(session, match_id) is None:
+            return None
+        return self.snapshot(match_id)
+
+    def timeline(self, match_id: uuid.UUID, after_seq: int, limit: int) -> Optional[tuple[int, list[MatchEventRead]]]:
+        """
+        Event log of a tracked match: the seq the database held when the match was
+        loaded, and the entries recorded since then that come after `after_seq`.
+        None when the match is not tracked.
+        """
+        live = self._tracked(match_id)
+        if live is None:
+            return None
+        with live.lock:
+            loaded_seq = live.seq - len(live.events)
+            start = max(after_seq - loaded_seq, 0)
+            return loaded_seq, live.events[start:start + limit]
+
+    @contextmanager
+    def detach(self, match_id: uuid.UUID) -> Iterator[None]:
+        """
+        Take a match out of the engine for a request that writes its rows directly.
+        The match is evicted and its queued writes are flushed before the block runs;
+        until the block exits (after the caller's commit), its goal, card and
+        substitution requests use the database path, which the row locks serialize.
+        The match is reloaded on next use if still live.
+        """
+        if not self.enabled:
+            yield
+            return
+        with self._lock:
+            self._detached[match_id] = self._detached.get(match_id, 0) + 1
+        try:
+            self.evict(match_id)
+            self.flush()
+            yield
+        finally:
+            with self._lock:
+                if self._detached[match_id] == 1:
+                    del self._detached[match_id]
+                else:
+                    self._detached[match_id] -= 1
+
+    def evict(self, match_id: uuid.UUID) -> None:
+        """Forget a match; a write already running against it is queued before this returns."""
+        with self._lock:
+            live = self._matches.pop(match_id, None)
+            self._evictions += 1
+        if live is None:
+            return
+        with live.lock:
+            live.evicted = True
+        with self._lock:
+            if match_id in self._matches:
+                return  # reloaded meanwhile; the ids are registered again
+            for events in (live.goals, live.cards, live.substitutions):
+                for event_id in events:
+                    self._event_matches.pop(event_id, None)
+
+    def match_of(self, event_id: uuid.UUID) -> Optional[uuid.UUID]:
+        """Match id of a goal/card/substitution held in memory."""
+        with self._lock:
+            return self._event_matches.get(event_id)
+
+    def _apply(self, session: Session, match_id: uuid.UUID, fn: Callable[[LiveMatch], T]) -> Optional[T]:
+        """Run `fn` under the match lock against the current state; None when the match is not live."""
+        while True:
+            live = self.get(session, match_id)
+            if live is None:
+                return None
+            with live.lock:
+                if not live.evicted:
+                    return fn(live)
+
+    def _player(self, session: Session, live: LiveMatch, player_id: uuid.UUID, detail: str = "Player not found") -> PlayerRead:
+        player = live.players.get(player_id)
+        if player is None:
+            db_player = session.get(Player, player_id)
+            if db_player is None:
+                raise HTTPException(status_code=404, detail=detail)
+            player = live.players[player_id] = PlayerRead.model_validate(db_player)
+        return player
+
+    @staticmethod
+    def _check_referee(live: LiveMatch, user: User) -> None:
+        if live.referee_id != user.id:
+            raise HTTPException(status_code=403, detail="You are not the assigned referee for this match")
+
+    @staticmethod
+    def _check_team(session: Session, live: LiveMatch, team_id: uuid.UUID) -> None:
+        if team_id not in (live.match.team_a_id, live.match.team_b_id):
+            if not session.get(Team, team_id):
+                raise HTTPException(status_code=404, detail="Team not found")
+            raise HTTPException(status_code=400, detail="Team does not belong to this match")
+
+    @staticmethod
+    def _event_op(
+        live: LiveMatch,
+        kind: MatchEventKind,
+        action: MatchEventAction,
+        entity_id: uuid.UUID,
+        data: Optional[SQLModel] = None,
+    ) -> dict:
+        """Append to the match event log in memory and return the op that persists it."""
+        live.seq += 1
+        row = {"id": uuid.uuid4(), "match_id": live.match.id, "seq": live.seq, **event_entry(kind, action, entity_id, data)}
+        live.events.append(MatchEventRead(**row))
+        return {"op": "insert", "table": "match_event", "row": row}
+
+    # ─── Events ───────────────────────────────────────────────────────────────
+
+    def _prepare_goal(self, session: Session, live: LiveMatch, goal: GoalCreate) -> Callable[[], tuple]:
+        self._check_team(session, live, goal.team_id)
+        player = self._player(session, live, goal.player_id) if goal.player_id else None
+        assistant = self._player(session, live, goal.assistant_id) if goal.assistant_id else None
+        if assistant is not None and assistant.team_id != goal.team_id:
+            raise HTTPException(status_code=400, detail="Assistant does not belong to the scoring team")
+
+        def commit() -> tuple[GoalReadWithPlayer, list[dict]]:
+            m = live.match
+            row = {"id": uuid.uuid4(), **goal.model_dump()}
+            read = GoalReadWithPlayer(**row, player=player, assistant=assistant)
+            # team_id is the team credited with the goal, own goals included
+            if goal.team_id == m.team_a_id:
+                m.score_a += 1
+            else:
+                m.score_b += 1
+            live.goals[read.id] = read
+            return read, [
+                {"op": "insert", "table": "goal", "row": row, "tournament_id": m.tournament_id},
+                self._event_op(live, MatchEventKind.goal, MatchEventAction.created, read.id, GoalRead(**row)),
+                {"op": "insert", "table": "audit_logs", "row": _audit_row(
+                    "ADD_GOAL", m.id, f"Recorded goal in match {m.id}. Scorer: {goal.player_id}"
+                )},
+            ]
+        return commit
+
+    def add_goal(self, session: Session, goal: GoalCreate, user: User) -> Optional[GoalReadWithPlayer]:
+        added = self.add_events(session, goal.match_id, [goal], user)
+        return added.goals[0] if added else None
+
+    def delete_goal(self, session: Session, goal_id: uuid.UUID, user: User) -> bool:
+        def apply(live: LiveMatch) -> bool:
+            goal = live.goals.get(goal_id)
+            if goal is None:
+                return False
+            self._check_referee(live, user)
+            m = live.match
+            if goal.team_id == m.team_a_id:
+                m.score_a = max(0, m.score_a - 1)
+            else:
+                m.score_b = max(0, m.score_b - 1)
+            del live.goals[goal_id]
+            with self._lock:
+                self._event_matches.pop(goal_id, None)
+            self._record(live, [
+                {"op": "delete", "table": "goal", "id": goal_id, "tournament_id": m.tournament_id},
+                self._event_op(live, MatchEventKind.goal, MatchEventAction.deleted, goal_id),
+                {"op": "insert", "table": "audit_logs", "row": _audit_row(
+                    "DELETE_GOAL", m.id, f"Deleted goal {goal_id} from match {m.id}"
+                )},
+            ])
+            return True
+        match_id = self.match_of(goal_id)
+        return bool(match_id and self._apply(session, match_id, apply))
+
+    def _prepare_card(self, session: Session, live: LiveMatch, card: CardCreate) -> Callable[[], tuple]:
+        self._check_team(session, live, card.team_id)
+        player = self._player(session, live, card.player_id)
+        if player.team_id != card.team_id:
+            raise HTTPException(status_code=400, detail="Player does not belong to the recording team")
+
+        def commit() -> tuple[CardReadWithPlayer, list[dict]]:
+            m = live.match
+            if card.type == CardType.yellow:
+                player.yellow_cards += 1
+            else:
+                player.red_cards += 1
+            row = {"id": uuid.uuid4(), **card.model_dump()}
+            read = CardReadWithPlayer(**row, player=player)
+            live.cards[read.id] = read
+            return read, [
+                {"op": "insert", "table": "card", "row": row, "tournament_id": m.tournament_id},
+                self._event_op(live, MatchEventKind.card, MatchEventAction.created, read.id, CardRead(**row)),
+                {"op": "insert", "table": "audit_logs", "row": _audit_row(
+                    "ADD_CARD", m.id, f"Recorded {card.type} card for player {card.player_id} in match {m.id}"
+                )},
+            ]
+        return commit
+
+    def add_card(self, session: Session, card: CardCreate, user: User) -> Optional[CardReadWithPlayer]:
+        added = self.add_events(session, card.match_id, [card], user)
+        return added.cards[0] if added else None
+
+    def delete_card(self, session: Session, card_id: uuid.UUID, user: User) -> bool:
+        def apply(live: LiveMatch) -> bool:
+            card = live.cards.get(card_id)
+            if card is None:
+                return False
+            self._check_referee(live, user)
+            player = live.players.get(card.player_id)
+            if player is not None:
+                if card.type == CardType.yellow:
+                    player.yellow_cards = max(0, player.yellow_cards - 1)
+                else:
+                    player.red_cards = max(0, player.red_cards - 1)
+            del live.cards[card_id]
+            with self._lock:
+                self._event_matches.pop(card_id, None)
+            m = live.match
+            self._record(live, [
+                {"op": "delete", "table": "card", "id": card_id, "tournament_id": m.tournament_id},
+                self._event_op(live, MatchEventKind.card, MatchEventAction.deleted, card_id),
+                {"op": "insert", "table": "audit_logs", "row": _audit_row(
+                    "DELETE_CARD", m.id, f"Deleted card {card_id} from match {m.id}"
+                )},
+            ])
+            return True
+        match_id = self.match_of(card_id)
+        return bool(match_id and self._apply(session, match_id, apply))
+
+    def _prepare_substitution(
+        self, session: Session, live: LiveMatch, substitution: SubstitutionCreate
+    ) -> Callable[[], tuple]:
+        m = live.match
+        if substitution.team_id not in (m.team_a_id, m.team_b_id) and not session.get(Team, substitution.team_id):
+            raise HTTPException(status_code=404, detail="Team not found")
+        player_in = self._player(session, live, substitution.player_in_id, "Player In not found")
+        player_out = self._player(session, live, substitution.player_out_id, "Player Out not found")
+
+        def commit() -> tuple[SubstitutionReadWithPlayers, list[dict]]:
+            row = {"id": uuid.uuid4(), **substitution.model_dump(), "created_at": datetime.utcnow()}
+            read = SubstitutionReadWithPlayers(**row, player_in=player_in, player_out=player_out)
+            live.substitutions[read.id] = read
+            return read, [
+                {"op": "insert", "table": "substitution", "row": row},
+                self._event_op(
+                    live, MatchEventKind.substitution, MatchEventAction.created, read.id, SubstitutionRead(**row)
+                ),
+                {"op": "insert", "table": "audit_logs", "row": _audit_row(
+                    "ADD_SUBSTITUTION", m.id,
+                    f"Recorded substitution in match {m.id}: {player_out.name} OUT, {player_in.name} IN",
+                )},
+            ]
+        return commit
+
+    def add_substitution(
+        self, session: Session, substitution: SubstitutionCreate, user: User
+    ) -> Optional[SubstitutionReadWithPlayers]:
+        added = self.add_events(session, substitution.match_id, [substitution], user)
+        return added.substitutions[0] if added else None
+
+    def add_events(self, session: Session, match_id: uuid.UUID, events: list, user: User) -> Optional[MatchEventBatchRead]:
+        """
+        Apply goal/card/substitution creates; None when the match is not live.
+        Every event is validated before any is applied, so a batch is all-or-nothing;
+        the batch is journaled with one write.
+        """
+        prepare = {
+            GoalCreate: self._prepare_goal,
+            CardCreate: self._prepare_card,
+            SubstitutionCreate: self._prepare_substitution,
+        }
+
+        def apply(live: LiveMatch) -> MatchEventBatchRead:
+            self._check_referee(live, user)
+            commits = [prepare[type(event)](session, live, event) for event in events]
+            reads, ops = [], []
+            for commit in commits:
+                read, event_ops = commit()
+                reads.append(read)
+                ops.extend(event_ops)
+            with self._lock:
+                self._event_matches.update(dict.fromkeys((r.id for r in reads), match_id))
+            self._record(live, ops)
+            return MatchEventBatchRead(
+                score_a=live.match.score_a,
+                score_b=live.match.score_b,
+                goals=[r for r in reads if isinstance(r, GoalReadWithPlayer)],
+                cards=[r for r in reads if isinstance(r, CardReadWithPlayer)],
+                substitutions=[r for r in reads if isinstance(r, SubstitutionReadWithPlayers)],
+            )
+        return self._apply(session, match_id, apply)
+
+    def delete_substitution(self, session: Session, substitution_id: uuid.UUID, user: User) -> bool:
+        def apply(live: LiveMatch) -> bool:
+            if substitution_id not in live.substitutions:
+                return False
+            self._check_referee(live, user)
+            del live.substitutions[substitution_id]
+            with self._lock:
+                self._event_matches.pop(substitution_id, None)
+            m = live.match
+            self._record(live, [
+                {"op": "delete", "table": "substitution", "id": substitution_id},
+                self._event_op(live, MatchEventKind.substitution, MatchEventAction.deleted, substitution_id),
+                {"op": "insert", "table": "audit_logs", "row": _audit_row(
+                    "DELETE_SUBSTITUTION", m.id, f"Deleted substitution {substitution_id} from match {m.id}"
+                )},
+            ])
+            return True
+        match_id = self.match_of(substitution_id)
+        return bool(match_id and self._apply(session, match_id, apply))
+
+
+live_engine = LiveMatchEngine(
+    settings.LIVE_JOURNAL_PATH,
+    settings.LIVE_FLUSH_SECONDS,
+    enabled=settings.LIVE_ENGINE_ENABLED,
+)
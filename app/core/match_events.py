@@ -0,0 +1,383 @@
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import Integer, Uuid, column, union_all, values
+from sqlmodel import Session, SQLModel, delete, func, insert, select, update
+from app.core.audit import audit_log_row, record_audit_logs
+from app.core.standings import recompute_standings
+from app.models.card import Card, CardCreate, CardRead, CardReadWithPlayer, CardType
+from app.models.goal import Goal, GoalCreate, GoalRead, GoalReadWithPlayer
+from app.models.match import Match, MatchStatus
+from app.models.match_event import (
+    MatchEvent,
+    MatchEventAction,
+    MatchEventBatchRead,
+    MatchEventKind,
+    MatchSyncRead,
+    MatchSyncRequest,
+    MatchSyncResult,
+    MatchSyncStatus,
+)
+from app.models.player import Player, PlayerRead
+from app.models.substitution import (
+    Substitution,
+    SubstitutionCreate,
+    SubstitutionRead,
+    SubstitutionReadWithPlayers,
+)
+from app.models.team import Team
+
+
+def event_entry(
+    kind: MatchEventKind, action: MatchEventAction, entity_id: uuid.UUID, data: Optional[SQLModel] = None
+) -> dict:
+    """One match event log entry, without its match and sequence number."""
+    return dict(
+        kind=kind,
+        action=action,
+        entity_id=entity_id,
+        data=data.model_dump(mode="json") if data is not None else None,
+        created_at=datetime.utcnow(),
+    )
+
+
+def last_event_seq(session: Session, match_id: uuid.UUID) -> int:
+    """
+    Last seq in a match's event log. The match row is locked until the caller's
+    transaction ends, so concurrent writers take consecutive seqs.
+    """
+    # FOR NO KEY UPDATE: does not conflict with the key-share locks event inserts take on the match
+    session.exec(select(Match.id).where(Match.id == match_id).with_for_update(key_share=True))
+    return session.exec(
+        select(func.coalesce(func.max(MatchEvent.seq), 0)).where(MatchEvent.match_id == match_id)
+    ).one()
+
+
+def append_match_events(session: Session, match_id: uuid.UUID, entries: list[dict]) -> None:
+    """Append `event_entry` rows to a match's event log in the caller's transaction."""
+    if not entries:
+        return
+    last_seq = last_event_seq(session, match_id)
+    session.exec(insert(MatchEvent), params=[
+        dict(id=uuid.uuid4(), match_id=match_id, seq=last_seq + n, **entry) for n, entry in enumerate(entries, 1)
+    ])
+
+
+def _load_references(session: Session, match: Match, events: list) -> tuple[set[uuid.UUID], dict[uuid.UUID, Player]]:
+    """Teams and players that goal/card/substitution creates refer to, with one query each."""
+    teams = {match.team_a_id, match.team_b_id}
+    other_teams = {e.team_id for e in events} - teams
+    if other_teams:
+        teams.update(session.exec(select(Team.id).where(Team.id.in_(other_teams))).all())
+
+    ids = set()
+    for e in events:
+        if isinstance(e, SubstitutionCreate):
+            ids.update((e.player_in_id, e.player_out_id))
+        else:
+            ids.add(e.player_id)
+            if isinstance(e, GoalCreate):
+                ids.add(e.assistant_id)
+    ids.discard(None)
+    players = {p.id: p for p in session.exec(select(Player).where(Player.id.in_(ids))).all()} if ids else {}
+    return teams, players
+
+
+def _event_error(
+    match: Match, teams: set[uuid.UUID], players: dict[uuid.UUID, Player], e
+) -> Optional[HTTPException]:
+    """What the single-event endpoint would reject `e` with, if anything."""
+    if e.team_id not in teams:
+        return HTTPException(status_code=404, detail="Team not found")
+    if isinstance(e, SubstitutionCreate):
+        if e.player_in_id not in players:
+            return HTTPException(status_code=404, detail="Player In not found")
+        if e.player_out_id not in players:
+            return HTTPException(status_code=404, detail="Player Out not found")
+        return None
+    if e.team_id not in (match.team_a_id, match.team_b_id):
+        return HTTPException(status_code=400, detail="Team does not belong to this match")
+    if {e.player_id, getattr(e, "assistant_id", None)} - {None} - players.keys():
+        return HTTPException(status_code=404, detail="Player not found")
+    if isinstance(e, GoalCreate) and e.assistant_id and players[e.assistant_id].team_id != e.team_id:
+        return HTTPException(status_code=400, detail="Assistant does not belong to the scoring team")
+    if isinstance(e, CardCreate) and players[e.player_id].team_id != e.team_id:
+        return HTTPException(status_code=400, detail="Player does not belong to the recording team")
+    return None
+
+
+def _bump_card_counts(session: Session, cards, step: int = 1) -> dict[uuid.UUID, tuple[int, int]]:
+    """
+    Add `step` per (player_id, type) card to players' yellow/red counts in one UPDATE
+    (never below zero); returns the new counts.
+    """
+    yellow = Counter(pid for pid, card_type in cards if card_type == CardType.yellow)
+    red = Counter(pid for pid, card_type in cards if card_type == CardType.red)
+    deltas = values(
+        column("id", Uuid), column("yellow", Integer), column("red", Integer), name="card_deltas"
+    ).data([(pid, yellow[pid] * step, red[pid] * step) for pid in yellow.keys() | red.keys()])
+    rows = session.exec(
+        update(Player)
+        .where(Player.id == deltas.c.id)
+        .values(
+            yellow_cards=func.greatest(Player.yellow_cards + deltas.c.yellow, 0),
+            red_cards=func.greatest(Player.red_cards + deltas.c.red, 0),
+        )
+        .returning(Player.id, Player.yellow_cards, Player.red_cards)
+        .execution_options(synchronize_session=False)
+    ).all()
+    return {pid: (y, r) for pid, y, r in rows}
+
+
+def _write_creates(
+    session: Session, match: Match, events: list, ids: list[uuid.UUID], players: dict[uuid.UUID, Player]
+) -> tuple[MatchEventBatchRead, list[tuple[dict, dict]]]:
+    """
+    Insert validated creates with one multi-row INSERT per table, one score update
+    and one card-count update. Returns the response and, per event, its event log
+    entry and audit log row for the caller to write.
+    """
+    goals, cards, substitutions, logged = [], [], [], []
+    for e, event_id in zip(events, ids):
+        row = {"id": event_id, **e.model_dump()}
+        if isinstance(e, GoalCreate):
+            goals.append(row)
+            logged.append((
+                event_entry(MatchEventKind.goal, MatchEventAction.created, event_id, GoalRead(**row)),
+                audit_log_row(
+                    "ADD_GOAL", "Match", str(match.id), f"Recorded goal in match {match.id}. Scorer: {e.player_id}"
+                ),
+            ))
+        elif isinstance(e, CardCreate):
+            cards.append(row)
+            logged.append((
+                event_entry(MatchEventKind.card, MatchEventAction.created, event_id, CardRead(**row)),
+                audit_log_row(
+                    "ADD_CARD", "Match", str(match.id),
+                    f"Recorded {e.type} card for player {e.player_id} in match {match.id}",
+                ),
+            ))
+        else:
+            row["created_at"] = datetime.utcnow()
+            substitutions.append(row)
+            logged.append((
+                event_entry(MatchEventKind.substitution, MatchEventAction.created, event_id, SubstitutionRead(**row)),
+                audit_log_row(
+                    "ADD_SUBSTITUTION", "Match", str(match.id),
+                    f"Recorded substitution in match {match.id}: "
+                    f"{players[e.player_out_id].name} OUT, {players[e.player_in_id].name} IN",
+                ),
+            ))
+
+    for model, rows in ((Goal, goals), (Card, cards), (Substitution, substitutions)):
+        if rows:
+            session.exec(insert(model), params=rows)
+
+    # Increments happen in the database, as in create_goal; team_id is the credited side
+    scored_a = sum(1 for g in goals if g["team_id"] == match.team_a_id)
+    score_a, score_b = session.exec(
+        update(Match)
+        .where(Match.id == match.id)
+        .values(score_a=Match.score_a + scored_a, score_b=Match.score_b + len(goals) - scored_a)
+        .returning(Match.score_a, Match.score_b)
+        .execution_options(synchronize_session=False)
+    ).one()
+    card_counts = _bump_card_counts(session, [(c["player_id"], c["type"]) for c in cards]) if cards else {}
+
+    def read(player_id):
+        if player_id is None:
+            return None
+        player = PlayerRead.model_validate(players[player_id])
+        if player_id in card_counts:
+            player.yellow_cards, player.red_cards = card_counts[player_id]
+        return player
+
+    batch = MatchEventBatchRead(
+        score_a=score_a,
+        score_b=score_b,
+        goals=[
+            GoalReadWithPlayer(**g, player=read(g["player_id"]), assistant=read(g["assistant_id"])) for g in goals
+        ],
+        cards=[CardReadWithPlayer(**c, player=read(c["player_id"])) for c in cards],
+        substitutions=[
+            SubstitutionReadWithPlayers(**s, player_in=read(s["player_in_id"]), player_out=read(s["player_out_id"]))
+            for s in substitutions
+        ],
+    )
+    return batch, logged
+
+
+def _write_deletes(session: Session, match: Match, ids: list[uuid.UUID]) -> dict[uuid.UUID, tuple[dict, dict]]:
+    """
+    Delete the goals/cards/substitutions of `match` among `ids` and undo their score
+    and card counts. Returns the event log entry and audit log row per deleted id.
+    """
+    def remove(model, *columns):
+        return session.exec(
+            delete(model).where(model.match_id == match.id, model.id.in_(ids))
+            .returning(model.id, *columns)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+    goals = remove(Goal, Goal.team_id)
+    cards = remove(Card, Card.player_id, Card.type)
+    substitutions = remove(Substitution)
+
+    if goals:
+        scored_a = sum(1 for _, team_id in goals if team_id == match.team_a_id)
+        session.exec(
+            update(Match)
+            .where(Match.id == match.id)
+            .values(
+                score_a=func.greatest(Match.score_a - scored_a, 0),
+                score_b=func.greatest(Match.score_b - (len(goals) - scored_a), 0),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    if cards:
+        _bump_card_counts(session, [(player_id, card_type) for _, player_id, card_type in cards], step=-1)
+
+    deleted = {}
+    for kind, rows, action in (
+        (MatchEventKind.goal, goals, "DELETE_GOAL"),
+        (MatchEventKind.card, cards, "DELETE_CARD"),
+        (MatchEventKind.substitution, substitutions, "DELETE_SUBSTITUTION"),
+    ):
+        for row in rows:
+            deleted[row[0]] = (
+                event_entry(kind, MatchEventAction.deleted, row[0]),
+                audit_log_row(action, "Match", str(match.id), f"Deleted {kind.value} {row[0]} from match {match.id}"),
+            )
+    return deleted
+
+
+def apply_event_batch(session: Session, match: Match, events: list) -> MatchEventBatchRead:
+    """
+    Record goal/card/substitution creates for `match` in the caller's transaction:
+    everything is validated first (one query for players), then written with one
+    multi-row INSERT per table, one score update and one card-count update.
+    Every event is appended to the match event log.
+    The caller checks the referee and commits.
+    """
+    teams, players = _load_references(session, match, events)
+    for e in events:
+        error = _event_error(match, teams, players, e)
+        if error is not None:
+            raise error
+    batch, logged = _write_creates(session, match, events, [uuid.uuid4() for _ in events], players)
+    append_match_events(session, match.id, [entry for entry, _ in logged])
+    record_audit_logs(session, [row for _, row in logged])
+    return batch
+
+
+def sync_match_events(session: Session, match: Match, sync: MatchSyncRequest) -> MatchSyncRead:
+    """
+    Merge a referee device's offline queue into `match` in the caller's transaction.
+
+    Queue entries carry the ids the device gave its goals/cards/substitutions, so a
+    re-sent entry is recognised and skipped. Entries are applied in device-clock
+    order. Creates that fail validation are rejected one by one rather than
+    failing the whole queue. Server-side edits win: an entity deleted on the server
+    is not recreated, and deleting one the server already removed is a no-op.
+    """
+    results: list[Optional[MatchSyncResult]] = [None] * len(sync.events)
+    seen = set()
+    queue = []
+    for i, entry in sorted(enumerate(sync.events), key=lambda item: item[1].recorded_at):
+        if (entry.client_id, entry.action) in seen:
+            results[i] = MatchSyncResult(
+                client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.duplicate
+            )
+            continue
+        seen.add((entry.client_id, entry.action))
+        queue.append((i, entry))
+
+    # What the server already has for these ids: live rows (of any match), and this match's event log
+    client_ids = {entry.client_id for _, entry in queue}
+    existing, elsewhere, history = set(), set(), set()
+    if client_ids:
+        for event_id, match_id in session.exec(union_all(
+            select(Goal.id, Goal.match_id).where(Goal.id.in_(client_ids)),
+            select(Card.id, Card.match_id).where(Card.id.in_(client_ids)),
+            select(Substitution.id, Substitution.match_id).where(Substitution.id.in_(client_ids)),
+        )).all():
+            (existing if match_id == match.id else elsewhere).add(event_id)
+        history = set(session.exec(
+            select(MatchEvent.entity_id, MatchEvent.action)
+            .where(MatchEvent.match_id == match.id, MatchEvent.entity_id.in_(client_ids))
+        ).all())
+
+    creates, deletes = [], []
+    for i, entry in queue:
+        if entry.client_id in elsewhere:
+            # Not this match's event: the device must not count it as synced
+            results[i] = MatchSyncResult(
+                client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.rejected,
+                detail="Event id belongs to another match",
+            )
+        elif entry.action == MatchEventAction.deleted:
+            deletes.append((i, entry))
+        elif entry.client_id in existing or (entry.client_id, MatchEventAction.created) in history:
+            results[i] = MatchSyncResult(
+                client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.duplicate
+            )
+        else:
+            creates.append((i, entry, entry.event.for_match(match.id)))
+
+    teams, players = _load_references(session, match, [create for _, _, create in creates])
+    valid = []
+    for i, entry, create in creates:
+        error = _event_error(match, teams, players, create)
+        if error is not None:
+            results[i] = MatchSyncResult(
+                client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.rejected, detail=error.detail
+            )
+        else:
+            valid.append((i, entry, create))
+
+    logged: dict[int, tuple[dict, dict]] = {}
+    if valid:
+        _, created = _write_creates(
+            session, match, [create for _, _, create in valid], [entry.client_id for _, entry, _ in valid], players
+        )
+        logged.update(zip((i for i, _, _ in valid), created))
+    # After the creates, so a goal recorded and then deleted offline is removed too
+    deleted = _write_deletes(session, match, [entry.client_id for _, entry in deletes]) if deletes else {}
+    for i, entry in deletes:
+        if entry.client_id in deleted:
+            logged[i] = deleted[entry.client_id]
+        elif (entry.client_id, MatchEventAction.deleted) in history:
+            results[i] = MatchSyncResult(
+                client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.duplicate
+            )
+        else:
+            results[i] = MatchSyncResult(
+                client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.rejected,
+                detail="Event not found in this match",
+            )
+
+    applied = [i for i, _ in queue if i in logged]
+    for i in applied:
+        entry = sync.events[i]
+        results[i] = MatchSyncResult(client_id=entry.client_id, action=entry.action, status=MatchSyncStatus.applied)
+    append_match_events(session, match.id, [logged[i][0] for i in applied])
+    record_audit_logs(session, [logged[i][1] for i in applied])
+
+    session.refresh(match)
+    if applied and match.status == MatchStatus.finished:
+        # Standings are built from finished match scores
+        recompute_standings(session, [match.tournament_id])
+    timeline = session.exec(
+        select(MatchEvent)
+        .where(MatchEvent.match_id == match.id, MatchEvent.seq > sync.after_seq)
+        .order_by(MatchEvent.seq)
+    ).all()
+    return MatchSyncRead(
+        score_a=match.score_a,
+        score_b=match.score_b,
+        status=match.status,
+        results=results,
+        timeline=timeline,
+    )
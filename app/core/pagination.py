@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+
+def encode_cursor(sort_value: datetime, row_id: Any) -> str:
+    """Opaque cursor for the row a page ended on."""
+    raw = json.dumps([sort_value.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_raw, id_raw = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_raw), id_raw
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(
+    query,
+    sort_col,
+    id_col,
+    *,
+    cursor: Optional[str],
+    offset: int,
+    limit: int,
+    descending: bool = True,
+):
+    """
+    Paging on (sort_col, id_col), newest first unless `descending` is False.
+
+    With a cursor the page starts strictly after the cursor row (keyset, served
+    by a composite index); without one, plain OFFSET/LIMIT is used so existing
+    clients keep working.
+    """
+    if descending:
+        query = query.order_by(sort_col.desc(), id_col.desc())
+    else:
+        query = query.order_by(sort_col, id_col)
+    if cursor:
+        sort_value, raw_id = decode_cursor(cursor)
+        try:
+            row_id = id_col.type.python_type(raw_id)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        key, after = tuple_(sort_col, id_col), tuple_(sort_value, row_id)
+        return query.where(key < after if descending else key > after).limit(limit)
+    return query.offset(offset).limit(limit)
+
+
+def set_next_cursor(
+    response: Optional[Response],
+    rows: Sequence[Any],
+    sort_attr: str,
+    limit: int,
+) -> None:
+    """Expose the cursor of the next page in `X-Next-Cursor` when the page is full."""
+    if response is None or not rows or len(rows) < limit:
+        return
+    last = rows[-1]
+    response.headers["X-Next-Cursor"] = encode_cursor(getattr(last, sort_attr), last.id)
@@ -0,0 +1,104 @@
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is "+Inf"
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+@dataclass
+class PoolMetrics:
+    name: str
+    checkouts: int = 0
+    wait_ms_total: float = 0.0
+    wait_buckets: list[int] = field(default_factory=lambda: [0] * (len(WAIT_BUCKETS_MS) + 1))
+    timeouts: int = 0
+    invalidations: int = 0
+
+
+# Registered engines: { name: (engine, metrics) }
+_pools: dict[str, tuple[Engine, PoolMetrics]] = {}
+
+
+class _TimedPoolMixin:
+    """Times how long a caller waits for a connection (including connecting a new one)."""
+
+    _metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self._metrics is not None:
+                self._metrics.timeouts += 1
+            raise
+        finally:
+            if self._metrics is not None:
+                waited = (time.perf_counter() - started) * 1000
+                self._metrics.checkouts += 1
+                self._metrics.wait_ms_total += waited
+                self._metrics.wait_buckets[bisect_left(WAIT_BUCKETS_MS, waited)] += 1
+
+    def recreate(self):
+        pool = super().recreate()
+        pool._metrics = self._metrics
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def register_pool(name: str, engine: Engine) -> None:
+    """Expose an engine's pool in `pool_snapshot()` (async engines: pass `.sync_engine`)."""
+    metrics = PoolMetrics(name=name)
+    pool = engine.pool
+    if isinstance(pool, _TimedPoolMixin):
+        pool._metrics = metrics
+
+    # Fired for failed pre-pings as well as connections dropped on error
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    _pools[name] = (engine, metrics)
+
+
+def _pool_state(pool: Pool) -> dict:
+    if isinstance(pool, QueuePool):
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        }
+    # NullPool (serverless profile): nothing is held between requests
+    return {"size": 0, "checked_out": None, "checked_in": 0, "overflow": 0, "max_overflow": 0}
+
+
+def pool_snapshot() -> list[dict]:
+    """Current state and counters of every registered pool."""
+    result = []
+    for name, (engine, metrics) in _pools.items():
+        labels = [f"le_{b}ms" for b in WAIT_BUCKETS_MS] + ["le_inf"]
+        result.append({
+            "name": name,
+            "pool_class": type(engine.pool).__name__,
+            **_pool_state(engine.pool),
+            "checkouts": metrics.checkouts,
+            "wait_ms_avg": round(metrics.wait_ms_total / metrics.checkouts, 2) if metrics.checkouts else 0.0,
+            "wait_histogram": dict(zip(labels, metrics.wait_buckets)),
+            "timeouts": metrics.timeouts,
+            "invalidations": metrics.invalidations,
+        })
+    return result
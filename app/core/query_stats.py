@@ -0,0 +1,97 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    db_ms: float = 0.0
+    budget: Optional[int] = None
+    statements: list[str] = field(default_factory=list)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in test mode when a route issues more queries than it declared."""
+
+
+# Stats of the request being handled (None outside an instrumented request)
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+# Only the first statements are kept, enough to spot an N+1 pattern in a failure message
+_MAX_KEPT_STATEMENTS = 20
+
+_installed = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.db_ms += (time.perf_counter() - started) * 1000
+    if len(stats.statements) < _MAX_KEPT_STATEMENTS:
+        stats.statements.append(" ".join(statement.split())[:200])
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def install_query_stats() -> None:
+    """Count queries and DB time for every engine (sync, async and replicas)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _installed = True
+
+
+def start_request_stats() -> tuple[QueryStats, object]:
+    stats = QueryStats()
+    return stats, _request_stats.set(stats)
+
+
+def finish_request_stats(token) -> None:
+    _request_stats.reset(token)
+
+
+def query_budget(limit: int):
+    """
+    Route dependency declaring the most queries a request may issue, e.g.
+    `dependencies=[Depends(query_budget(3))]`. Checked by the query stats middleware.
+    """
+    async def _declare_budget() -> None:
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.budget = limit
+    return _declare_budget
+
+
+def server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.db_ms:.1f};desc="{stats.count} queries"'
+
+
+def check_budget(stats: QueryStats, route: str, strict: bool) -> None:
+    """Log (or in test mode raise) when a request went over its declared budget."""
+    if stats.budget is None or stats.count <= stats.budget:
+        return
+    message = f"{route} issued {stats.count} queries (budget {stats.budget})"
+    if strict:
+        raise QueryBudgetExceeded(message + ":\n  " + "\n  ".join(stats.statements))
+    logger.warning(message)
@@ -0,0 +1,21 @@
+from typing import Any
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """orjson encoding used for API responses (UUID, datetime and enums are handled natively)."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    Default response class of the app. `bytes` content is treated as JSON that
+    was already serialized (e.g. kept in an in-memory cache) and sent as is:
+    `return FastJSONResponse(cached_body)`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        return dumps(content)
@@ -75,6 +75,15 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+def bearer_subject(authorization: Optional[str]) -> Optional[str]:
+    """The `sub` of a valid bearer access token; it survives token refreshes, unlike the token itself."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    payload = decode_access_token(token)
+    return str(payload["sub"]) if payload and payload.get("sub") is not None else None
+
+
 def decode_refresh_token(token: str) -> Optional[dict]:
     """Decode and validate a JWT refresh token. Returns payload or None."""
     try:
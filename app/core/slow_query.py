@@ -0,0 +1,128 @@
+import logging
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import SQLModel
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SlowQueryRead(SQLModel):
+    recorded_at: datetime
+    duration_ms: float
+    route: Optional[str] = None
+    statement: str
+    parameters: Any = None
+    explain: Optional[str] = None
+
+
+# Most recent slow statements, newest last (per process)
+_slow_queries: deque[dict] = deque(maxlen=max(settings.SLOW_QUERY_BUFFER_SIZE, 1))
+
+_MAX_STATEMENT_CHARS = 4000
+
+
+def _parameters_shape(parameters, executemany: bool) -> Any:
+    """Types of the bound parameters, never their values."""
+    if executemany:
+        return f"{len(parameters)} parameter sets"
+    if isinstance(parameters, dict):
+        return {k: type(v).__name__ for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(v).__name__ for v in parameters]
+    return None
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    """
+    EXPLAIN (ANALYZE, BUFFERS) on the same connection, inside a savepoint so a
+    failing EXPLAIN cannot abort the caller's transaction. ANALYZE re-executes
+    the statement, so only plain SELECTs are explained.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        finally:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        return plan
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - conn.info["slow_query_started"].pop()) * 1000
+    if duration_ms < settings.SLOW_QUERY_MS:
+        return
+
+    route = conn.info.get("route")
+    explain = None
+    if (
+        not executemany
+        and statement.lstrip()[:6].upper() == "SELECT"
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    ):
+        explain = _explain(conn, statement, parameters)
+
+    logger.warning("Slow query (%.0f ms) on %s: %s", duration_ms, route or "-", " ".join(statement.split())[:500])
+    _slow_queries.append({
+        "recorded_at": datetime.now(timezone.utc),
+        "duration_ms": round(duration_ms, 1),
+        "route": route,
+        "statement": statement[:_MAX_STATEMENT_CHARS],
+        "parameters": _parameters_shape(parameters, executemany),
+        "explain": explain,
+    })
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    started = conn.info.get("slow_query_started") if conn is not None else None
+    if started:
+        started.pop()
+
+
+def _tag_connection(session, transaction, connection):
+    """Carry the route a session was opened for onto the connection it uses."""
+    route = session.info.get("route")
+    if route:
+        connection.info["route"] = route
+
+
+def _untag_connection(dbapi_connection, connection_record):
+    connection_record.info.pop("route", None)
+
+
+def install_slow_query_log(engine: Engine) -> None:
+    """Time every statement on `engine` and record those over SLOW_QUERY_MS."""
+    if settings.SLOW_QUERY_MS <= 0:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    event.listen(engine.pool, "checkin", _untag_connection)
+    if not event.contains(OrmSession, "after_begin", _tag_connection):
+        event.listen(OrmSession, "after_begin", _tag_connection)
+
+
+def get_slow_queries(limit: int = 50) -> list[dict]:
+    """Newest slow queries first."""
+    return list(reversed(_slow_queries))[:limit]
+
+
+def clear_slow_queries() -> None:
+    _slow_queries.clear()
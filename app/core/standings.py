@@ -0,0 +1,110 @@
+import uuid
+from typing import Optional, Sequence
+from sqlalchemy import and_, case, exists, insert, literal, union_all, update
+from sqlmodel import Session, func, select
+from app.models.match import Match, MatchStatus
+from app.models.standing import Standing
+from app.models.team import Team
+
+
+def _standings_rows_query(tournament_ids: Optional[Sequence[uuid.UUID]] = None):
+    """
+    Build one GROUP BY over every match result, seen from both the home and
+    the away side, plus zero-rows for registered teams and existing standings
+    so that teams without finished matches keep an (empty) table entry.
+    """
+    finished = Match.status == MatchStatus.finished
+    home = select(
+        Match.tournament_id.label("tournament_id"),
+        Match.team_a_id.label("team_id"),
+        Match.score_a.label("gf"),
+        Match.score_b.label("ga"),
+        literal(1).label("played"),
+    ).where(finished)
+    away = select(
+        Match.tournament_id,
+        Match.team_b_id,
+        Match.score_b,
+        Match.score_a,
+        literal(1),
+    ).where(finished)
+    registered = select(Team.tournament_id, Team.id, literal(0), literal(0), literal(0))
+    existing = select(Standing.tournament_id, Standing.team_id, literal(0), literal(0), literal(0))
+
+    if tournament_ids is not None:
+        home = home.where(Match.tournament_id.in_(tournament_ids))
+        away = away.where(Match.tournament_id.in_(tournament_ids))
+        registered = registered.where(Team.tournament_id.in_(tournament_ids))
+        existing = existing.where(Standing.tournament_id.in_(tournament_ids))
+
+    results = union_all(home, away, registered, existing).subquery("results")
+    is_played = results.c.played == 1
+    won = func.sum(case((and_(is_played, results.c.gf > results.c.ga), 1), else_=0))
+    drawn = func.sum(case((and_(is_played, results.c.gf == results.c.ga), 1), else_=0))
+    lost = func.sum(case((and_(is_played, results.c.gf < results.c.ga), 1), else_=0))
+
+    return (
+        select(
+            results.c.tournament_id,
+            results.c.team_id,
+            func.sum(results.c.played).label("played"),
+            won.label("won"),
+            drawn.label("drawn"),
+            lost.label("lost"),
+            func.sum(results.c.gf).label("goals_for"),
+            func.sum(results.c.ga).label("goals_against"),
+            (won * 3 + drawn).label("points"),
+        )
+        .group_by(results.c.tournament_id, results.c.team_id)
+    )
+
+
+def recompute_standings(
+    session: Session,
+    tournament_ids: Optional[Sequence[uuid.UUID]] = None,
+) -> int:
+    """
+    Rebuild standings from finished matches with set-based SQL.
+
+    The aggregate is written with a single upsert statement: rows that already
+    exist are updated in place and missing ones are inserted, both as
+    data-modifying CTEs of one query. Pass ``tournament_ids`` to limit the
+    rebuild, or ``None`` to rebuild every tournament in one pass. Returns the
+    number of team rows written. The caller owns the transaction.
+    """
+    stat_columns = ["played", "won", "drawn", "lost", "goals_for", "goals_against", "points"]
+    agg = _standings_rows_query(tournament_ids).cte("agg")
+
+    updated = (
+        update(Standing)
+        .where(
+            Standing.tournament_id == agg.c.tournament_id,
+            Standing.team_id == agg.c.team_id,
+        )
+        .values({name: agg.c[name] for name in stat_columns})
+        .returning(Standing.tournament_id, Standing.team_id)
+        .cte("updated")
+    )
+    already_updated = exists().where(
+        updated.c.tournament_id == agg.c.tournament_id,
+        updated.c.team_id == agg.c.team_id,
+    )
+    inserted = (
+        insert(Standing)
+        .from_select(
+            ["id", "tournament_id", "team_id", *stat_columns],
+            select(
+                func.gen_random_uuid(),
+                agg.c.tournament_id,
+                agg.c.team_id,
+                *(agg.c[name] for name in stat_columns),
+            ).where(~already_updated),
+        )
+        .returning(Standing.id)
+        .cte("inserted")
+    )
+    stmt = select(
+        select(func.count()).select_from(updated).scalar_subquery()
+        + select(func.count()).select_from(inserted).scalar_subquery()
+    ).add_cte(agg, updated, inserted)
+    return session.exec(stmt).one()
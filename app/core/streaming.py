@@ -0,0 +1,64 @@
+from typing import AsyncIterable, Iterable
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched per round trip from the server-side cursor (`yield_per`)
+STREAM_BATCH_SIZE = 500
+
+
+def wants_stream(request: Request, stream: bool = False) -> bool:
+    """True for `Accept: application/x-ndjson` or `?stream=true` (chunked JSON array)."""
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _encode(batch: list, adapter: TypeAdapter, ndjson: bool) -> bytes:
+    rows = [adapter.dump_json(adapter.validate_python(row, from_attributes=True)) for row in batch]
+    if ndjson:
+        return b"".join(row + b"\n" for row in rows)
+    return b",".join(rows)
+
+
+def _iter_chunks(batches: Iterable[list], adapter: TypeAdapter, ndjson: bool):
+    if not ndjson:
+        yield b"["
+    first = True
+    for batch in batches:
+        if not batch:
+            continue
+        chunk = _encode(batch, adapter, ndjson)
+        yield chunk if first or ndjson else b"," + chunk
+        first = False
+    if not ndjson:
+        yield b"]"
+
+
+async def _aiter_chunks(batches: AsyncIterable[list], adapter: TypeAdapter, ndjson: bool):
+    if not ndjson:
+        yield b"["
+    first = True
+    async for batch in batches:
+        if not batch:
+            continue
+        chunk = _encode(batch, adapter, ndjson)
+        yield chunk if first or ndjson else b"," + chunk
+        first = False
+    if not ndjson:
+        yield b"]"
+
+
+def stream_rows(request: Request, batches: Iterable[list] | AsyncIterable[list], adapter: TypeAdapter) -> StreamingResponse:
+    """
+    Write rows to the client batch by batch as they come off the cursor, each
+    row validated and dumped through `adapter` (the endpoint's item model).
+    NDJSON when the client accepts it, otherwise one JSON array sent in chunks.
+    The session dependency stays open until the stream is finished.
+    """
+    ndjson = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    if hasattr(batches, "__aiter__"):
+        content = _aiter_chunks(batches, adapter, ndjson)
+    else:
+        content = _iter_chunks(batches, adapter, ndjson)
+    return StreamingResponse(content, media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json")
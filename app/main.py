@@ -1,5 +1,5 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -8,12 +8,24 @@ from starlette.websockets import WebSocket, WebSocketDisconnect
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.database import create_db_and_tables
 from app.core.security import decode_access_token
 from app.core.realtime import realtime_manager, ConnectionInfo
+from app.core.responses import FastJSONResponse
+from app.core.compression import CompressionMiddleware
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.live_match import live_engine
+from app.core.query_stats import (
+    check_budget,
+    finish_request_stats,
+    install_query_stats,
+    server_timing,
+    start_request_stats,
+)
 from app.core.database import engine
 from app.models.user import User
 from sqlmodel import Session
@@ -32,63 +44,127 @@ logger = logging.getLogger(__name__)
 limiter = Limiter(key_func=get_remote_address, default_limits=["200/minute"])
 
 # ─── Security Headers Middleware ──────────────────────────────────────────────
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=(), payment=()"
-        )
-        if settings.ENVIRONMENT == "production":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
-        return response
-
-
-class RealtimeBroadcastMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-
-        # Fire-and-forget broadcast so response returns immediately
-        if request.url.path.startswith(settings.API_V1_STR):
-            if request.method in ("POST", "PUT", "PATCH", "DELETE") and 200 <= response.status_code < 300:
-                rel_path = request.url.path[len(settings.API_V1_STR):].lstrip("/")
-                entity = (rel_path.split("/", 1)[0] or "unknown").lower()
-                action = {
-                    "POST": "created",
-                    "PUT": "updated",
-                    "PATCH": "updated",
-                    "DELETE": "deleted",
-                }.get(request.method, "updated")
-                payload = {
-                    "type": "entity_changed",
-                    "entity": entity,
-                    "action": action,
-                    "id": None,
-                    "path": request.url.path,
-                    "method": request.method,
-                    "status": response.status_code,
-                }
-
-                async def _broadcast():
-                    try:
-                        await realtime_manager.broadcast(payload)
-                    except Exception as e:
-                        logger.warning("Realtime broadcast failed: %s", e)
-
-                asyncio.create_task(_broadcast())
-
-        return response
+# Plain ASGI middlewares: they only touch the `http.response.start` message, so
+# they add no per-request task and never buffer (streamed bodies pass through).
+_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=(), payment=()",
+}
+if settings.ENVIRONMENT == "production":
+    _SECURITY_HEADERS["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
+
+
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+_BROADCAST_ACTIONS = {
+    "POST": "created",
+    "PUT": "updated",
+    "PATCH": "updated",
+    "DELETE": "deleted",
+}
+
+
+class RealtimeBroadcastMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _BROADCAST_ACTIONS
+            or not scope["path"].startswith(settings.API_V1_STR)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_and_broadcast(message: Message):
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                _schedule_broadcast(scope, message["status"])
+            await send(message)
+
+        await self.app(scope, receive, send_and_broadcast)
+
+
+def _schedule_broadcast(scope: Scope, status: int) -> None:
+    """Fire-and-forget broadcast so the response is not held up."""
+    path = scope["path"]
+    rel_path = path[len(settings.API_V1_STR):].lstrip("/")
+    entity = (rel_path.split("/", 1)[0] or "unknown").lower()
+    payload = {
+        "type": "entity_changed",
+        "entity": entity,
+        "action": _BROADCAST_ACTIONS[scope["method"]],
+        "id": None,
+        "path": path,
+        "method": scope["method"],
+        "status": status,
+    }
+
+    async def _broadcast():
+        try:
+            await realtime_manager.broadcast(payload)
+        except Exception as e:
+            logger.warning("Realtime broadcast failed: %s", e)
+
+    asyncio.create_task(_broadcast())
+
+
+class QueryStatsMiddleware:
+    """Count SQL queries per request; report them in Server-Timing (non-production only)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.strict = settings.ENVIRONMENT.lower() in {"test", "testing"}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["Server-Timing"] = server_timing(stats)
+                route = scope.get("route")
+                check_budget(
+                    stats,
+                    f"{scope['method']} {getattr(route, 'path', scope['path'])}",
+                    strict=self.strict,
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            finish_request_stats(token)
 
 # ─── App ──────────────────────────────────────────────────────────────────────
 app = FastAPI(
     title=settings.PROJECT_NAME,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
+    default_response_class=FastJSONResponse,
 )
 
 # Attach rate limiter state and handler
@@ -151,6 +227,17 @@ app.add_middleware(SecurityHeadersMiddleware)
 # 1b. Realtime broadcast (after successful mutations)
 app.add_middleware(RealtimeBroadcastMiddleware)
 
+# 1b2. Idempotency-Key replays (outside the broadcast, so a replay is not re-announced)
+app.add_middleware(IdempotencyMiddleware)
+
+# 1c. Query counting / budgets (development and test only)
+if settings.ENVIRONMENT != "production":
+    install_query_stats()
+    app.add_middleware(QueryStatsMiddleware)
+
+# 1d. brotli/gzip compression (sees final headers; passes precompressed bodies through)
+app.add_middleware(CompressionMiddleware)
+
 # 2. CORS
 app.add_middleware(
     CORSMiddleware,
@@ -158,6 +245,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "Server-Timing", "Idempotent-Replayed"],
 )
 
 # 3. TrustedHost (outermost — production only)
@@ -177,12 +265,17 @@ if settings.ENVIRONMENT == "production":
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
+    live_engine.start()
     logger.info(
         "GoalUp! starting — env=%s | cors=%s",
         settings.ENVIRONMENT,
         settings.BACKEND_CORS_ORIGINS,
     )
 
+@app.on_event("shutdown")
+def on_shutdown():
+    live_engine.stop()
+
 # ─── Routes ───────────────────────────────────────────────────────────────────
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
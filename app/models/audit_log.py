@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 class AuditLogBase(SQLModel):
@@ -12,6 +13,10 @@ class AuditLogBase(SQLModel):
 
 class AuditLog(AuditLogBase, table=True):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Keyset pagination on (timestamp, id)
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+    )
     id: Optional[uuid.UUID] = Field(
         default_factory=uuid.uuid4,
         primary_key=True,
@@ -9,8 +9,8 @@ class CardType(str, Enum):
     red = "red"
 
 class CardBase(SQLModel):
-    match_id: uuid.UUID = Field(foreign_key="match.id",ondelete="CASCADE")
-    player_id: uuid.UUID = Field(foreign_key="player.id",ondelete="CASCADE")
+    match_id: uuid.UUID = Field(foreign_key="match.id", index=True, ondelete="CASCADE")
+    player_id: uuid.UUID = Field(foreign_key="player.id", index=True, ondelete="CASCADE")
     team_id: uuid.UUID = Field(foreign_key="team.id",ondelete="CASCADE")
     minute: int
     type: CardType
@@ -1,5 +1,6 @@
 import uuid
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 class LineupBase(SQLModel):
@@ -10,6 +11,10 @@ class LineupBase(SQLModel):
     slot_index: Optional[int] = Field(default=None)
 
 class Lineup(LineupBase, table=True):
+    __table_args__ = (
+        # Starting-XI checks and per-team lineup lookups for a match
+        Index("ix_lineup_match_team_starting", "match_id", "team_id", "is_starting"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     match: "Match" = Relationship(back_populates="lineups")
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 class MatchStatus(str, Enum):
@@ -34,6 +35,12 @@ class MatchBase(SQLModel):
     referee_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True, nullable=True)
 
 class Match(MatchBase, table=True):
+    __table_args__ = (
+        # Keyset pagination on (start_time, id)
+        Index("ix_match_start_time_id", "start_time", "id"),
+        # Fixture lists of one tournament in kick-off order
+        Index("ix_match_tournament_start_time", "tournament_id", "start_time"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     tournament: "Tournament" = Relationship(back_populates="matches")
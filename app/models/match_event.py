@@ -0,0 +1,136 @@
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import Field as PydanticField, field_validator, model_validator
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+from app.models.card import CardCreate, CardReadWithPlayer, CardType
+from app.models.goal import GoalCreate, GoalReadWithPlayer
+from app.models.match import MatchStatus
+from app.models.substitution import SubstitutionCreate, SubstitutionReadWithPlayers
+
+# Largest batch accepted by POST /matches/{id}/events:batch
+MAX_EVENT_BATCH = 200
+# Largest offline queue accepted by POST /matches/{id}/sync
+MAX_SYNC_EVENTS = 500
+
+class GoalEventCreate(SQLModel):
+    kind: Literal["goal"]
+    team_id: uuid.UUID
+    player_id: Optional[uuid.UUID] = None
+    assistant_id: Optional[uuid.UUID] = None
+    minute: int
+    is_own_goal: bool = False
+
+    def for_match(self, match_id: uuid.UUID) -> GoalCreate:
+        return GoalCreate(match_id=match_id, **self.model_dump(exclude={"kind"}))
+
+class CardEventCreate(SQLModel):
+    kind: Literal["card"]
+    team_id: uuid.UUID
+    player_id: uuid.UUID
+    minute: int
+    type: CardType
+
+    def for_match(self, match_id: uuid.UUID) -> CardCreate:
+        return CardCreate(match_id=match_id, **self.model_dump(exclude={"kind"}))
+
+class SubstitutionEventCreate(SQLModel):
+    kind: Literal["substitution"]
+    team_id: uuid.UUID
+    player_in_id: uuid.UUID
+    player_out_id: uuid.UUID
+    minute: int
+
+    def for_match(self, match_id: uuid.UUID) -> SubstitutionCreate:
+        return SubstitutionCreate(match_id=match_id, **self.model_dump(exclude={"kind"}))
+
+MatchEventCreate = Annotated[
+    Union[GoalEventCreate, CardEventCreate, SubstitutionEventCreate],
+    PydanticField(discriminator="kind"),
+]
+
+class MatchEventBatch(SQLModel):
+    """Events of one match, applied in order and all-or-nothing."""
+    events: List[MatchEventCreate] = PydanticField(min_length=1, max_length=MAX_EVENT_BATCH)
+
+class MatchEventBatchRead(SQLModel):
+    score_a: int
+    score_b: int
+    goals: List[GoalReadWithPlayer] = []
+    cards: List[CardReadWithPlayer] = []
+    substitutions: List[SubstitutionReadWithPlayers] = []
+
+class MatchEventKind(str, Enum):
+    goal = "goal"
+    card = "card"
+    substitution = "substitution"
+
+class MatchEventAction(str, Enum):
+    created = "created"
+    deleted = "deleted"
+
+class MatchEventBase(SQLModel):
+    match_id: uuid.UUID = Field(foreign_key="match.id", ondelete="CASCADE")
+    seq: int  # 1, 2, 3... per match, in recording order
+    kind: MatchEventKind
+    action: MatchEventAction
+    entity_id: uuid.UUID  # the goal / card / substitution
+    data: Optional[dict] = Field(default=None, sa_type=JSONB)  # the recorded row, for created events
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+class MatchEvent(MatchEventBase, table=True):
+    """Append-only log of a match's goal, card and substitution changes."""
+    __tablename__ = "match_event"
+    __table_args__ = (
+        # Timeline reads: WHERE match_id = ? AND seq > ? ORDER BY seq
+        Index("ix_match_event_match_seq", "match_id", "seq", unique=True),
+    )
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+
+class MatchEventRead(MatchEventBase):
+    id: uuid.UUID
+
+class MatchSyncEvent(SQLModel):
+    """One entry of a referee device's offline queue."""
+    client_id: uuid.UUID  # id the device gave the goal/card/substitution; the server keeps it
+    recorded_at: datetime  # device clock, with a UTC offset; the queue is applied in this order
+    action: MatchEventAction = MatchEventAction.created
+    event: Optional[MatchEventCreate] = None  # the goal/card/substitution, for `created`
+
+    @field_validator("recorded_at")
+    @classmethod
+    def _utc_recorded_at(cls, value: datetime) -> datetime:
+        if value.tzinfo is None or value.utcoffset() is None:
+            raise ValueError("`recorded_at` must include a UTC offset")
+        return value.astimezone(timezone.utc)
+
+    @model_validator(mode="after")
+    def _event_for_created(self):
+        if self.action == MatchEventAction.created and self.event is None:
+            raise ValueError("`event` is required for created entries")
+        return self
+
+class MatchSyncRequest(SQLModel):
+    events: List[MatchSyncEvent] = PydanticField(default=[], max_length=MAX_SYNC_EVENTS)
+    after_seq: int = PydanticField(default=0, ge=0)  # last timeline seq the device has
+
+class MatchSyncStatus(str, Enum):
+    applied = "applied"
+    duplicate = "duplicate"  # already on the server (a retry, or deleted there meanwhile)
+    rejected = "rejected"
+
+class MatchSyncResult(SQLModel):
+    client_id: uuid.UUID
+    action: MatchEventAction
+    status: MatchSyncStatus
+    detail: Optional[str] = None
+
+class MatchSyncRead(SQLModel):
+    score_a: int
+    score_b: int
+    status: MatchStatus
+    results: List[MatchSyncResult]  # one per queued entry, in request order
+    timeline: List[MatchEventRead]  # server timeline after `after_seq`, the device's entries included
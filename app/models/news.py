@@ -1,6 +1,7 @@
 import uuid
 from enum import Enum
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime, timezone
 
@@ -24,6 +25,12 @@ class NewsBase(SQLModel):
 
 
 class News(NewsBase, table=True):
+    __table_args__ = (
+        # Keyset pagination on (created_at, id)
+        Index("ix_news_created_at_id", "created_at", "id"),
+        # Category-filtered feeds, newest first
+        Index("ix_news_category_created_at", "category", "created_at"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
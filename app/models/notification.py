@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -13,6 +14,10 @@ class NotificationBase(SQLModel):
 
 
 class Notification(NotificationBase, table=True):
+    __table_args__ = (
+        # Keyset pagination on (created_at, id)
+        Index("ix_notification_created_at_id", "created_at", "id"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
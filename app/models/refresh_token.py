@@ -19,5 +19,5 @@ class RefreshToken(SQLModel, table=True):
     revoked: bool = Field(default=False, index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     revoked_at: Optional[datetime] = Field(default=None, nullable=True)
-    expires_at: datetime
+    expires_at: datetime = Field(index=True)  # expired-token cleanup
 
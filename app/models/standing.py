@@ -1,5 +1,6 @@
 import uuid
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 class StandingBase(SQLModel):
@@ -14,6 +15,9 @@ class StandingBase(SQLModel):
     points: int = Field(default=0)
 
 class Standing(StandingBase, table=True):
+    __table_args__ = (
+        Index("ix_standing_tournament_team", "tournament_id", "team_id"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     tournament: "Tournament" = Relationship(back_populates="standings")
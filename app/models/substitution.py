@@ -4,7 +4,7 @@ from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime
 
 class SubstitutionBase(SQLModel):
-    match_id: uuid.UUID = Field(foreign_key="match.id",ondelete="CASCADE")
+    match_id: uuid.UUID = Field(foreign_key="match.id", index=True, ondelete="CASCADE")
     team_id: uuid.UUID = Field(foreign_key="team.id",ondelete="CASCADE")
     player_in_id: uuid.UUID = Field(foreign_key="player.id",ondelete="CASCADE")
     player_out_id: uuid.UUID = Field(foreign_key="player.id",ondelete="CASCADE")
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 import uuid
 from enum import Enum
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from pydantic import field_validator
 
@@ -16,6 +17,10 @@ class UserRole(str, Enum):
 class User(SQLModel, table=True):
     """Admin user profile — credentials managed locally."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination on (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     # Neon schema uses SERIAL/INTEGER PK
     id: Optional[int] = Field(default=None, primary_key=True)
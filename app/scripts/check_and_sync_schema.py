@@ -2,10 +2,12 @@
 Compare SQLModel tables/columns with Neon DB and sync both ways:
 - Models -> DB: create missing tables, add missing columns.
 - DB -> Models: report tables/columns in DB not in models; optionally add them to model files.
+- Indexes: report model indexes missing in DB and foreign keys with no index leading on them.
 
 Run from project root with venv active and DATABASE_URL set:
   python -m app.scripts.check_and_sync_schema [--apply] [--update-models]
-  --apply: run CREATE TABLE and ALTER TABLE for missing items in DB.
+  --apply: run CREATE TABLE and ALTER TABLE for missing items in DB, and
+           CREATE INDEX CONCURRENTLY for missing indexes (no table locks).
   --update-models: add columns/tables that exist in DB but not in models into app/models (use after review).
 """
 from __future__ import annotations
@@ -16,7 +18,8 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
-from sqlalchemy import inspect, text
+from sqlalchemy import Index, inspect, text
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.types import INTEGER, VARCHAR, BigInteger, Boolean, DateTime, Integer, String, Text
 from sqlmodel import SQLModel
 
@@ -159,6 +162,65 @@ def _normalize_type_for_compare(sql_type: str) -> str:
     return s
 
 
+def _index_statement(index: Index) -> str:
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS ... for a model (or proposed) index."""
+    sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+    sql = sql.replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX CONCURRENTLY", 1)
+    sql = sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+    return sql.strip() + ";"
+
+
+def _find_missing_indexes(inspector, db_tables: set[str]) -> tuple[list[tuple[str, Index, str]], list[str]]:
+    """
+    Indexes declared on models but absent in DB (matched by column list, so a
+    renamed index still counts), plus FK columns nothing indexes on the leading
+    column. Returns ([(table, index, reason)], [invalid index names]).
+    """
+    missing: list[tuple[str, Index, str]] = []
+    for table_name in sorted(_get_expected_tables() & db_tables):
+        table = SQLModel.metadata.tables[table_name]
+        db_indexes = inspector.get_indexes(table_name)
+        db_column_sets = {tuple(i["column_names"]) for i in db_indexes}
+        leading = {i["column_names"][0] for i in db_indexes if i["column_names"]}
+        # Primary keys and unique constraints are backed by indexes too
+        pk_cols = inspector.get_pk_constraint(table_name).get("constrained_columns") or []
+        if pk_cols:
+            db_column_sets.add(tuple(pk_cols))
+            leading.add(pk_cols[0])
+        for uc in inspector.get_unique_constraints(table_name):
+            if uc["column_names"]:
+                db_column_sets.add(tuple(uc["column_names"]))
+                leading.add(uc["column_names"][0])
+
+        model_leading = set()
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            cols = tuple(c.name for c in index.columns)
+            model_leading.add(cols[0])
+            if cols not in db_column_sets:
+                missing.append((table_name, index, "model index"))
+                leading.add(cols[0])
+
+        for fk in sorted(table.foreign_keys, key=lambda f: f.parent.name):
+            col = fk.parent.name
+            if col in leading or col in model_leading:
+                continue
+            proposed = Index(f"ix_{table_name}_{col}", table.c[col])
+            table.indexes.discard(proposed)  # audit only; keep model metadata untouched
+            missing.append((table_name, proposed, f"foreign key -> {fk.column.table.name}"))
+            leading.add(col)
+
+    with engine.connect() as conn:
+        invalid = [
+            row[0]
+            for row in conn.execute(text(
+                "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE NOT i.indisvalid AND n.nspname = current_schema()"
+            ))
+        ]
+    return missing, invalid
+
+
 def run_compare_and_sync(apply: bool = False, update_models: bool = False) -> bool:
     """Compare schema and optionally apply changes. Returns True if no errors."""
     inspector = inspect(engine)
@@ -261,6 +323,39 @@ def run_compare_and_sync(apply: bool = False, update_models: bool = False) -> bo
     else:
         print("\nAll column types match between models and DB.")
 
+    # ---- 2c) Report / create missing indexes (model indexes and unindexed FKs) ----
+    missing_indexes, invalid_indexes = _find_missing_indexes(inspector, db_tables)
+    if invalid_indexes:
+        # Left behind by an interrupted CREATE INDEX CONCURRENTLY; Postgres ignores them
+        print("\nINVALID indexes in DB (drop and re-run, e.g. DROP INDEX CONCURRENTLY <name>):")
+        for name in invalid_indexes:
+            print(f"  - {name}")
+    if missing_indexes:
+        print("\nIndexes missing in DB:")
+        index_statements = []
+        for table_name, index, reason in missing_indexes:
+            cols = ", ".join(c.name for c in index.columns)
+            print(f"  - {table_name}({cols}) as {index.name} [{reason}]")
+            index_statements.append(_index_statement(index))
+        if apply:
+            # CONCURRENTLY cannot run inside a transaction block
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                for stmt in index_statements:
+                    conn.execute(text(stmt))
+            print(f"Created {len(index_statements)} index(es) concurrently.")
+        else:
+            out_path = "sync_schema_migration.sql"
+            mode = "a" if Path(out_path).exists() else "w"
+            with open(out_path, mode) as f:
+                if mode == "w":
+                    f.write("-- Generated schema sync migration\n")
+                f.write("\n-- Missing indexes (run outside a transaction)\n")
+                for stmt in index_statements:
+                    f.write(stmt + "\n")
+            print(f"Wrote {len(index_statements)} CREATE INDEX(es) to {out_path}.")
+    else:
+        print("\nAll model indexes and foreign keys are indexed in DB.")
+
     # ---- 3) Report tables in DB not in models ----
     if extra_tables:
         print("\nTables in DB but not in MODELS (consider adding to app/models or ignoring):")
@@ -351,7 +446,7 @@ def main():
     parser.add_argument(
         "--apply",
         action="store_true",
-        help="Apply changes: create missing tables, add missing columns in DB",
+        help="Apply changes: create missing tables, add missing columns and indexes in DB",
     )
     parser.add_argument(
         "--update-models",
@@ -362,7 +457,7 @@ def main():
     try:
         ok = run_compare_and_sync(apply=args.apply, update_models=args.update_models)
         if not args.apply and (ok or True):
-            print("\n(Dry run. Use --apply to create missing tables and add missing columns.)")
+            print("\n(Dry run. Use --apply to create missing tables, columns and indexes.)")
         sys.exit(0 if ok else 1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -0,0 +1,112 @@
+"""
+Benchmark fixture generation: bulk multi-row INSERT vs one ORM object per match.
+
+Creates a throwaway competition/tournament with N teams, generates a double
+round-robin through the schedule endpoint (bulk path), then persists the same
+fixtures with per-object session.add for comparison. Everything it creates is
+deleted again. Point it at a development database.
+
+Run from project root with venv active and DATABASE_URL set:
+  python -m app.scripts.fixture_benchmark [--teams 20 40 100] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from sqlmodel import Session, delete, select
+
+from app.core.database import engine
+from app.api.v1.endpoints.tournaments import schedule_tournament
+from app.models.audit_log import AuditLog
+from app.models.competition import Competition
+from app.models.match import Match
+from app.models.standing import Standing
+from app.models.team import Team
+from app.models.tournament import Tournament, TournamentScheduleCreate
+from app.models.user import User, UserRole
+# Import all models to ensure they are registered with SQLModel.metadata
+import app.models  # noqa: F401
+
+
+def _create_tournament(session: Session, n_teams: int) -> tuple[uuid.UUID, uuid.UUID]:
+    competition = Competition(name=f"bench-{n_teams}-{time.time_ns()}")
+    session.add(competition)
+    session.flush()
+    tournament = Tournament(name=competition.name, year=datetime.now().year, competition_id=competition.id)
+    session.add(tournament)
+    session.flush()
+    tournament_id = tournament.id
+    for i in range(n_teams):
+        team = Team(name=f"Bench Team {i + 1}", tournament_id=tournament_id)
+        session.add(team)
+        session.flush()
+        # Tournament.teams goes through the standings table
+        session.add(Standing(tournament_id=tournament_id, team_id=team.id))
+    session.commit()
+    return tournament_id, competition.id
+
+
+def _drop_tournament(session: Session, tournament_id: uuid.UUID, competition_id: uuid.UUID) -> None:
+    session.exec(delete(Match).where(Match.tournament_id == tournament_id))
+    session.exec(delete(AuditLog).where(AuditLog.entity_id == str(tournament_id)))
+    session.exec(delete(Standing).where(Standing.tournament_id == tournament_id))
+    session.exec(delete(Team).where(Team.tournament_id == tournament_id))
+    session.exec(delete(Tournament).where(Tournament.id == tournament_id))
+    session.exec(delete(Competition).where(Competition.id == competition_id))
+    session.commit()
+
+
+def _time_bulk(session: Session, tournament_id: uuid.UUID, schedule: TournamentScheduleCreate, admin: User) -> tuple[float, int]:
+    started = time.perf_counter()
+    result = schedule_tournament(session=session, tournament_id=tournament_id, schedule=schedule, current_user=admin)
+    return (time.perf_counter() - started) * 1000, result["matches_created"]
+
+
+def _time_per_object(session: Session, tournament_id: uuid.UUID) -> float:
+    """Re-insert the generated fixtures the old way: one ORM object per match."""
+    rows = [m.model_dump() for m in session.exec(select(Match).where(Match.tournament_id == tournament_id)).all()]
+    session.exec(delete(Match).where(Match.tournament_id == tournament_id))
+    session.commit()
+    session.expunge_all()
+
+    started = time.perf_counter()
+    for row in rows:
+        row.pop("id")
+        session.add(Match(**row))
+    session.commit()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk fixture generation")
+    parser.add_argument("--teams", nargs="+", type=int, default=[20, 40, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    schedule = TournamentScheduleCreate(start_date=datetime.now(), matches_per_day=4, interval_days=7, total_time=90)
+    # Passed as the endpoint's current user; never persisted
+    admin = User(id=0, email="bench@localhost", full_name="bench", role=UserRole.SUPER_ADMIN, is_superuser=True)
+
+    print(f"{'teams':>5} {'matches':>8} {'bulk ms':>9} {'per-object ms':>14} {'speedup':>8}")
+    with Session(engine) as session:
+        for n_teams in args.teams:
+            bulk_runs, orm_runs, matches = [], [], 0
+            for _ in range(args.repeat):
+                tournament_id, competition_id = _create_tournament(session, n_teams)
+                try:
+                    elapsed, matches = _time_bulk(session, tournament_id, schedule, admin)
+                    bulk_runs.append(elapsed)
+                    orm_runs.append(_time_per_object(session, tournament_id))
+                finally:
+                    session.rollback()
+                    _drop_tournament(session, tournament_id, competition_id)
+            bulk, orm = statistics.median(bulk_runs), statistics.median(orm_runs)
+            print(f"{n_teams:>5} {matches:>8} {bulk:>9.1f} {orm:>14.1f} {orm / bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
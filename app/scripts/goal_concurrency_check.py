@@ -0,0 +1,173 @@
+"""
+Concurrency check for goal recording: fires many goal POSTs at one match in
+parallel, then deletes every goal twice in parallel (a double-tapping referee
+app), and verifies the match score against the goal rows after each phase.
+With a read-modify-write score update, concurrent requests lose increments.
+
+Creates a throwaway tournament, two teams, an assigned referee and a match.
+Everything it creates is deleted again. Point it at a development database.
+Exits with status 1 if a score does not add up.
+
+This is a manual check: the project has no test suite or database fixture to
+run it from, and the lost update only shows against Postgres with concurrent
+connections (SQLite serializes writers). Run it after changing how goals or
+scores are written; the exit status lets CI run it against a Postgres service.
+
+Run from project root with venv active and DATABASE_URL set:
+  python -m app.scripts.goal_concurrency_check [--goals 300] [--concurrency 50]
+      [--base-url http://127.0.0.1:8000]
+  --base-url: send requests to a running API on the same database instead of
+              calling the app in-process.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime
+
+import httpx
+from sqlmodel import Session, delete, func, select
+
+from app.core.database import engine
+from app.core.security import create_access_token
+from app.models.audit_log import AuditLog
+from app.models.competition import Competition
+from app.models.goal import Goal
+from app.models.match import Match
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.models.user import User, UserRole
+
+
+def _seed(session: Session) -> dict:
+    competition = Competition(name=f"bench-goals-{time.time_ns()}")
+    session.add(competition)
+    session.flush()
+    tournament = Tournament(name=competition.name, year=datetime.now().year, competition_id=competition.id)
+    session.add(tournament)
+    session.flush()
+    teams = [Team(name=f"Bench Team {i + 1}", tournament_id=tournament.id) for i in range(2)]
+    session.add_all(teams)
+    referee = User(
+        email=f"bench-{uuid.uuid4().hex[:8]}@localhost",
+        full_name="Benchmark",
+        role=UserRole.REFEREE,
+        tournament_id=tournament.id,
+    )
+    session.add(referee)
+    session.flush()
+    match = Match(
+        tournament_id=tournament.id,
+        team_a_id=teams[0].id,
+        team_b_id=teams[1].id,
+        start_time=datetime.now(),
+        referee_id=referee.id,
+    )
+    session.add(match)
+    session.commit()
+    return {
+        "competition_id": competition.id,
+        "tournament_id": tournament.id,
+        "team_ids": [t.id for t in teams],
+        "referee_id": referee.id,
+        "match_id": match.id,
+    }
+
+
+def _cleanup(session: Session, ids: dict) -> None:
+    session.exec(delete(Goal).where(Goal.match_id == ids["match_id"]))
+    session.exec(delete(AuditLog).where(AuditLog.entity_id == str(ids["match_id"])))
+    session.exec(delete(Match).where(Match.id == ids["match_id"]))
+    session.exec(delete(User).where(User.id == ids["referee_id"]))
+    session.exec(delete(Team).where(Team.tournament_id == ids["tournament_id"]))
+    session.exec(delete(Tournament).where(Tournament.id == ids["tournament_id"]))
+    session.exec(delete(Competition).where(Competition.id == ids["competition_id"]))
+    session.commit()
+
+
+def _check(ids: dict, phase: str, expected_goals: int) -> bool:
+    with Session(engine) as session:
+        match = session.get(Match, ids["match_id"])
+        goals = session.exec(
+            select(Goal.team_id, func.count()).where(Goal.match_id == ids["match_id"]).group_by(Goal.team_id)
+        ).all()
+    per_team = dict(goals)
+    expected = (per_team.get(ids["team_ids"][0], 0), per_team.get(ids["team_ids"][1], 0))
+    ok = (match.score_a, match.score_b) == expected and sum(expected) == expected_goals
+    print(
+        f"{phase:>8}: goal rows {sum(expected):>5} (expected {expected_goals})"
+        f"  score {match.score_a}-{match.score_b} (rows say {expected[0]}-{expected[1]})"
+        f"  {'OK' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+async def _fire(requests: list, concurrency: int) -> tuple[dict[int, int], list]:
+    """Run request coroutine factories with bounded concurrency; count responses by status."""
+    statuses: dict[int, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(make):
+        async with semaphore:
+            response = await make()
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        return response
+
+    responses = await asyncio.gather(*(one(make) for make in requests))
+    return statuses, responses
+
+
+async def run(base_url: str | None, n_goals: int, concurrency: int, ids: dict) -> bool:
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(ids['referee_id'])})}"}
+    if base_url:
+        client = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60)
+    else:
+        from app.main import app
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://localhost", headers=headers, timeout=60
+        )
+    async with client:
+        posts = [
+            lambda i=i: client.post("/api/v1/goals/", json={
+                "match_id": str(ids["match_id"]),
+                "team_id": str(ids["team_ids"][i % 2]),
+                "minute": i % 90 + 1,
+                "is_own_goal": i % 7 == 0,
+            })
+            for i in range(n_goals)
+        ]
+        started = time.perf_counter()
+        statuses, responses = await _fire(posts, concurrency)
+        print(f"    post: {n_goals} requests in {time.perf_counter() - started:.2f}s, statuses {statuses}")
+        ok = _check(ids, "post", statuses.get(200, 0)) and statuses.get(200, 0) == n_goals
+
+        goal_ids = [r.json()["id"] for r in responses if r.status_code == 200]
+        deletes = [lambda g=g: client.delete(f"/api/v1/goals/{g}") for g in goal_ids for _ in range(2)]
+        started = time.perf_counter()
+        statuses, _ = await _fire(deletes, concurrency)
+        print(f"  delete: {len(deletes)} requests in {time.perf_counter() - started:.2f}s, statuses {statuses}")
+        ok = _check(ids, "delete", 0) and ok and statuses.get(200, 0) == len(goal_ids)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel goal POST/DELETE score consistency check")
+    parser.add_argument("--goals", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--base-url", default=None, help="Running API to target (default: in-process)")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        ids = _seed(session)
+        try:
+            ok = asyncio.run(run(args.base_url, args.goals, args.concurrency, ids))
+        finally:
+            _cleanup(session, ids)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
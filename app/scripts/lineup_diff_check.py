@@ -0,0 +1,167 @@
+"""
+Lineup diff check: sets a full lineup, then a smaller one, and verifies the
+lineup table holds exactly the submitted rows after each call. The match
+starts with repeated rows for one player, as databases written by the old
+delete-and-reinsert code can hold, and those must be cleared too. Also checks
+that a payload listing a player twice is rejected with 422.
+
+Creates a throwaway tournament, two teams with players, a coach and a match.
+Everything it creates is deleted again. Point it at a development database.
+Exits with status 1 if the stored lineup does not match what was submitted.
+
+Run from project root with venv active and DATABASE_URL set:
+  python -m app.scripts.lineup_diff_check [--base-url http://127.0.0.1:8000]
+  --base-url: send requests to a running API on the same database instead of
+              calling the app in-process.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+from sqlmodel import Session, delete, select
+
+from app.core.database import engine
+from app.core.security import create_access_token
+from app.models.audit_log import AuditLog
+from app.models.competition import Competition
+from app.models.lineup import Lineup
+from app.models.match import Match
+from app.models.player import Player
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.models.user import User, UserRole
+
+
+def _seed(session: Session) -> dict:
+    competition = Competition(name=f"bench-lineups-{time.time_ns()}")
+    session.add(competition)
+    session.flush()
+    tournament = Tournament(name=competition.name, year=datetime.now().year, competition_id=competition.id)
+    session.add(tournament)
+    session.flush()
+    teams = [Team(name=f"Bench Team {i + 1}", tournament_id=tournament.id) for i in range(2)]
+    session.add_all(teams)
+    session.flush()
+    players = [
+        Player(name=f"Bench Player {n + 1}", team_id=teams[0].id, jersey_number=n + 1)
+        for n in range(15)
+    ]
+    session.add_all(players)
+    coach = User(
+        email=f"bench-{uuid.uuid4().hex[:8]}@localhost",
+        full_name="Benchmark",
+        role=UserRole.COACH,
+        tournament_id=tournament.id,
+        team_id=teams[0].id,
+    )
+    session.add(coach)
+    session.flush()
+    match = Match(
+        tournament_id=tournament.id,
+        team_a_id=teams[0].id,
+        team_b_id=teams[1].id,
+        start_time=datetime.now() + timedelta(days=1),
+    )
+    session.add(match)
+    session.flush()
+    # Repeated rows for one player, as left by the old delete-and-reinsert code
+    session.add_all(
+        Lineup(match_id=match.id, team_id=teams[0].id, player_id=players[0].id, slot_index=0)
+        for _ in range(3)
+    )
+    session.commit()
+    return {
+        "competition_id": competition.id,
+        "tournament_id": tournament.id,
+        "team_id": teams[0].id,
+        "player_ids": [p.id for p in players],
+        "coach_id": coach.id,
+        "match_id": match.id,
+    }
+
+
+def _cleanup(session: Session, ids: dict) -> None:
+    session.exec(delete(Lineup).where(Lineup.match_id == ids["match_id"]))
+    session.exec(delete(AuditLog).where(AuditLog.entity_id == str(ids["match_id"])))
+    session.exec(delete(Match).where(Match.id == ids["match_id"]))
+    session.exec(delete(User).where(User.id == ids["coach_id"]))
+    session.exec(delete(Player).where(Player.team_id == ids["team_id"]))
+    session.exec(delete(Team).where(Team.tournament_id == ids["tournament_id"]))
+    session.exec(delete(Tournament).where(Tournament.id == ids["tournament_id"]))
+    session.exec(delete(Competition).where(Competition.id == ids["competition_id"]))
+    session.commit()
+
+
+def _lineup(ids: dict, player_ids: list) -> list[dict]:
+    return [
+        {
+            "match_id": str(ids["match_id"]),
+            "team_id": str(ids["team_id"]),
+            "player_id": str(p),
+            "is_starting": i < 11,
+            "slot_index": i,
+        }
+        for i, p in enumerate(player_ids)
+    ]
+
+
+def _check(client: httpx.Client, ids: dict, phase: str, player_ids: list) -> bool:
+    response = client.post(f"/api/v1/matches/{ids['match_id']}/lineups", json=_lineup(ids, player_ids))
+    if response.status_code != 200:
+        print(f"{phase:>9}: status {response.status_code} {response.text}  MISMATCH")
+        return False
+    with Session(engine) as session:
+        stored = session.exec(
+            select(Lineup.player_id, Lineup.is_starting, Lineup.slot_index).where(Lineup.match_id == ids["match_id"])
+        ).all()
+    expected = sorted((p, i < 11, i) for i, p in enumerate(player_ids))
+    returned = sorted((uuid.UUID(l["player_id"]), l["is_starting"], l["slot_index"]) for l in response.json())
+    ok = sorted(tuple(row) for row in stored) == expected and returned == expected
+    print(
+        f"{phase:>9}: submitted {len(player_ids):>3}  stored {len(stored):>3}  returned {len(returned):>3}"
+        f"  {'OK' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def run(base_url: str | None, ids: dict) -> bool:
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(ids['coach_id'])})}"}
+    if base_url:
+        client = httpx.Client(base_url=base_url, headers=headers, timeout=60)
+    else:
+        from fastapi.testclient import TestClient
+        from app.main import app
+        client = TestClient(app, headers=headers)
+    players = ids["player_ids"]
+    with client:
+        ok = _check(client, ids, "full", players)
+        ok = _check(client, ids, "smaller", players[3:10]) and ok
+
+        duplicated = _lineup(ids, players[:11]) + _lineup(ids, players[:1])
+        response = client.post(f"/api/v1/matches/{ids['match_id']}/lineups", json=duplicated)
+        print(f"duplicate: status {response.status_code} (expected 422)  {'OK' if response.status_code == 422 else 'MISMATCH'}")
+        ok = response.status_code == 422 and ok
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lineup diff consistency check")
+    parser.add_argument("--base-url", default=None, help="Running API to target (default: in-process)")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        ids = _seed(session)
+        try:
+            ok = run(args.base_url, ids)
+        finally:
+            _cleanup(session, ids)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Concurrency load benchmark against a running GoalUp API.
+
+Fires a fixed number of GET requests per endpoint at several concurrency
+levels and prints throughput and latency percentiles, so two builds (e.g.
+before/after a change) can be compared on the same database.
+
+Run from project root with the API already serving:
+  python -m app.scripts.load_benchmark --base-url http://127.0.0.1:8000 --token <JWT>
+      [--path /api/v1/matches/ ...] [--concurrency 1 10 50 100] [--requests 500]
+  --token: access token sent as Bearer (most read endpoints require auth).
+  --path: endpoint to hit (repeatable). Default: matches, news, standings, tournaments.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/v1/matches/",
+    "/api/v1/news/",
+    "/api/v1/standings/",
+    "/api/v1/tournaments/",
+]
+
+
+async def _run_level(client: httpx.AsyncClient, path: str, concurrency: int, total: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+async def run(base_url: str, token: str | None, paths: list[str], levels: list[int], total: int) -> None:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+        width = max(len(p) for p in paths)
+        print(f"{'endpoint':<{width}} {'conc':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+        for path in paths:
+            await client.get(path)  # warm up pools and caches
+            for level in levels:
+                r = await _run_level(client, path, level, total)
+                print(f"{path:<{width}} {level:>5} {r['rps']:>9.1f} {r['p50']:>9.1f} {r['p95']:>9.1f} {r['errors']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrency load benchmark for read endpoints")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--token", default=None, help="Bearer access token")
+    parser.add_argument("--path", action="append", dest="paths", help="Endpoint path (repeatable)")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 10, 50, 100])
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint and level")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.token, args.paths or DEFAULT_PATHS, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark the match list: GET /matches/ (nested and normalized formats),
+/matches/?enriched=false and /matches/summary.
+
+Creates a throwaway tournament with the requested number of matches and a
+temporary super admin, calls both endpoints in-process (FastAPI TestClient)
+with limit=N, and reports median latency and payload size. Everything it
+creates is deleted again. Point it at a development database.
+
+Run from project root with venv active and DATABASE_URL set:
+  python -m app.scripts.match_list_benchmark [--matches 100 1000 10000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete, insert
+
+from app.core.database import engine
+from app.core.security import create_access_token
+from app.main import app
+from app.models.competition import Competition
+from app.models.match import Match
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.models.user import User, UserRole
+
+ENDPOINTS = {
+    "nested": "/api/v1/matches/?limit={n}",
+    "normalized": "/api/v1/matches/?format=normalized&limit={n}",
+    "enriched=false": "/api/v1/matches/?enriched=false&limit={n}",
+    "summary": "/api/v1/matches/summary?limit={n}",
+}
+
+
+def _seed(session: Session, n_matches: int) -> dict:
+    competition = Competition(name=f"bench-matches-{time.time_ns()}")
+    session.add(competition)
+    session.flush()
+    tournament = Tournament(name=competition.name, year=datetime.now().year, competition_id=competition.id)
+    session.add(tournament)
+    session.flush()
+    teams = [Team(name=f"Bench Team {i + 1}", tournament_id=tournament.id) for i in range(20)]
+    session.add_all(teams)
+    admin = User(
+        email=f"bench-{uuid.uuid4().hex[:8]}@localhost",
+        full_name="Benchmark",
+        role=UserRole.SUPER_ADMIN,
+        is_superuser=True,
+    )
+    session.add(admin)
+    session.flush()
+    start = datetime.now()
+    session.exec(insert(Match), params=[
+        dict(
+            tournament_id=tournament.id,
+            team_a_id=teams[i % 20].id,
+            team_b_id=teams[(i + 1) % 20].id,
+            start_time=start + timedelta(hours=i),
+            referee_id=admin.id,
+        )
+        for i in range(n_matches)
+    ])
+    session.commit()
+    return {"competition_id": competition.id, "tournament_id": tournament.id, "admin_id": admin.id}
+
+
+def _cleanup(session: Session, ids: dict) -> None:
+    session.exec(delete(Match).where(Match.tournament_id == ids["tournament_id"]))
+    session.exec(delete(Team).where(Team.tournament_id == ids["tournament_id"]))
+    session.exec(delete(Tournament).where(Tournament.id == ids["tournament_id"]))
+    session.exec(delete(Competition).where(Competition.id == ids["competition_id"]))
+    session.exec(delete(User).where(User.id == ids["admin_id"]))
+    session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark match list projection")
+    parser.add_argument("--matches", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'matches':>8} {'endpoint':>15} {'median ms':>10} {'KiB':>9}")
+    with TestClient(app, base_url="http://localhost") as client, Session(engine) as session:
+        for n_matches in args.matches:
+            ids = _seed(session, n_matches)
+            headers = {"Authorization": f"Bearer {create_access_token({'sub': str(ids['admin_id'])})}"}
+            try:
+                for name, path in ENDPOINTS.items():
+                    url = path.format(n=n_matches) + f"&tournament_id={ids['tournament_id']}"
+                    client.get(url, headers=headers)  # warm up
+                    timings, size = [], 0
+                    for _ in range(args.repeat):
+                        started = time.perf_counter()
+                        response = client.get(url, headers=headers)
+                        timings.append((time.perf_counter() - started) * 1000)
+                        response.raise_for_status()
+                        size = len(response.content)
+                    print(f"{n_matches:>8} {name:>15} {statistics.median(timings):>10.1f} {size / 1024:>9.1f}")
+            finally:
+                _cleanup(session, ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Rebuild standings from finished matches with one set-based SQL pass.
+
+Run from project root with venv active and DATABASE_URL set:
+  python -m app.scripts.recompute_standings [--tournament-id UUID ...]
+  --tournament-id: only rebuild these tournaments (repeatable). Default: all tournaments.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.core.standings import recompute_standings
+# Import all models to ensure they are registered with SQLModel.metadata
+import app.models  # noqa: F401
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute tournament standings")
+    parser.add_argument(
+        "--tournament-id",
+        action="append",
+        type=uuid.UUID,
+        dest="tournament_ids",
+        help="Tournament to rebuild (repeatable). Omit to rebuild every tournament.",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with Session(engine) as session:
+        teams_processed = recompute_standings(session, args.tournament_ids)
+        session.commit()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    scope = f"{len(args.tournament_ids)} tournament(s)" if args.tournament_ids else "all tournaments"
+    print(f"Recomputed {teams_processed} standing row(s) for {scope} in {elapsed_ms:.0f} ms.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Microbenchmark EnrichedMatchRead serialization: per-match cost before and after
+the single-pass serializer.
+
+Creates a throwaway tournament with fully enriched matches (lineups, goals,
+cards, substitutions, referee), loads them once with the endpoint's eager-load
+options, then times only the serialization step in-process:
+
+  legacy       the old `_enrich_match` (model_validate + nested re-validation)
+               followed by FastAPI's response_model validation and JSONResponse
+  single-pass  the cached TypeAdapter used by read_matches / read_match
+  normalized   `?format=normalized`: related entities listed once under `included`
+
+Everything it creates is deleted again. Point it at a development database.
+
+Run from project root with venv active and DATABASE_URL set:
+  python -m app.scripts.serializer_benchmark [--matches 100] [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlmodel import Session, delete, insert, select
+
+from app.api.v1.endpoints.matches import (
+    EnrichedMatchRead,
+    TournamentReadWithCompetition,
+    _match_load_options,
+    _serialize_matches,
+    _serialize_normalized,
+)
+from app.core.database import engine
+from app.models.card import Card, CardReadWithPlayer
+from app.models.competition import Competition, CompetitionRead
+from app.models.goal import Goal, GoalReadWithPlayer
+from app.models.lineup import Lineup, LineupReadWithPlayer
+from app.models.match import Match
+from app.models.player import Player
+from app.models.substitution import Substitution, SubstitutionReadWithPlayers
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.models.user import User, UserRead, UserRole
+
+PLAYERS_PER_TEAM = 11
+
+
+def _legacy_enrich(m: Match) -> EnrichedMatchRead:
+    """The serializer read_matches used before (kept here for comparison only)."""
+    em = EnrichedMatchRead.model_validate(m)
+    if m.tournament:
+        tournament_dict = TournamentReadWithCompetition.model_validate(m.tournament).model_dump()
+        if m.tournament.competition:
+            tournament_dict["competition"] = CompetitionRead.model_validate(m.tournament.competition).model_dump()
+        em.tournament = TournamentReadWithCompetition(**tournament_dict)
+    em.team_a = m.team_a
+    em.team_b = m.team_b
+    em.lineups = [LineupReadWithPlayer.model_validate(l) for l in m.lineups]
+    em.goals = [GoalReadWithPlayer.model_validate(g) for g in m.goals_list]
+    em.cards = [CardReadWithPlayer.model_validate(c) for c in m.cards_list]
+    em.substitutions = [SubstitutionReadWithPlayers.model_validate(s) for s in m.substitutions]
+    if m.referee:
+        em.referee = UserRead.model_validate(m.referee)
+    return em
+
+
+def _seed(session: Session, n_matches: int) -> dict:
+    competition = Competition(name=f"bench-serializer-{time.time_ns()}")
+    session.add(competition)
+    session.flush()
+    tournament = Tournament(name=competition.name, year=datetime.now().year, competition_id=competition.id)
+    session.add(tournament)
+    session.flush()
+    teams = [Team(name=f"Bench Team {i + 1}", tournament_id=tournament.id) for i in range(2)]
+    session.add_all(teams)
+    referee = User(email=f"bench-{time.time_ns()}@localhost", full_name="Benchmark", role=UserRole.REFEREE)
+    session.add(referee)
+    session.flush()
+    players = [
+        Player(name=f"Bench {t + 1}-{n + 1}", team_id=team.id, jersey_number=n + 1, position="mf")
+        for t, team in enumerate(teams) for n in range(PLAYERS_PER_TEAM)
+    ]
+    session.add_all(players)
+    session.flush()
+
+    start = datetime.now()
+    for i in range(n_matches):
+        match = Match(
+            tournament_id=tournament.id,
+            team_a_id=teams[0].id,
+            team_b_id=teams[1].id,
+            start_time=start + timedelta(hours=i),
+            referee_id=referee.id,
+        )
+        session.add(match)
+        session.flush()
+        session.exec(insert(Lineup), params=[
+            dict(match_id=match.id, team_id=p.team_id, player_id=p.id, is_starting=True) for p in players
+        ])
+        home, away = players[:PLAYERS_PER_TEAM], players[PLAYERS_PER_TEAM:]
+        session.add_all([
+            Goal(match_id=match.id, team_id=teams[0].id, player_id=home[9].id, assistant_id=home[7].id, minute=23),
+            Goal(match_id=match.id, team_id=teams[1].id, player_id=away[10].id, minute=67),
+            Card(match_id=match.id, team_id=teams[1].id, player_id=away[4].id, minute=41, type="yellow"),
+            Substitution(match_id=match.id, team_id=teams[0].id, player_in_id=home[10].id, player_out_id=home[8].id, minute=70),
+        ])
+    session.commit()
+    return {"competition_id": competition.id, "tournament_id": tournament.id, "referee_id": referee.id}
+
+
+def _cleanup(session: Session, ids: dict) -> None:
+    match_ids = select(Match.id).where(Match.tournament_id == ids["tournament_id"])
+    for model in (Lineup, Goal, Card, Substitution):
+        session.exec(delete(model).where(model.match_id.in_(match_ids)))
+    team_ids = select(Team.id).where(Team.tournament_id == ids["tournament_id"])
+    session.exec(delete(Match).where(Match.tournament_id == ids["tournament_id"]))
+    session.exec(delete(Player).where(Player.team_id.in_(team_ids)))
+    session.exec(delete(Team).where(Team.tournament_id == ids["tournament_id"]))
+    session.exec(delete(Tournament).where(Tournament.id == ids["tournament_id"]))
+    session.exec(delete(Competition).where(Competition.id == ids["competition_id"]))
+    session.exec(delete(User).where(User.id == ids["referee_id"]))
+    session.commit()
+
+
+def _response_field():
+    """The response_model field read_matches had before it returned pre-serialized bytes."""
+    return create_model_field(name="Response_read_matches", type_=List[EnrichedMatchRead], mode="serialization")
+
+
+def _legacy(matches: list[Match], field) -> bytes:
+    content = [_legacy_enrich(m) for m in matches]
+    serialized = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(serialized).body
+
+
+def _time(fn, repeat: int) -> float:
+    fn()  # warm up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EnrichedMatchRead serialization")
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    field = _response_field()
+    with Session(engine) as session:
+        ids = _seed(session, args.matches)
+        try:
+            query = (
+                select(Match)
+                .where(Match.tournament_id == ids["tournament_id"])
+                .options(*_match_load_options())
+            )
+            matches = session.exec(query).all()
+            results = {
+                "legacy": (_time(lambda: _legacy(matches, field), args.repeat), len(_legacy(matches, field))),
+                "single-pass": (_time(lambda: _serialize_matches(matches), args.repeat), len(_serialize_matches(matches))),
+                "normalized": (_time(lambda: _serialize_normalized(matches), args.repeat), len(_serialize_normalized(matches))),
+            }
+        finally:
+            session.rollback()
+            _cleanup(session, ids)
+
+    n = len(matches)
+    print(f"{'serializer':>12} {'per match us':>13} {'total ms':>9} {'KiB':>8}")
+    for name, (elapsed, size) in results.items():
+        print(f"{name:>12} {elapsed / n * 1e6:>13.1f} {elapsed * 1000:>9.1f} {size / 1024:>8.1f}")
+    print(f"over {n} matches")
+
+
+if __name__ == "__main__":
+    main()